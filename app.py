@@ -1,11 +1,27 @@
 import streamlit as st
-import pandas as pd
+import json
 import os
-from src.visualizer.ticket_distribution import ticket_distribution
-from src.visualizer.developer_performance import developer_performance
-from src.visualizer.ticket_linkage import ticket_linkage
-from src.visualizer.fix_versions_kpi import fix_versions_kpi
-from src.visualizer.comment_stats import comment_stats
+from dotenv import load_dotenv
+from src.analyzer.chunked_aggregator import load_aggregates
+from src.analyzer.filter_index import FilterIndex, make_filter_key
+from src.analyzer.loader import SOURCE_COLUMN, frame_from_rows, load_csv_files
+from src.analyzer.search_index import SearchIndex
+from src.server.client import SyncClient
+from src.visualizer.aggregate_report import aggregate_report
+from src.visualizer.profiler import RenderProfiler, profiler_panel
+from src.visualizer.report import REPORT_SECTIONS
+from src.visualizer.snapshot import has_snapshot, load_snapshot
+
+# CSVs above this size default to the chunked, low-memory aggregates
+LARGE_CSV_BYTES = 200 * 1024 * 1024
+
+load_dotenv()
+
+# URL of a running `cli.py serve` daemon, enables the live data toggle
+SERVE_URL = os.getenv("JIRA_SERVE_URL")
+
+# Project whose cached issues back the search box
+PROJECT_KEY = os.getenv("PROJECT_KEY")
 
 st.set_page_config(layout="wide", page_title="Company Jira Report")
 
@@ -15,22 +31,173 @@ csv_files = sorted(
     [f for f in os.listdir("csv_data") if f.endswith(".csv")], reverse=True
 )
 
+
+# Each index holds whole CSVs, indexes of replaced files are let go
+@st.cache_resource(max_entries=4)
+def load_filter_index(file_names, file_mtimes):
+    data = load_csv_files([f"csv_data/{file_name}" for file_name in file_names])
+    return FilterIndex(data)
+
+
+@st.cache_resource(ttl=60)
+def load_live_index(serve_url):
+    rows = SyncClient(serve_url).get_rows("created", "year")
+    return FilterIndex(frame_from_rows(rows, "live"))
+
+
+@st.cache_resource(ttl=300)
+def load_search_index(project_key):
+    custom_fields = {}
+    if os.path.exists("config/jira_custom_fields.json"):
+        with open("config/jira_custom_fields.json", "r") as f:
+            custom_fields = json.load(f)
+    search_index = SearchIndex(project_key, custom_fields)
+    search_index.refresh()
+    return search_index
+
+
+@st.cache_resource
+def load_report_snapshot(file_name, file_mtime):
+    return load_snapshot(f"csv_data/{file_name}")
+
+
+@st.cache_data
+def load_csv_aggregates(file_name, file_mtime):
+    return load_aggregates(f"csv_data/{file_name}")
+
+
+profiler = RenderProfiler(
+    enabled=st.sidebar.toggle(
+        "Debug: profile render",
+        help="Time the load, compute, figure and render stages of each section",
+    )
+)
+
+if PROJECT_KEY:
+    search_text = st.sidebar.text_input(
+        "Search tickets",
+        help="Full-text search of summaries, descriptions, comments and resolution details",
+    )
+    if search_text.strip():
+        with profiler.stage("search", "load"):
+            results = load_search_index(PROJECT_KEY).search(search_text, limit=50)
+        with st.expander(f"Search results for “{search_text}”", expanded=True):
+            if results:
+                st.dataframe(results, hide_index=True, use_container_width=True)
+            else:
+                st.info("No matching tickets.")
+
 col1, col2, col3, col4, col5 = st.columns(5)
-with col1:
-    selected_file = st.selectbox("Select data file:", csv_files, index=0)
+live = False
+if SERVE_URL:
+    with col4:
+        live = st.toggle(
+            "Live data",
+            help="Query this year's issues from the running `cli.py serve` daemon",
+        )
 
-with open(f"csv_data/{selected_file}", "r") as file:
-    data = pd.read_csv(file)
+if live:
+    with profiler.stage("data", "load"):
+        index = load_live_index(SERVE_URL)
+else:
+    with col1:
+        selected_files = st.multiselect(
+            "Select data files:", csv_files, default=csv_files[:1]
+        )
 
+    if not selected_files:
+        st.warning("Select at least one data file.")
+        st.stop()
 
-data["Created"] = pd.to_datetime(data["Created"], utc=True)
+    with col2:
+        selected_paths = [f"csv_data/{file_name}" for file_name in selected_files]
+        low_memory = st.toggle(
+            "Low-memory mode",
+            value=any(os.path.getsize(path) > LARGE_CSV_BYTES for path in selected_paths),
+            help="Render from chunked aggregates without loading the full CSV",
+        )
+
+    if low_memory:
+        tabs = st.tabs(selected_files) if len(selected_files) > 1 else [st.container()]
+        for tab, file_name, path in zip(tabs, selected_files, selected_paths):
+            with tab:
+                with profiler.stage(file_name, "load"):
+                    aggregates = load_csv_aggregates(file_name, os.path.getmtime(path))
+                with profiler.stage(file_name, "render"):
+                    aggregate_report(aggregates, file_name)
+        profiler_panel(profiler)
+        st.stop()
+
+    if len(selected_files) == 1 and has_snapshot(selected_paths[0]):
+        with col3:
+            use_snapshot = st.toggle(
+                "Serve from snapshot",
+                value=True,
+                help="Render the precomputed report-snapshot bundle. Turn off to filter.",
+            )
+        if use_snapshot:
+            with profiler.stage("snapshot", "load"):
+                snapshot = load_report_snapshot(
+                    selected_files[0], os.path.getmtime(selected_paths[0])
+                )
+            for section in REPORT_SECTIONS:
+                with profiler.stage(section.name, "render"):
+                    section.render(*snapshot[section.name], "report")
+            profiler_panel(profiler)
+            st.stop()
+
+    with profiler.stage("data", "load"):
+        file_names = tuple(sorted(selected_files))
+        index = load_filter_index(
+            file_names,
+            tuple(os.path.getmtime(f"csv_data/{file_name}") for file_name in file_names),
+        )
+
+st.sidebar.header("Filters")
+date_range = None
+min_date, max_date = index.date_bounds()
+if min_date:
+    selected_dates = st.sidebar.date_input(
+        "Created between",
+        value=(min_date, max_date),
+        min_value=min_date,
+        max_value=max_date,
+    )
+    # The widget returns a single date while the user is still picking a range
+    if len(selected_dates) == 2 and tuple(selected_dates) != (min_date, max_date):
+        date_range = tuple(selected_dates)
+
+filter_key = make_filter_key(
+    date_range=date_range,
+    assignees=st.sidebar.multiselect("Assignee", index.options("Assignee")),
+    issue_types=st.sidebar.multiselect("Issue Type", index.options("Issue Type")),
+    fix_versions=st.sidebar.multiselect("Fix Version", index.options("Fix Version")),
+)
 
-ticket_distribution(data)
+with profiler.stage("data", "filter"):
+    data = index.frame(filter_key)
+st.sidebar.caption(f"Showing {len(data)} of {len(index.data)} tickets")
 
-developer_performance(data)
+if data.empty:
+    st.warning("No tickets match the selected filters.")
+    profiler_panel(profiler)
+    st.stop()
 
-ticket_linkage(data)
+comparing = data[SOURCE_COLUMN].nunique() > 1
 
-fix_versions_kpi(data)
+for section in REPORT_SECTIONS:
+    with profiler.stage(section.name, "compute"):
+        aggregates = index.aggregate(filter_key, section.name, section.compute)
+    with profiler.stage(section.name, "figure"):
+        figures = index.aggregate(
+            filter_key,
+            f"{section.name}_figures",
+            lambda _: section.figures(aggregates),
+        )
+    with profiler.stage(section.name, "render"):
+        section.render(aggregates, figures, "report")
+    if comparing and section.comparison:
+        with profiler.stage(section.name, "comparison"):
+            section.comparison(data)
 
-comment_stats(data)
\ No newline at end of file
+profiler_panel(profiler)
@@ -2,15 +2,55 @@
 
 import argparse
 import os
-from dotenv import load_dotenv
-from src.scraper.requester import JiraRequester
-from halo import Halo
-from src.scraper.printer import JiraPrinter
-from src.analyzer.converter import convert_issue_to_csv
+import sys
+import time
+
+# Heavy modules (requests, halo, rich, pandas, plotly) are imported inside the
+# commands that use them so `--help` and light commands start fast. Keep it that
+# way and check with scripts/check_import_time.py.
+
+
+# Kept in sync with src.scraper.printer.OUTPUT_FORMATS, duplicated to avoid the import
+OUTPUT_FORMATS = ["text", "ndjson", "json"]
+
+
+def halo_spinner(text, stream=None):
+    """Create a dots spinner, importing halo on first use"""
+    from halo import Halo
+
+    return Halo(text=text, spinner="dots", stream=stream or sys.stdout)
+
+
+def read_project_keys(args, default):
+    """Project keys from --project and --projects-file, the default key otherwise"""
+    keys = list(getattr(args, "project", None) or [])
+    if getattr(args, "projects_file", None):
+        with open(args.projects_file, "r") as f:
+            for line in f:
+                line = line.split("#", 1)[0].strip()
+                if line:
+                    keys.append(line)
+    return keys or ([default] if default else [])
 
 
 def main():
     parser = argparse.ArgumentParser(description="Fetch Jira project information")
+    parser.add_argument(
+        "--verbose",
+        action="store_true",
+        help="Log rate limiting and page sizing decisions to stderr",
+    )
+    parser.add_argument(
+        "--metrics-out",
+        type=str,
+        help="Write request, cache and timing metrics of the run to this JSON file",
+    )
+    parser.add_argument(
+        "--metrics-prometheus",
+        type=str,
+        help="Also write the metrics in Prometheus text format, e.g. for the "
+        "node exporter's textfile collector (a .prom file)",
+    )
     subparsers = parser.add_subparsers(dest="command", help="Available commands")
 
     # Command: workflow-columns
@@ -19,6 +59,12 @@ def main():
     # Command: project-details
     subparsers.add_parser("project-details", help="Show project details")
 
+    # Command: refresh-metadata
+    subparsers.add_parser(
+        "refresh-metadata",
+        help="Revalidate the cached custom fields, project details and board configuration",
+    )
+
     # Command: issues
     issues_parser = subparsers.add_parser("issues", help="Fetch project issues")
     issues_parser.add_argument(
@@ -37,8 +83,39 @@ def main():
         "2024-01-01 2024-01-31 (date range),\n"
         "all (all issues)",
     )
+    issues_parser.add_argument(
+        "--project",
+        type=str,
+        nargs="+",
+        help="Project key(s) to fetch instead of PROJECT_KEY, fetched concurrently",
+    )
+    issues_parser.add_argument(
+        "--projects-file",
+        type=str,
+        help="File with one project key per line, # starts a comment",
+    )
     issues_parser.add_argument("--silent", action="store_true", help="Silent mode")
     issues_parser.add_argument("--skip-cache", action="store_true", help="Skip cache")
+    resume_group = issues_parser.add_mutually_exclusive_group()
+    resume_group.add_argument(
+        "--resume",
+        dest="resume",
+        action="store_true",
+        default=True,
+        help="Continue an interrupted fetch of the same query where it stopped (default)",
+    )
+    resume_group.add_argument(
+        "--restart",
+        dest="resume",
+        action="store_false",
+        help="Ignore the progress of an interrupted fetch and start over",
+    )
+    issues_parser.add_argument(
+        "--format",
+        choices=OUTPUT_FORMATS,
+        default="text",
+        help="Output format, ndjson streams one compact object per issue",
+    )
     
     # Command: eod
     eod_parser = subparsers.add_parser(
@@ -61,6 +138,17 @@ def main():
     eod_parser.add_argument(
         "--assignee", type=str, nargs="+", help="Filter by assignee(s)"
     )
+    eod_parser.add_argument(
+        "--team",
+        action="store_true",
+        help="Report for every member listed in the TEAM_MEMBERS environment variable",
+    )
+    eod_parser.add_argument(
+        "--format",
+        choices=OUTPUT_FORMATS,
+        default="text",
+        help="Output format, ndjson streams one compact object per issue",
+    )
 
     # Command: convert issues to csv
     convert_parser = subparsers.add_parser(
@@ -68,8 +156,176 @@ def main():
     )
     convert_parser.add_argument("--year", type=str, help="Year to convert")
 
+    # Command: query
+    query_parser = subparsers.add_parser(
+        "query",
+        help="Run a JQL query against the local issue cache, without network access. "
+        "Supports project, status, assignee, priority, issuetype, key, created "
+        "and updated with =, !=, IN, NOT IN, IS EMPTY, date comparisons, AND, "
+        "OR, NOT and ORDER BY",
+    )
+    query_parser.add_argument(
+        "jql",
+        type=str,
+        help='Query, e.g. \'status IN ("In Progress", Review) AND created >= -2w ORDER BY updated DESC\'',
+    )
+    query_parser.add_argument("--limit", type=int, help="Maximum number of issues to show")
+    query_parser.add_argument(
+        "--format",
+        choices=OUTPUT_FORMATS,
+        default="text",
+        help="Output format, ndjson streams one compact object per issue",
+    )
+
+    # Command: search
+    search_parser = subparsers.add_parser(
+        "search",
+        help="Full-text search of summaries, descriptions, comments and "
+        "resolution details in the local issue cache, ranked by relevance",
+    )
+    search_parser.add_argument("text", type=str, help='Words to look for, e.g. "payment timeout"')
+    search_parser.add_argument(
+        "--limit", type=int, default=20, help="Maximum number of issues to show"
+    )
+    search_parser.add_argument(
+        "--format",
+        choices=OUTPUT_FORMATS,
+        default="text",
+        help="Output format, ndjson streams one compact object per issue",
+    )
+
+    # Command: links
+    links_parser = subparsers.add_parser(
+        "links",
+        help="Show the transitive blockers, children and linked cluster of "
+        "issues from the local issue cache",
+    )
+    links_parser.add_argument("keys", nargs="+", help="Issue keys, e.g. PROJ-123")
+    links_parser.add_argument(
+        "--format",
+        choices=OUTPUT_FORMATS,
+        default="text",
+        help="Output format, ndjson streams one compact object per issue",
+    )
+
+    # Command: sprints
+    sprints_parser = subparsers.add_parser(
+        "sprints",
+        help="Committed vs completed points, carry-over and velocity per sprint "
+        "from the local issue cache",
+    )
+    sprints_parser.add_argument(
+        "--last", type=int, help="Only show the last N sprints"
+    )
+    sprints_parser.add_argument(
+        "--rebuild",
+        action="store_true",
+        help="Recompute closed sprints instead of reusing their stored stats",
+    )
+    sprints_parser.add_argument(
+        "--format",
+        choices=OUTPUT_FORMATS,
+        default="text",
+        help="Output format, ndjson streams one compact object per sprint",
+    )
+
+    # Command: serve
+    serve_parser = subparsers.add_parser(
+        "serve",
+        help="Keep the issue cache warm in memory, poll Jira for updates and "
+        "answer queries over a local HTTP/JSON API. Set JIRA_SERVE_URL to make "
+        "issues, eod and the dashboard use it",
+    )
+    serve_parser.add_argument("--host", type=str, default="127.0.0.1", help="Host to bind")
+    serve_parser.add_argument("--port", type=int, default=8765, help="Port to bind")
+    serve_parser.add_argument(
+        "--interval", type=int, default=300, help="Seconds between two polls of Jira"
+    )
+
+    # Command: aggregate a large csv in chunks
+    aggregate_parser = subparsers.add_parser(
+        "csv-aggregates",
+        help="Precompute dashboard aggregates of a csv without loading it in memory",
+    )
+    aggregate_parser.add_argument(
+        "--year", type=str, help="Year to aggregate, defaults to every csv"
+    )
+    aggregate_parser.add_argument(
+        "--chunk-size",
+        type=int,
+        help="Number of rows parsed per chunk (default: 50000)",
+    )
+
+    # Command: build the report snapshot
+    snapshot_parser = subparsers.add_parser(
+        "report-snapshot",
+        help="Precompute the dashboard report so app.py only has to load it",
+    )
+    snapshot_parser.add_argument(
+        "--year", type=str, help="Year to snapshot, defaults to every csv"
+    )
+    snapshot_parser.add_argument(
+        "--html", action="store_true", help="Also write figures as HTML pages"
+    )
+
     args = parser.parse_args()
 
+    import logging
+
+    logging.basicConfig(
+        level=logging.INFO if args.verbose else logging.WARNING,
+        format="%(levelname)s %(name)s: %(message)s",
+        stream=sys.stderr,
+    )
+
+    # Commands that only work on local files don't need Jira credentials
+    if args.command == "csv-aggregates":
+        from src.analyzer.chunked_aggregator import (
+            DEFAULT_CHUNK_SIZE,
+            aggregate_csv_in_chunks,
+            save_aggregates,
+        )
+
+        if args.year:
+            csv_files = [os.path.join("csv_data", f"issues_{args.year}.csv")]
+        else:
+            csv_files = sorted(
+                os.path.join("csv_data", f)
+                for f in os.listdir("csv_data")
+                if f.endswith(".csv")
+            )
+        for csv_file in csv_files:
+            with halo_spinner(f"Aggregating {csv_file}...") as spinner:
+                aggregates = aggregate_csv_in_chunks(
+                    csv_file, args.chunk_size or DEFAULT_CHUNK_SIZE
+                )
+                output_path = save_aggregates(csv_file, aggregates)
+                spinner.succeed(
+                    f"Aggregated {aggregates['rows']} tickets into {output_path}"
+                )
+        return
+
+    if args.command == "report-snapshot":
+        from src.visualizer.snapshot import build_snapshot
+
+        if args.year:
+            csv_files = [os.path.join("csv_data", f"issues_{args.year}.csv")]
+        else:
+            csv_files = sorted(
+                os.path.join("csv_data", f)
+                for f in os.listdir("csv_data")
+                if f.endswith(".csv")
+            )
+        for csv_file in csv_files:
+            with halo_spinner(f"Building snapshot of {csv_file}...") as spinner:
+                bundle_dir = build_snapshot(csv_file, html=args.html)
+                spinner.succeed(f"Snapshot written to {bundle_dir}")
+        return
+
+    from dotenv import load_dotenv
+    from src.scraper.requester import JiraRequester
+    from src.scraper.printer import JiraPrinter
+
     # Load environment variables and validate
     load_dotenv()
 
@@ -79,14 +335,120 @@ def main():
     API_TOKEN = os.getenv("API_TOKEN")
     PROJECT_KEY = os.getenv("PROJECT_KEY")
 
+    # Offline commands only read the local cache and need no credentials
+    if args.command == "query":
+        from src.analyzer.query import run_query
+
+        if not PROJECT_KEY:
+            raise ValueError("Please set the PROJECT_KEY environment variable")
+
+        issues, total_available = run_query(PROJECT_KEY, args.jql, args.limit)
+        custom_fields = JiraRequester(
+            BASE_URL, USERNAME, API_TOKEN
+        ).load_custom_field_mappings()
+        if args.format == "text":
+            JiraPrinter().print_issues(
+                issues, total_available, args.jql, custom_fields
+            )
+        else:
+            JiraPrinter().write_issues(issues, custom_fields, args.format)
+        return
+
+    if args.command == "links":
+        from src.analyzer.link_graph import (
+            LinkGraph,
+            epic_link_field_id,
+            issue_edges,
+            issue_link_report,
+        )
+        from src.scraper.issue_cache import iter_cached_issues
+
+        if not PROJECT_KEY:
+            raise ValueError("Please set the PROJECT_KEY environment variable")
+
+        epic_link_field = epic_link_field_id(
+            JiraRequester(BASE_URL, USERNAME, API_TOKEN).load_custom_field_mappings()
+        )
+        graph = LinkGraph(
+            edge
+            for issue in iter_cached_issues(PROJECT_KEY)
+            for edge in issue_edges(issue, epic_link_field)
+        )
+        reports = [issue_link_report(graph, key) for key in args.keys]
+        if args.format == "text":
+            for report in reports:
+                JiraPrinter().print_issue_links(report)
+        else:
+            JiraPrinter().write_records(reports, args.format)
+        return
+
+    if args.command == "sprints":
+        from src.analyzer.sprints import (
+            issues_to_sprint_frame,
+            load_sprint_cache,
+            save_sprint_cache,
+            sprint_membership,
+            sprint_stats,
+            stats_to_records,
+        )
+        from src.scraper.issue_cache import issues_dir, iter_cached_issues
+        from src.visualizer.developer_performance import COMPLETED_STATUSES
+
+        if not PROJECT_KEY:
+            raise ValueError("Please set the PROJECT_KEY environment variable")
+
+        custom_fields = JiraRequester(
+            BASE_URL, USERNAME, API_TOKEN
+        ).load_custom_field_mappings()
+        cache_path = issues_dir(PROJECT_KEY) / "sprint_stats.json"
+        cached = {} if args.rebuild else load_sprint_cache(cache_path)
+        membership = sprint_membership(
+            issues_to_sprint_frame(iter_cached_issues(PROJECT_KEY), custom_fields)
+        )
+        stats = sprint_stats(membership, COMPLETED_STATUSES, cached)
+        if len(stats):
+            save_sprint_cache(cache_path, stats)
+
+        records = stats_to_records(stats)
+        if args.last:
+            records = records[-args.last :]
+        if args.format == "text":
+            JiraPrinter().print_sprint_stats(records)
+        else:
+            JiraPrinter().write_records(records, args.format)
+        return
+
+    if args.command == "search":
+        from src.analyzer.search_index import SearchIndex
+
+        if not PROJECT_KEY:
+            raise ValueError("Please set the PROJECT_KEY environment variable")
+
+        custom_fields = JiraRequester(
+            BASE_URL, USERNAME, API_TOKEN
+        ).load_custom_field_mappings()
+        search_index = SearchIndex(PROJECT_KEY, custom_fields)
+        status_stream = sys.stdout if args.format == "text" else sys.stderr
+        with halo_spinner("Updating search index...", status_stream) as spinner:
+            indexed = search_index.refresh()
+            spinner.succeed(f"Search index up to date ({indexed} issues indexed)")
+
+        results = search_index.search(args.text, args.limit)
+        if args.format == "text":
+            JiraPrinter().print_search_results(results)
+        else:
+            JiraPrinter().write_records(results, args.format)
+        return
+
     # Validate environment variables
-    if not all([BASE_URL, USERNAME, API_TOKEN, PROJECT_KEY]):
+    project_keys = read_project_keys(args, PROJECT_KEY)
+    if not all([BASE_URL, USERNAME, API_TOKEN, project_keys]):
         raise ValueError(
             "Please set all required environment variables:\n"
             "- BASE_URL\n"
             "- USERNAME\n"
             "- API_TOKEN\n"
-            "- PROJECT_KEY"
+            "- PROJECT_KEY (or --project / --projects-file for issues)"
         )
 
     # Initialize jiraRequester
@@ -95,61 +457,168 @@ def main():
     # Initialize printer
     printer = JiraPrinter()
 
+    # Answer from a running `serve` daemon instead of Jira when one is configured
+    syncClient = None
+    if os.getenv("JIRA_SERVE_URL") and args.command in ("issues", "eod"):
+        from src.server.client import SyncClient
+
+        syncClient = SyncClient(os.getenv("JIRA_SERVE_URL"))
+
     # Handle different commands
-    if args.command == "workflow-columns":
-        with Halo(text="Fetching workflow columns...", spinner="dots") as spinner:
-            board_config = jiraRequester.get_board_configuration(PROJECT_KEY)
-            spinner.succeed("Workflow columns fetched successfully")
-        printer.print_workflow_columns(board_config)
-
-    elif args.command == "project-details":
-        with Halo(text="Fetching project details...", spinner="dots") as spinner:
-            project_details = jiraRequester.get_project_details(PROJECT_KEY)
-            spinner.succeed("Project details fetched successfully")
-        printer.print_project_details(project_details)
-
-    elif args.command == "issues":
-        timeframe = {}
-        if args.created:
-            timeframe["created"] = (
-                args.created[0] if len(args.created) == 1 else args.created
-            )
+    try:
+        if args.command == "workflow-columns":
+            with halo_spinner("Fetching workflow columns...") as spinner:
+                board_config = jiraRequester.get_board_configuration(PROJECT_KEY)
+                spinner.succeed("Workflow columns fetched successfully")
+            printer.print_workflow_columns(board_config)
 
-        if not timeframe:
-            timeframe = {"created": "today"}  # Default behavior
+        elif args.command == "project-details":
+            with halo_spinner("Fetching project details...") as spinner:
+                project_details = jiraRequester.get_project_details(PROJECT_KEY)
+                spinner.succeed("Project details fetched successfully")
+            printer.print_project_details(project_details)
 
-        with Halo(text="Fetching issues...", spinner="dots") as spinner:
-            issues, total_available = jiraRequester.get_project_issues(
-                PROJECT_KEY, timeframe, args.assignee, skip_cache=args.skip_cache
-            )
-            spinner.succeed(f"Successfully fetched {len(issues)} issues")
+        elif args.command == "refresh-metadata":
+            with halo_spinner("Refreshing metadata...") as spinner:
+                changed = jiraRequester.refresh_metadata(PROJECT_KEY)
+                spinner.succeed("Metadata refreshed")
+            for resource, was_changed in changed.items():
+                print(f"{resource}: {'updated' if was_changed else 'unchanged'}")
+
+        elif args.command == "issues":
+            timeframe = {}
+            if args.created:
+                timeframe["created"] = (
+                    args.created[0] if len(args.created) == 1 else args.created
+                )
+
+            if not timeframe:
+                timeframe = {"created": "today"}  # Default behavior
+
+            # Keep stdout clean for machine readable output
+            status_stream = sys.stdout if args.format == "text" else sys.stderr
+            if len(project_keys) > 1:
+                with halo_spinner(
+                    f"Fetching issues of {len(project_keys)} projects...", status_stream
+                ) as spinner:
+                    started = time.monotonic()
+                    results = jiraRequester.sync_projects(
+                        project_keys,
+                        timeframe,
+                        args.assignee,
+                        skip_cache=args.skip_cache,
+                        resume=args.resume,
+                    )
+                    wall_seconds = time.monotonic() - started
+                    spinner.succeed(
+                        f"Successfully fetched {sum(len(r['issues']) for r in results.values())} "
+                        f"issues in {wall_seconds:.1f}s"
+                    )
+
+                if not args.silent:
+                    custom_fields = jiraRequester.load_custom_field_mappings()
+                    if args.format == "text":
+                        for result in results.values():
+                            printer.print_issues(
+                                result["issues"], result["total"], timeframe, custom_fields
+                            )
+                    else:
+                        printer.write_issues(
+                            (issue for r in results.values() for issue in r["issues"]),
+                            custom_fields,
+                            args.format,
+                        )
+                printer.print_sync_summary(results, wall_seconds, status_stream)
+                return
+
+            with halo_spinner("Fetching issues...", status_stream) as spinner:
+                if syncClient and not args.skip_cache:
+                    issues, total_available = syncClient.get_project_issues(
+                        timeframe, args.assignee
+                    )
+                else:
+                    issues, total_available = jiraRequester.get_project_issues(
+                        project_keys[0],
+                        timeframe,
+                        args.assignee,
+                        skip_cache=args.skip_cache,
+                        resume=args.resume,
+                    )
+                spinner.succeed(f"Successfully fetched {len(issues)} issues")
+
+            if not args.silent:
+                custom_fields = jiraRequester.load_custom_field_mappings()
+                if args.format == "text":
+                    printer.print_issues(
+                        issues,
+                        total_available,
+                        timeframe,
+                        custom_fields,
+                    )
+                else:
+                    printer.write_issues(issues, custom_fields, args.format)
+        elif args.command == "eod":
+            timeframe = args.timeframe if args.timeframe else ["yesterday"]
+            timeframe = timeframe[0] if len(timeframe) == 1 else timeframe
+            if args.team:
+                team_members = os.getenv("TEAM_MEMBERS", "")
+                assignees = [m.strip() for m in team_members.split(",") if m.strip()]
+                if not assignees:
+                    raise ValueError(
+                        "Please set TEAM_MEMBERS to a comma separated list of assignees"
+                    )
+            else:
+                assignees = args.assignee if args.assignee else [USERNAME]
+            team_report = len(assignees) > 1
+
+            status_stream = sys.stdout if args.format == "text" else sys.stderr
+            with halo_spinner("Fetching issues...", status_stream) as spinner:
+                if syncClient:
+                    issues, total_available = syncClient.get_eod_issues(
+                        timeframe, assignees
+                    )
+                elif team_report:
+                    issues, total_available = jiraRequester.get_team_issues(
+                        PROJECT_KEY, timeframe, assignees
+                    )
+                else:
+                    issues, total_available = jiraRequester.get_project_issues(
+                        PROJECT_KEY,
+                        {"updated": timeframe},
+                        assignees,
+                        skip_cache=True
+                    )
+                spinner.succeed(f"Successfully fetched {len(issues)} issues")
+
+            if args.format == "text" and team_report:
+                printer.print_team_eod(issues)
+            elif args.format == "text":
+                printer.print_eod(issues)
+            else:
+                printer.write_eod(issues, args.format)
+
+        elif args.command == "issues-to-csv":
+            from src.analyzer.converter import convert_issue_to_csv
 
-        if not args.silent:
             custom_fields = jiraRequester.load_custom_field_mappings()
-            printer.print_issues(
-                issues,
-                total_available,
-                timeframe,
-                custom_fields,
-            )
-    elif args.command == "eod":
-        timeframe = args.timeframe if args.timeframe else ["yesterday"]
-        timeframe = timeframe[0] if len(timeframe) == 1 else timeframe
-        assignee = args.assignee if args.assignee else USERNAME
-        with Halo(text="Fetching issues...", spinner="dots") as spinner:
-            issues, total_available = jiraRequester.get_project_issues(
+            convert_issue_to_csv(PROJECT_KEY, args.year, custom_fields)
+
+        elif args.command == "serve":
+            from src.server.daemon import SyncDaemon
+
+            daemon = SyncDaemon(
+                jiraRequester,
                 PROJECT_KEY,
-                {"updated": timeframe},
-                [assignee],
-                skip_cache=True
+                jiraRequester.load_custom_field_mappings(),
+                poll_interval=args.interval,
             )
-            spinner.succeed(f"Successfully fetched {len(issues)} issues")
-
-        printer.print_eod(issues)
+            daemon.serve(args.host, args.port)
 
-    elif args.command == "issues-to-csv":
-        custom_fields = jiraRequester.load_custom_field_mappings()
-        convert_issue_to_csv(PROJECT_KEY, args.year, custom_fields)
+    finally:
+        if args.metrics_out:
+            jiraRequester.metrics.write_json(args.metrics_out)
+        if args.metrics_prometheus:
+            jiraRequester.metrics.write_prometheus(args.metrics_prometheus)
 
 
 if __name__ == "__main__":
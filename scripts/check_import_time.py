@@ -0,0 +1,88 @@
+#!/usr/bin/env python3
+"""
+Check the import cost of cli.py command paths against a budget
+
+Runs each scenario in a fresh interpreter with `-X importtime`, sums the
+cumulative time of the top level imports and fails when a scenario goes over
+its budget. Run from the repository root:
+
+    python3 scripts/check_import_time.py
+"""
+
+import argparse
+import subprocess
+import sys
+
+# Scenario name -> (python arguments, budget in milliseconds)
+SCENARIOS = {
+    "help": (["cli.py", "--help"], 40),
+    # Everything `cli.py eod` imports before it talks to Jira: the module itself,
+    # logging set up after parsing, the imports shared with workflow-columns and
+    # project-details, and halo for the spinner. `cli.py eod --help` would stop
+    # at argument parsing, before any of them
+    "eod": (
+        [
+            "-c",
+            "import cli, logging, dotenv, src.scraper.requester, src.scraper.printer, halo",
+        ],
+        75,
+    ),
+}
+
+
+def measure_import_time(python_args):
+    """
+    Total import time of a python invocation
+
+    :param python_args: Arguments passed to the interpreter after -X importtime
+    :return: Tuple of (total milliseconds, list of (milliseconds, module)) for top level imports
+    :raises RuntimeError: If the interpreter exits with an error
+    """
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", *python_args],
+        capture_output=True,
+        text=True,
+    )
+    if result.returncode != 0:
+        raise RuntimeError(f"python {' '.join(python_args)} failed:\n{result.stderr}")
+
+    top_level = []
+    for line in result.stderr.splitlines():
+        if not line.startswith("import time:") or "[us]" in line:
+            continue
+        _, cumulative_us, module = line[len("import time:") :].split("|")
+        # Nested imports are indented below the module that triggered them
+        if module.startswith("  "):
+            continue
+        top_level.append((int(cumulative_us) / 1000, module.strip()))
+
+    return sum(ms for ms, _ in top_level), top_level
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Check cli.py import time budgets")
+    parser.add_argument(
+        "--runs", type=int, default=5, help="Runs per scenario, the best one is kept"
+    )
+    parser.add_argument(
+        "--top", type=int, default=5, help="Number of slowest imports to show"
+    )
+    args = parser.parse_args()
+
+    failed = False
+    for name, (python_args, budget_ms) in SCENARIOS.items():
+        total_ms, top_level = min(
+            (measure_import_time(python_args) for _ in range(args.runs)),
+            key=lambda measurement: measurement[0],
+        )
+        status = "ok" if total_ms <= budget_ms else "OVER BUDGET"
+        failed = failed or total_ms > budget_ms
+        print(f"{name}: {total_ms:.1f}ms (budget {budget_ms}ms) {status}")
+        for ms, module in sorted(top_level, reverse=True)[: args.top]:
+            print(f"  {ms:8.1f}ms  {module}")
+
+    sys.exit(1 if failed else 0)
+
+
+if __name__ == "__main__":
+    main()
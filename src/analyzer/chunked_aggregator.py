@@ -0,0 +1,174 @@
+import json
+import os
+
+import pandas as pd
+
+AGGREGATES_SUFFIX = ".aggregates.json"
+DEFAULT_CHUNK_SIZE = 50_000
+
+# Bump when the aggregates change shape, older files are recomputed
+AGGREGATES_VERSION = 2
+
+# Columns needed to compute the aggregates, everything else is skipped while parsing
+AGGREGATE_COLUMNS = [
+    "Issue Key",
+    "Issue Summary",
+    "Created",
+    "Assignee",
+    "Priority",
+    "Issue Type",
+    "Status",
+    "Fix Version",
+    "Story Points",
+    "Comment count",
+    "Comments History",
+]
+
+# Kept in sync with src.visualizer.ranked_table.DEFAULT_TOP_N, duplicated to
+# avoid importing streamlit
+MOST_COMMENTED_LIMIT = 500
+MOST_COMMENTED_COLUMNS = ["Issue Key", "Issue Summary", "Comment count", "Status", "Priority"]
+
+
+def aggregates_path(csv_path):
+    """Path of the aggregates file stored next to a CSV"""
+    root, _ = os.path.splitext(csv_path)
+    return root + AGGREGATES_SUFFIX
+
+
+def aggregate_csv_in_chunks(csv_path, chunk_size=DEFAULT_CHUNK_SIZE):
+    """
+    Fold a CSV into the dashboard metrics without loading it in one go
+
+    :param csv_path: Path to an issues CSV produced by issues-to-csv
+    :param chunk_size: Number of rows parsed per chunk
+    :return: Dictionary with row, story point and comment totals, the most
+        commented tickets, value counts per day, assignee, priority, issue
+        type, status and fix version, and the missing values per column
+    """
+    header = pd.read_csv(csv_path, nrows=0).columns
+    usecols = [column for column in AGGREGATE_COLUMNS if column in header]
+
+    totals = {
+        "daily": pd.Series(dtype="int64"),
+        "assignee": pd.Series(dtype="int64"),
+        "priority": pd.Series(dtype="int64"),
+        "issue_type": pd.Series(dtype="int64"),
+        "status": pd.Series(dtype="int64"),
+        "fix_version": pd.Series(dtype="int64"),
+    }
+    missing = {"assignee": 0, "priority": 0, "issue_type": 0, "status": 0}
+    rows = 0
+    story_points = 0.0
+    comment_sum = 0
+    without_comments = 0
+    tickets_with_fix_version = 0
+    most_commented = []
+
+    for chunk in pd.read_csv(csv_path, usecols=usecols, chunksize=chunk_size):
+        rows += len(chunk)
+
+        created = pd.to_datetime(chunk["Created"], utc=True, errors="coerce")
+        _fold(totals, "daily", created.dt.strftime("%Y-%m-%d"))
+        for key, column in [
+            ("assignee", "Assignee"),
+            ("priority", "Priority"),
+            ("issue_type", "Issue Type"),
+            ("status", "Status"),
+        ]:
+            if column in chunk.columns:
+                _fold(totals, key, chunk[column])
+                missing[key] += int(chunk[column].isna().sum())
+
+        # Counted per distinct list of versions, like the Fix Version KPIs
+        if "Fix Version" in chunk.columns:
+            fix_versions = chunk["Fix Version"].dropna()
+            tickets_with_fix_version += len(fix_versions)
+            _fold(totals, "fix_version", fix_versions)
+
+        if "Story Points" in chunk.columns:
+            story_points += float(pd.to_numeric(chunk["Story Points"], errors="coerce").sum())
+
+        comment_counts = _comment_counts(chunk)
+        comment_sum += int(comment_counts.sum())
+        without_comments += int((comment_counts == 0).sum())
+
+        chunk["Comment count"] = comment_counts
+        columns = [column for column in MOST_COMMENTED_COLUMNS if column in chunk.columns]
+        most_commented.extend(
+            chunk.nlargest(MOST_COMMENTED_LIMIT, "Comment count")[columns].to_dict(orient="records")
+        )
+        # Stable, so ties keep the order of the file like DataFrame.nlargest
+        most_commented.sort(key=lambda record: record["Comment count"], reverse=True)
+        del most_commented[MOST_COMMENTED_LIMIT:]
+
+    aggregates = {
+        "version": AGGREGATES_VERSION,
+        "source": os.path.basename(csv_path),
+        "source_mtime": os.path.getmtime(csv_path),
+        "source_size": os.path.getsize(csv_path),
+        "rows": rows,
+        "story_points": story_points,
+        "comments": {
+            "total": comment_sum,
+            "tickets_without_comments": without_comments,
+            "tickets_with_comments": rows - without_comments,
+        },
+        "most_commented": most_commented,
+        "tickets_with_fix_version": tickets_with_fix_version,
+        "missing": missing,
+    }
+    for key, series in totals.items():
+        if key == "daily":
+            series = series.sort_index()
+        else:
+            series = series.sort_values(ascending=False)
+        aggregates[key] = {str(k): int(v) for k, v in series.items()}
+
+    return aggregates
+
+
+def save_aggregates(csv_path, aggregates):
+    """Write aggregates next to the CSV they were computed from"""
+    path = aggregates_path(csv_path)
+    with open(path, "w", encoding="utf-8") as f:
+        json.dump(aggregates, f, indent=2)
+    return path
+
+
+def load_aggregates(csv_path, chunk_size=DEFAULT_CHUNK_SIZE):
+    """
+    Load the persisted aggregates of a CSV, recomputing them when the CSV changed
+
+    :param csv_path: Path to an issues CSV
+    :param chunk_size: Number of rows parsed per chunk when recomputing
+    :return: Dictionary of aggregates
+    """
+    path = aggregates_path(csv_path)
+    if os.path.exists(path):
+        with open(path, "r", encoding="utf-8") as f:
+            aggregates = json.load(f)
+        if (
+            aggregates.get("version") == AGGREGATES_VERSION
+            and aggregates.get("source_mtime") == os.path.getmtime(csv_path)
+            and aggregates.get("source_size") == os.path.getsize(csv_path)
+        ):
+            return aggregates
+
+    aggregates = aggregate_csv_in_chunks(csv_path, chunk_size)
+    save_aggregates(csv_path, aggregates)
+    return aggregates
+
+
+def _fold(totals, key, values):
+    counts = values.dropna().value_counts()
+    totals[key] = totals[key].add(counts, fill_value=0).astype("int64")
+
+
+def _comment_counts(chunk):
+    """Comment count per row, falling back to the length of the comments history"""
+    if "Comment count" in chunk.columns:
+        return pd.to_numeric(chunk["Comment count"], errors="coerce").fillna(0)
+    if "Comments History" in chunk.columns:
+        return chunk["Comments History"].fillna("[]").map(lambda h: len(json.loads(h)))
+    return pd.Series(0, index=chunk.index)
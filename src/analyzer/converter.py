@@ -2,10 +2,14 @@ import json
 import csv
 import os
 from src.scraper.formatters import (
+    parse_sprints,
     format_sprint_field,
     format_development_field,
     format_resolution_field,
 )
+from src.scraper.issue_cache import issues_dir, month_issues, read_json
+from src.scraper.issue_model import Issue, as_issue
+from src.scraper.issue_store import IssueStore
 
 
 def convert_issue_to_csv(project_key, year, custom_fields):
@@ -23,6 +27,8 @@ def convert_issue_to_csv(project_key, year, custom_fields):
     - Sprint
     - Fix Version
     - Parent Ticket
+    - Linked Issues in an array of objects
+    - Sprint History in an array of objects, every sprint the issue was in
     - Severity
     - Escalation Level
     - Epic Link
@@ -38,8 +44,10 @@ def convert_issue_to_csv(project_key, year, custom_fields):
     # Prepare CSV file path
     csv_file = os.path.join(output_dir, f"issues_{year}.csv")
 
-    # Read JSON data from all month folders
-    issues_dates = {}
+    # Read JSON data from all month folders, the store holds one copy of each
+    # issue, in the month it was created
+    IssueStore(issues_dir(project_key)).migrate()
+    issues_by_key = {}
     year_dir = f"raw_data/{project_key}_issues/{year}"
 
     # Loop through all month folders
@@ -47,12 +55,26 @@ def convert_issue_to_csv(project_key, year, custom_fields):
         month_path = os.path.join(year_dir, month)
         if os.path.isdir(month_path):
             json_file = os.path.join(month_path, "issues.json")
-            if os.path.exists(json_file):
-                with open(json_file, "r") as f:
-                    month_issues = json.load(f)
-                    issues_dates.update(month_issues)
+            # Month files are replaced whole, a concurrent fetch never leaves one half written
+            # Parsed right away so only one raw month is held in memory
+            for issue in month_issues(read_json(json_file, {})):
+                issues_by_key[issue["key"]] = Issue(issue, custom_fields)
 
-    # Define CSV headers based on required fields and custom fields
+    headers = csv_headers(custom_fields)
+
+    # Write to CSV
+    with open(csv_file, "w", newline="", encoding="utf-8") as f:
+        writer = csv.DictWriter(f, fieldnames=headers)
+        writer.writeheader()
+
+        for issue in issues_by_key.values():
+            writer.writerow(issue_to_row(issue, custom_fields))
+
+    return csv_file
+
+
+def csv_headers(custom_fields):
+    """CSV headers based on required fields and custom fields"""
     default_headers = [
         "Issue Key",
         "Issue Type",
@@ -65,64 +87,59 @@ def convert_issue_to_csv(project_key, year, custom_fields):
         "Assignee",
         "Fix Version",
         "Parent Ticket",
+        "Linked Issues",
+        "Sprint History",
         "Comments History",
         "Status Change History",
     ]
 
     # Add custom field names to headers
-    headers = default_headers + [
+    return default_headers + [
         custom_fields[field]["name"]
         for field in custom_fields
         if "name" in custom_fields[field]
     ]
 
-    # Write to CSV
-    with open(csv_file, "w", newline="", encoding="utf-8") as f:
-        writer = csv.DictWriter(f, fieldnames=headers)
-        writer.writeheader()
-
-        for _, issues in issues_dates.items():
-            for issue in issues:
-                fields = issue["fields"]
-                # Prepare row data
-                row = {
-                    "Issue Key": issue.get("key"),
-                    "Issue Type": fields.get("issuetype", {}).get("name"),
-                    "Issue Summary": fields.get("summary"),
-                    "Status": fields.get("status", {}).get("name"),
-                    "Created": fields.get("created"),
-                    "Updated": fields.get("updated"),
-                    "Priority": fields.get("priority", {}).get("name")
-                    if fields.get("priority")
-                    else "",
-                    "Reporter": fields.get("reporter", {}).get("displayName")
-                    if (fields.get("reporter"))
-                    else "",
-                    "Assignee": fields.get("assignee", {}).get("displayName")
-                    if fields.get("assignee")
-                    else "",
-                    "Fix Version": ", ".join(
-                        v.get("name", "") for v in fields.get("fixVersions", [])
-                    ),
-                    "Parent Ticket": get_parent_ticket(fields),
-                    "Comments History": json.dumps(_extract_comments(fields)),
-                    "Status Change History": json.dumps(_extract_status_history(issue)),
-                }
-
-                # Add custom fields to the row
-                custom_field_values = get_custom_fields(fields, custom_fields)
-                row.update(custom_field_values)
-                writer.writerow(row)
-
-    return csv_file
-
 
-def get_parent_ticket(fields):
-    parts = [
-        fields.get("parent", {}).get("key"),
-        fields.get("parent", {}).get("fields", {}).get("summary")
-    ]
-    return " - ".join(filter(None, parts))
+def issue_to_row(issue, custom_fields):
+    """Flatten a Jira issue, raw or an Issue, into a CSV row"""
+    issue = as_issue(issue, custom_fields)
+    # Prepare row data
+    row = {
+        "Issue Key": issue.key,
+        "Issue Type": issue.issue_type,
+        "Issue Summary": issue.summary,
+        "Status": issue.status,
+        "Created": issue.created,
+        "Updated": issue.updated,
+        "Priority": issue.priority or "",
+        "Reporter": issue.reporter or "",
+        "Assignee": issue.assignee or "",
+        "Fix Version": ", ".join(issue.fix_versions),
+        "Parent Ticket": " - ".join(filter(None, [issue.parent_key, issue.parent_summary])),
+        "Linked Issues": json.dumps(
+            [
+                {"type": link_type, "direction": direction, "key": key}
+                for link_type, direction, key in issue.links
+            ]
+        ),
+        "Sprint History": json.dumps(get_sprint_history(issue.custom_fields, custom_fields)),
+        "Comments History": json.dumps(issue.comments),
+        "Status Change History": json.dumps(issue.status_changes),
+    }
+
+    # Add custom fields to the row
+    custom_field_values = get_custom_fields(issue.custom_fields, custom_fields)
+    row.update(custom_field_values)
+    return row
+
+
+def get_sprint_history(fields, custom_fields):
+    """Every sprint of the issue, read from the custom field named Sprint"""
+    for field_key, field_info in custom_fields.items():
+        if field_info.get("name") == "Sprint":
+            return parse_sprints(fields.get(field_key))
+    return []
 
 
 def get_custom_fields(fields, custom_fields):
@@ -155,35 +172,3 @@ def format_custom_field(field_value, field_name, field_type):
     elif field_type == "option" and isinstance(field_value, dict):
         return field_value.get("value", str(field_value))
     return field_value
-
-
-def _extract_comments(fields):
-    """Extract comments history"""
-    comments = fields.get("comment", {}).get("comments", [])
-    return [
-        {
-            "author": comment.get("author", {}).get("displayName"),
-            "created": comment.get("created"),
-            "body": comment.get("body"),
-        }
-        for comment in comments
-    ]
-
-
-def _extract_status_history(issue):
-    """Extract status change history"""
-    changelog = issue.get("changelog", {}).get("histories", [])
-    status_changes = []
-
-    for history in changelog:
-        for item in history.get("items", []):
-            if item.get("field") == "status":
-                status_changes.append(
-                    {
-                        "date": history.get("created"),
-                        "author": history.get("author", {}).get("displayName"),
-                        "from": item.get("fromString"),
-                        "to": item.get("toString"),
-                    }
-                )
-    return status_changes
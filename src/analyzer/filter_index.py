@@ -0,0 +1,164 @@
+import threading
+from collections import OrderedDict
+from datetime import timedelta
+
+import numpy as np
+import pandas as pd
+
+# Columns exposed as sidebar filters. "Fix Version" holds a comma separated
+# list, so a ticket is indexed under every version it ships in.
+CATEGORY_COLUMNS = ["Assignee", "Issue Type", "Fix Version"]
+MULTI_VALUE_COLUMNS = {"Fix Version"}
+
+_EMPTY = np.array([], dtype=np.int64)
+
+
+def make_filter_key(date_range=None, assignees=None, issue_types=None, fix_versions=None):
+    """
+    Build a hashable key describing a filter selection
+
+    :param date_range: Tuple of (start_date, end_date), both inclusive
+    :param assignees: Selected assignees
+    :param issue_types: Selected issue types
+    :param fix_versions: Selected fix versions
+    :return: Tuple usable as a memoization key
+    """
+    return (
+        tuple(date_range) if date_range else None,
+        tuple(sorted(assignees or [])),
+        tuple(sorted(issue_types or [])),
+        tuple(sorted(fix_versions or [])),
+    )
+
+
+class FilterIndex:
+    def __init__(self, data: pd.DataFrame, max_cached: int = 32):
+        """
+        Precompute the indexes used to filter the dashboard data
+
+        One index is shared by every dashboard session, the memoized views are
+        guarded by a lock.
+
+        :param data: Issues dataframe with a tz-aware "Created" column
+        :param max_cached: Number of filtered views, and of results of each
+            aggregate, kept in memory
+        """
+        self.data = data.reset_index(drop=True)
+        self.max_cached = max_cached
+        self._lock = threading.Lock()
+        self._frames = OrderedDict()
+        # Results by aggregate name, so sections don't evict each other
+        self._aggregates = {}
+
+        created = self.data["Created"].to_numpy(dtype="datetime64[ns]")
+        self._created_order = np.argsort(created, kind="stable")
+        self._created_sorted = created[self._created_order]
+
+        self.categories = {}
+        for column in CATEGORY_COLUMNS:
+            if column in self.data.columns:
+                self.categories[column] = self._build_category_index(column)
+
+    def _build_category_index(self, column):
+        """Map each value of a column to the sorted row positions holding it"""
+        values = self.data[column].dropna().astype(str)
+        if column in MULTI_VALUE_COLUMNS:
+            values = values.str.split(", ").explode()
+            values = values[values != ""]
+
+        positions = values.index.to_numpy(dtype=np.int64)
+        codes, uniques = pd.factorize(values.to_numpy())
+        order = np.argsort(codes, kind="stable")
+        splits = np.cumsum(np.bincount(codes, minlength=len(uniques)))[:-1]
+        groups = np.split(positions[order], splits)
+
+        return {value: np.unique(group) for value, group in zip(uniques, groups)}
+
+    def options(self, column):
+        """Sorted list of values available for a category filter"""
+        return sorted(self.categories.get(column, {}).keys())
+
+    def date_bounds(self):
+        """Earliest and latest created dates in the data"""
+        valid = self._created_sorted[~np.isnat(self._created_sorted)]
+        if not len(valid):
+            return None, None
+        return (
+            pd.Timestamp(valid[0]).date(),
+            pd.Timestamp(valid[-1]).date(),
+        )
+
+    def positions(self, key):
+        """
+        Resolve a filter key to the matching row positions
+
+        :param key: Key returned by make_filter_key
+        :return: Sorted numpy array of row positions
+        """
+        date_range, assignees, issue_types, fix_versions = key
+        result = None
+
+        if date_range:
+            start, end = date_range
+            lower = np.datetime64(pd.Timestamp(start), "ns")
+            upper = np.datetime64(pd.Timestamp(end) + timedelta(days=1), "ns")
+            lo = np.searchsorted(self._created_sorted, lower, side="left")
+            hi = np.searchsorted(self._created_sorted, upper, side="left")
+            result = np.sort(self._created_order[lo:hi])
+
+        for column, selected in zip(CATEGORY_COLUMNS, (assignees, issue_types, fix_versions)):
+            if not selected:
+                continue
+            index = self.categories.get(column, {})
+            matches = [index.get(value, _EMPTY) for value in selected]
+            matched = np.unique(np.concatenate(matches)) if matches else _EMPTY
+            if result is None:
+                result = matched
+            else:
+                result = np.intersect1d(result, matched, assume_unique=True)
+
+        if result is None:
+            return np.arange(len(self.data))
+        return result
+
+    def frame(self, key):
+        """
+        Filtered view of the data, memoized by filter key
+
+        :param key: Key returned by make_filter_key
+        :return: Filtered dataframe
+        """
+        with self._lock:
+            if key in self._frames:
+                self._frames.move_to_end(key)
+                return self._frames[key]
+
+        frame = self.data.iloc[self.positions(key)]
+        with self._lock:
+            self._remember(self._frames, key, frame)
+        return frame
+
+    def aggregate(self, key, name, func):
+        """
+        Compute an aggregate of a filtered view once per filter key
+
+        :param key: Key returned by make_filter_key
+        :param name: Name identifying the aggregate
+        :param func: Callable receiving the filtered dataframe
+        :return: Result of func
+        """
+        with self._lock:
+            cache = self._aggregates.setdefault(name, OrderedDict())
+            if key in cache:
+                cache.move_to_end(key)
+                return cache[key]
+
+        result = func(self.frame(key))
+        with self._lock:
+            self._remember(cache, key, result)
+        return result
+
+    def _remember(self, cache, key, value):
+        cache[key] = value
+        if len(cache) > self.max_cached:
+            cache.popitem(last=False)
@@ -0,0 +1,85 @@
+import threading
+from bisect import bisect_left
+from typing import Any, Dict, Iterable, List
+
+DATE_FIELDS = ["created", "updated"]
+
+
+def issue_date(issue, field):
+    """YYYY-MM-DD date of a timestamp field, the same day the cache files use"""
+    time_str = issue.get("fields", {}).get(field) or ""
+    return time_str.split("T")[0]
+
+
+class IssueIndex:
+    def __init__(self, issues: Iterable[Dict[str, Any]] = ()):
+        """
+        In-memory index of issues by key with sorted created/updated dates
+
+        Safe to query from several threads while another one upserts.
+
+        :param issues: Raw issues to index
+        """
+        self._lock = threading.RLock()
+        self.issues = {}
+        self._dates = {}
+        self._dirty = True
+        self.upsert(issues)
+
+    def __len__(self):
+        return len(self.issues)
+
+    def upsert(self, issues: Iterable[Dict[str, Any]]) -> int:
+        """
+        Insert or replace issues, keeping the copy with the latest updated timestamp
+
+        :param issues: Raw issues
+        :return: Number of issues inserted or replaced
+        """
+        changed = 0
+        with self._lock:
+            for issue in issues:
+                current = self.issues.get(issue["key"])
+                if current is not None and _updated(current) > _updated(issue):
+                    continue
+                self.issues[issue["key"]] = issue
+                changed += 1
+            if changed:
+                self._dirty = True
+        return changed
+
+    def latest_updated(self) -> str:
+        """Most recent updated timestamp in the index, empty when the index is empty"""
+        with self._lock:
+            return max((_updated(issue) for issue in self.issues.values()), default="")
+
+    def between(self, field: str, start_date: str = None, end_date: str = None) -> List[Dict[str, Any]]:
+        """
+        Issues whose date field falls in [start_date, end_date)
+
+        :param field: 'created' or 'updated'
+        :param start_date: Inclusive YYYY-MM-DD start, None for no lower bound
+        :param end_date: Exclusive YYYY-MM-DD end, None for no upper bound
+        :return: Issues sorted by the date field
+        """
+        with self._lock:
+            self._build_dates()
+            dates = self._dates[field]
+            lo = bisect_left(dates, (start_date,)) if start_date else 0
+            hi = bisect_left(dates, (end_date,)) if end_date else len(dates)
+            return [self.issues[key] for _, key in dates[lo:hi]]
+
+    def _build_dates(self):
+        if not self._dirty:
+            return
+        for field in DATE_FIELDS:
+            self._dates[field] = sorted(
+                (issue_date(issue, field), key)
+                for key, issue in self.issues.items()
+                if issue_date(issue, field)
+            )
+        self._dirty = False
+
+
+def _updated(issue):
+    return issue.get("fields", {}).get("updated") or ""
@@ -0,0 +1,285 @@
+import re
+from datetime import datetime, timedelta
+
+# Fields understood by the offline query engine, aliases map to their canonical name
+VALUE_FIELDS = {"project", "status", "assignee", "priority", "issuetype", "key"}
+DATE_FIELDS = {"created", "updated"}
+FIELD_ALIASES = {"type": "issuetype"}
+
+_TOKEN_RE = re.compile(
+    r"""
+    \s*(?:
+        (?P<string>"(?:[^"\\]|\\.)*"|'(?:[^'\\]|\\.)*')
+      | (?P<op>!=|>=|<=|=|>|<|\(|\)|,)
+      | (?P<word>[^\s"'(),=!<>]+)
+    )
+    """,
+    re.VERBOSE,
+)
+_RELATIVE_RE = re.compile(r"^([+-]?\d+)([mhdwMy])$")
+_UNITS = {"m": "minutes", "h": "hours", "d": "days", "w": "weeks"}
+
+
+class JQLError(ValueError):
+    pass
+
+
+def tokenize(jql: str):
+    """Split a JQL string into (kind, value) tokens"""
+    tokens = []
+    position = 0
+    jql = jql.strip()
+    while position < len(jql):
+        match = _TOKEN_RE.match(jql, position)
+        if not match or match.end() == position:
+            raise JQLError(f"Unexpected character at {position}: {jql[position:]}")
+        position = match.end()
+        if match.group("string"):
+            raw = match.group("string")[1:-1]
+            tokens.append(("string", re.sub(r"\\(.)", r"\1", raw)))
+        elif match.group("op"):
+            tokens.append(("op", match.group("op")))
+        elif match.group("word"):
+            tokens.append(("word", match.group("word")))
+    return tokens
+
+
+def parse(jql: str):
+    """
+    Parse a JQL subset into a condition tree and an ORDER BY list
+
+    Supported: project, status, assignee, priority, issuetype (or type), key,
+    created and updated with =, !=, IN, NOT IN, IS [NOT] EMPTY and, for dates,
+    <, <=, >, >=. Conditions combine with AND, OR, NOT and parentheses.
+
+    :param jql: JQL query
+    :return: Tuple of (condition, [(field, descending)]), condition is None for no filter
+    :raises JQLError: On syntax the engine does not support
+    """
+    parser = _Parser(tokenize(jql))
+    condition = None
+    if not parser.at_keyword("order"):
+        condition = parser.parse_or()
+    order_by = parser.parse_order_by()
+    if parser.peek():
+        raise JQLError(f"Unexpected token {parser.peek()[1]!r}")
+    return condition, order_by
+
+
+class _Parser:
+    def __init__(self, tokens):
+        self.tokens = tokens
+        self.position = 0
+
+    def peek(self):
+        if self.position < len(self.tokens):
+            return self.tokens[self.position]
+        return None
+
+    def next(self):
+        token = self.peek()
+        if token is None:
+            raise JQLError("Unexpected end of query")
+        self.position += 1
+        return token
+
+    def at_keyword(self, keyword):
+        token = self.peek()
+        return token is not None and token[0] == "word" and token[1].lower() == keyword
+
+    def at_op(self, op):
+        return self.peek() == ("op", op)
+
+    def expect_keyword(self, keyword):
+        if not self.at_keyword(keyword):
+            raise JQLError(f"Expected {keyword.upper()}")
+        self.next()
+
+    def expect_op(self, op):
+        if not self.at_op(op):
+            raise JQLError(f"Expected {op!r}")
+        self.next()
+
+    def parse_or(self):
+        terms = [self.parse_and()]
+        while self.at_keyword("or"):
+            self.next()
+            terms.append(self.parse_and())
+        return terms[0] if len(terms) == 1 else ("or", terms)
+
+    def parse_and(self):
+        terms = [self.parse_not()]
+        while self.at_keyword("and"):
+            self.next()
+            terms.append(self.parse_not())
+        return terms[0] if len(terms) == 1 else ("and", terms)
+
+    def parse_not(self):
+        if self.at_keyword("not"):
+            self.next()
+            return ("not", self.parse_not())
+        if self.at_op("("):
+            self.next()
+            condition = self.parse_or()
+            self.expect_op(")")
+            return condition
+        return self.parse_clause()
+
+    def parse_clause(self):
+        kind, field = self.next()
+        if kind == "op":
+            raise JQLError(f"Expected a field, got {field!r}")
+        field = FIELD_ALIASES.get(field.lower(), field.lower())
+        if field not in VALUE_FIELDS | DATE_FIELDS:
+            raise JQLError(f"Unsupported field {field!r}")
+
+        if self.at_keyword("is"):
+            self.next()
+            negate = self.at_keyword("not")
+            if negate:
+                self.next()
+            self.expect_keyword("empty")
+            return ("empty", field, negate)
+
+        if self.at_keyword("not") or self.at_keyword("in"):
+            negate = self.at_keyword("not")
+            if negate:
+                self.next()
+            self.expect_keyword("in")
+            values = self.parse_list(field)
+            return ("in", field, values, negate)
+
+        kind, op = self.next()
+        if kind != "op" or op not in ("=", "!=", ">", ">=", "<", "<="):
+            raise JQLError(f"Expected an operator after {field}, got {op!r}")
+        if field in VALUE_FIELDS and op not in ("=", "!="):
+            raise JQLError(f"{field} only supports =, !=, IN and NOT IN")
+
+        if self.at_keyword("empty") or self.at_keyword("null"):
+            self.next()
+            return ("empty", field, op == "!=")
+
+        value = self.parse_value(field)
+        if field in DATE_FIELDS:
+            return ("compare", field, op, value)
+        return ("in", field, [value], op == "!=")
+
+    def parse_list(self, field):
+        self.expect_op("(")
+        values = [self.parse_value(field)]
+        while self.at_op(","):
+            self.next()
+            values.append(self.parse_value(field))
+        self.expect_op(")")
+        return values
+
+    def parse_value(self, field):
+        kind, value = self.next()
+        if kind == "op":
+            raise JQLError(f"Expected a value, got {value!r}")
+
+        # Date functions such as startOfDay(-1d)
+        if kind == "word" and self.at_op("("):
+            self.next()
+            argument = None
+            if not self.at_op(")"):
+                argument = self.next()[1]
+            self.expect_op(")")
+            if field not in DATE_FIELDS:
+                raise JQLError(f"Functions are only supported on dates, not {field}")
+            return resolve_date_function(value, argument)
+
+        if field in DATE_FIELDS:
+            return parse_date(value)
+        return value
+
+    def parse_order_by(self):
+        order_by = []
+        if not self.at_keyword("order"):
+            return order_by
+        self.next()
+        self.expect_keyword("by")
+        while True:
+            kind, field = self.next()
+            field = FIELD_ALIASES.get(field.lower(), field.lower())
+            if field not in VALUE_FIELDS | DATE_FIELDS:
+                raise JQLError(f"Unsupported ORDER BY field {field!r}")
+            descending = False
+            if self.at_keyword("asc") or self.at_keyword("desc"):
+                descending = self.next()[1].lower() == "desc"
+            order_by.append((field, descending))
+            if not self.at_op(","):
+                return order_by
+            self.next()
+
+
+def parse_date(value: str) -> datetime:
+    """
+    Parse a JQL date value into a local aware datetime
+
+    :param value: 'YYYY-MM-DD', 'YYYY/MM/DD', either with ' HH:MM', or a relative
+        offset from now such as '-7d', '-2w', '-4h' or '-30m'
+    :raises JQLError: If the value is not a date
+    """
+    relative = _RELATIVE_RE.match(value)
+    if relative:
+        return _shift(datetime.now().astimezone(), int(relative.group(1)), relative.group(2))
+
+    for date_format in ("%Y-%m-%d %H:%M", "%Y/%m/%d %H:%M", "%Y-%m-%d", "%Y/%m/%d"):
+        try:
+            return datetime.strptime(value, date_format).astimezone()
+        except ValueError:
+            continue
+    raise JQLError(f"Invalid date {value!r}")
+
+
+def resolve_date_function(name: str, argument: str = None) -> datetime:
+    """
+    Evaluate now(), startOfDay(), endOfDay() and the week, month and year
+    variants, with an optional offset argument such as '-1d' or '1M'
+    """
+    now = datetime.now().astimezone()
+    offset = 0
+    unit = None
+    if argument:
+        relative = _RELATIVE_RE.match(argument)
+        if not relative:
+            raise JQLError(f"Invalid offset {argument!r} for {name}()")
+        offset, unit = int(relative.group(1)), relative.group(2)
+
+    lowered = name.lower()
+    if lowered == "now":
+        return _shift(now, offset, unit) if unit else now
+
+    match = re.match(r"^(start|end)of(day|week|month|year)$", lowered)
+    if not match:
+        raise JQLError(f"Unsupported function {name}()")
+    boundary, period = match.groups()
+    default_unit = {"day": "d", "week": "w", "month": "M", "year": "y"}[period]
+    anchor = _shift(now, offset, unit or default_unit) if offset else now
+
+    start = anchor.replace(hour=0, minute=0, second=0, microsecond=0)
+    if period == "week":
+        # Jira weeks start on Sunday
+        start -= timedelta(days=(start.weekday() + 1) % 7)
+        end = start + timedelta(days=7)
+    elif period == "month":
+        start = start.replace(day=1)
+        end = _shift(start, 1, "M")
+    elif period == "year":
+        start = start.replace(month=1, day=1)
+        end = _shift(start, 1, "y")
+    else:
+        end = start + timedelta(days=1)
+
+    return start if boundary == "start" else end - timedelta(microseconds=1)
+
+
+def _shift(moment: datetime, amount: int, unit: str) -> datetime:
+    if unit == "M":
+        month = moment.month - 1 + amount
+        year = moment.year + month // 12
+        return moment.replace(year=year, month=month % 12 + 1, day=min(moment.day, 28))
+    if unit == "y":
+        return moment.replace(year=moment.year + amount, day=min(moment.day, 28))
+    return moment + timedelta(**{_UNITS[unit]: amount})
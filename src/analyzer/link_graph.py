@@ -0,0 +1,298 @@
+import json
+from collections import deque
+
+import numpy as np
+import pandas as pd
+from src.scraper.issue_model import as_issue
+
+EPIC_LINK_FIELD_NAME = "Epic Link"
+
+# Edge kinds. A "parent" or "epic" edge points from a child to its parent, a
+# link edge points from the outward side, e.g. "A blocks B" is A -> B.
+PARENT = "parent"
+EPIC = "epic"
+BLOCKS = "blocks"
+HIERARCHY_KINDS = (PARENT, EPIC)
+
+# Jira's default link type names that don't read as a verb
+_LINK_KIND_NAMES = {"duplicate": "duplicates", "cloners": "clones"}
+
+
+def link_kind(type_name):
+    """Edge kind of a Jira link type name, e.g. 'Blocks' -> 'blocks'"""
+    name = (type_name or "").strip().lower()
+    return _LINK_KIND_NAMES.get(name, name)
+
+
+def link_edges(key, parent_key=None, epic_key=None, links=()):
+    """
+    Graph edges of one issue
+
+    :param key: Issue key
+    :param parent_key: Key of the parent issue
+    :param epic_key: Key of the epic from the Epic Link field
+    :param links: (type, direction, key) tuples of the linked issues, like Issue.links
+    :return: List of (source, target, kind) tuples
+    """
+    edges = []
+    if parent_key:
+        edges.append((key, parent_key, PARENT))
+    if epic_key and epic_key != parent_key:
+        edges.append((key, epic_key, EPIC))
+    for link_type, direction, linked_key in links:
+        if not linked_key:
+            continue
+        kind = link_kind(link_type)
+        if direction == "outward":
+            edges.append((key, linked_key, kind))
+        else:
+            edges.append((linked_key, key, kind))
+    return edges
+
+
+def issue_edges(issue, epic_link_field=None):
+    """
+    Graph edges of a cached issue
+
+    :param issue: Raw issue or Issue
+    :param epic_link_field: Custom field id of the Epic Link field
+    :return: List of (source, target, kind) tuples
+    """
+    issue = as_issue(issue, (epic_link_field,) if epic_link_field else ())
+    epic_key = issue.custom_fields.get(epic_link_field) if epic_link_field else None
+    return link_edges(
+        issue.key,
+        issue.parent_key,
+        epic_key if isinstance(epic_key, str) else None,
+        issue.links,
+    )
+
+
+def frame_edges(data):
+    """
+    Graph edges of an issues dataframe loaded from the CSV
+
+    Uses the Parent Ticket ("KEY - summary"), Epic Link and Linked Issues
+    columns, CSVs converted before Linked Issues existed only get hierarchy edges.
+
+    :param data: Issues dataframe
+    :return: List of (source, target, kind) tuples
+    """
+    def column(name, parse=lambda value: value):
+        # Blank cells are NaN and pandas 3 turns a None mapped back into NaN,
+        # so cells are read one by one and anything but a string is empty
+        if name not in data.columns:
+            return [parse(None) for _ in range(len(data))]
+        return [parse(value if isinstance(value, str) and value else None) for value in data[name]]
+
+    parents = column("Parent Ticket", lambda value: value.split(" - ")[0] if value else None)
+    linked = column(
+        "Linked Issues",
+        lambda value: [
+            (link.get("type"), link.get("direction"), link.get("key"))
+            for link in (json.loads(value) if value else [])
+        ],
+    )
+
+    edges = []
+    for key, parent_key, epic_key, links in zip(
+        data["Issue Key"], parents, column("Epic Link"), linked
+    ):
+        edges.extend(link_edges(key, parent_key, epic_key, links))
+    return edges
+
+
+def epic_link_field_id(custom_fields):
+    """Id of the Epic Link custom field, None when it is not configured"""
+    for field_id, field in (custom_fields or {}).items():
+        if field.get("name") == EPIC_LINK_FIELD_NAME:
+            return field_id
+    return None
+
+
+def issue_link_report(graph, key):
+    """
+    Blockers, dependents, rollup and cluster of one issue
+
+    :param graph: LinkGraph
+    :param key: Issue key
+    :return: JSON serializable dict
+    """
+    labels = graph.components()
+    node = graph.ids.get(key)
+    return {
+        "key": key,
+        "parent": graph.neighbors(key, HIERARCHY_KINDS),
+        "blocked_by": [
+            {"key": blocker, "distance": distance}
+            for blocker, distance in graph.blocker_chain(key)
+        ],
+        "blocks": graph.neighbors(key, [BLOCKS]),
+        "rollup": graph.epic_rollup(key),
+        "cluster_size": int((labels == labels[node]).sum()) if node is not None else 0,
+    }
+
+
+class LinkGraph:
+    def __init__(self, edges, keys=()):
+        """
+        Compact directed graph of issue links
+
+        Issue keys are mapped to integer ids and edges are stored as CSR arrays,
+        once by source and once by target, so following links in either
+        direction is a slice.
+
+        :param edges: Iterable of (source, target, kind) tuples, duplicates are dropped
+        :param keys: Extra issue keys to include even without links
+        """
+        edges = list(edges)
+        self.keys = np.array(
+            sorted(set(keys) | {edge[0] for edge in edges} | {edge[1] for edge in edges}),
+            dtype=object,
+        )
+        self.ids = {key: node for node, key in enumerate(self.keys)}
+        self.kinds = sorted({edge[2] for edge in edges})
+        kind_codes = {kind: code for code, kind in enumerate(self.kinds)}
+
+        triples = np.array(
+            [(self.ids[source], self.ids[target], kind_codes[kind]) for source, target, kind in edges],
+            dtype=np.int64,
+        ).reshape(-1, 3)
+        if len(triples):
+            triples = np.unique(triples, axis=0)
+        self.sources, self.targets, self.edge_kinds = triples.T
+
+        size = len(self.keys)
+        self._out = _csr(self.sources, self.targets, self.edge_kinds, size)
+        self._in = _csr(self.targets, self.sources, self.edge_kinds, size)
+
+    def __len__(self):
+        return len(self.keys)
+
+    def neighbors(self, key, kinds=None, reverse=False):
+        """
+        Keys linked to key
+
+        :param key: Issue key
+        :param kinds: Edge kinds to follow, all kinds when None
+        :param reverse: Follow edges towards key instead of away from it
+        :return: Linked issue keys
+        """
+        node = self.ids.get(key)
+        if node is None:
+            return []
+        return list(self.keys[self._neighbors(node, self._kind_codes(kinds), reverse)])
+
+    def blocker_chain(self, key):
+        """
+        Every issue that transitively blocks key, nearest first
+
+        :param key: Issue key
+        :return: List of (blocker key, distance) tuples
+        """
+        return self._walk(key, self._kind_codes([BLOCKS]), reverse=True)
+
+    def blocked_by_count(self):
+        """Number of issues that transitively block each blocked issue, as a Series"""
+        codes = self._kind_codes([BLOCKS])
+        blocked = np.unique(self.targets[np.isin(self.edge_kinds, codes)])
+        return pd.Series(
+            {self.keys[node]: len(self._walk_ids(node, codes, reverse=True)) for node in blocked},
+            dtype=np.int64,
+        )
+
+    def epic_rollup(self, key):
+        """
+        Every issue under an epic or parent, transitively, e.g. stories and their sub-tasks
+
+        :param key: Epic or parent issue key
+        :return: List of descendant keys
+        """
+        return [
+            descendant
+            for descendant, _ in self._walk(key, self._kind_codes(HIERARCHY_KINDS), reverse=True)
+        ]
+
+    def hierarchy_roots(self):
+        """Keys that have children but no parent or epic themselves, e.g. epics"""
+        hierarchy = np.isin(self.edge_kinds, self._kind_codes(HIERARCHY_KINDS))
+        has_children = np.bincount(self.targets[hierarchy], minlength=len(self.keys)) > 0
+        has_parent = np.bincount(self.sources[hierarchy], minlength=len(self.keys)) > 0
+        return list(self.keys[has_children & ~has_parent])
+
+    def components(self):
+        """
+        Connected components, ignoring edge direction
+
+        :return: Array of component labels, aligned with self.keys
+        """
+        # Union-find over the edge arrays, labels converge to the smallest id
+        labels = np.arange(len(self.keys))
+        while True:
+            smallest = np.minimum(labels[self.sources], labels[self.targets])
+            updated = labels.copy()
+            np.minimum.at(updated, self.sources, smallest)
+            np.minimum.at(updated, self.targets, smallest)
+            updated = updated[updated]
+            if np.array_equal(updated, labels):
+                return labels
+            labels = updated
+
+    def component_sizes(self):
+        """Size of every connected component with at least one link, largest first"""
+        _, sizes = np.unique(self.components(), return_counts=True)
+        return np.sort(sizes[sizes > 1])[::-1]
+
+    def most_depended_on(self, limit=10):
+        """
+        Issues with the most direct dependents: the issues they block and their children
+
+        :param limit: Number of issues to return
+        :return: Series of dependent counts indexed by issue key
+        """
+        blocks = np.isin(self.edge_kinds, self._kind_codes([BLOCKS]))
+        children = np.isin(self.edge_kinds, self._kind_codes(HIERARCHY_KINDS))
+        dependents = np.bincount(self.sources[blocks], minlength=len(self.keys)) + np.bincount(
+            self.targets[children], minlength=len(self.keys)
+        )
+        top = np.argsort(-dependents, kind="stable")[:limit]
+        top = top[dependents[top] > 0]
+        return pd.Series(dependents[top], index=self.keys[top], dtype=np.int64)
+
+    def _kind_codes(self, kinds):
+        if kinds is None:
+            return np.arange(len(self.kinds))
+        return np.array([self.kinds.index(kind) for kind in kinds if kind in self.kinds], dtype=np.int64)
+
+    def _neighbors(self, node, codes, reverse):
+        indptr, indices, kinds = self._in if reverse else self._out
+        start, end = indptr[node], indptr[node + 1]
+        return indices[start:end][np.isin(kinds[start:end], codes)]
+
+    def _walk(self, key, codes, reverse):
+        node = self.ids.get(key)
+        if node is None:
+            return []
+        return [(self.keys[found], distance) for found, distance in self._walk_ids(node, codes, reverse)]
+
+    def _walk_ids(self, node, codes, reverse):
+        # Breadth first, so each issue is reported at its shortest distance
+        seen = {node}
+        found = []
+        queue = deque([(node, 0)])
+        while queue:
+            current, distance = queue.popleft()
+            for neighbor in self._neighbors(current, codes, reverse):
+                if neighbor not in seen:
+                    seen.add(neighbor)
+                    found.append((neighbor, distance + 1))
+                    queue.append((neighbor, distance + 1))
+        return found
+
+
+def _csr(rows, columns, kinds, size):
+    """Sort edges by row and return (indptr, indices, kinds) arrays"""
+    order = np.argsort(rows, kind="stable")
+    indptr = np.zeros(size + 1, dtype=np.int64)
+    np.cumsum(np.bincount(rows, minlength=size), out=indptr[1:])
+    return indptr, columns[order], kinds[order]
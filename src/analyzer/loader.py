@@ -0,0 +1,78 @@
+import csv
+import io
+import os
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+
+import pandas as pd
+
+SOURCE_COLUMN = "Source"
+
+
+def source_label(csv_path):
+    """Label identifying the file a row came from, e.g. issues_2024"""
+    return os.path.splitext(os.path.basename(csv_path))[0]
+
+
+def load_csv(csv_path):
+    """
+    Load an issues CSV, reusing the parsed frame while the file is unchanged
+
+    :param csv_path: Path to an issues CSV produced by issues-to-csv
+    :return: Dataframe tagged with its source
+    """
+    return _read_csv(csv_path, os.path.getmtime(csv_path))
+
+
+def load_csv_files(csv_paths, max_workers=None):
+    """
+    Load several issues CSVs concurrently and combine them into one frame
+
+    pandas' C parser releases the GIL while tokenizing, so parsing the files on
+    threads costs about as much as parsing the largest one.
+
+    :param csv_paths: Paths to issues CSVs
+    :param max_workers: Number of parser threads, defaults to one per file
+    :return: Combined dataframe with a Source column
+    """
+    if not csv_paths:
+        return pd.DataFrame()
+
+    with ThreadPoolExecutor(max_workers=max_workers or len(csv_paths)) as executor:
+        frames = list(executor.map(load_csv, csv_paths))
+
+    if len(frames) == 1:
+        return frames[0]
+    return pd.concat(frames, ignore_index=True)
+
+
+def frame_from_rows(rows, source):
+    """
+    Build the dashboard frame from rows shaped like the issues CSV
+
+    The rows go through the CSV parser so column types match a file loaded
+    with load_csv.
+
+    :param rows: Row dicts, e.g. from the serve daemon
+    :param source: Value of the Source column
+    :return: Dataframe tagged with its source
+    """
+    buffer = io.StringIO()
+    headers = list(dict.fromkeys(key for row in rows for key in row))
+    writer = csv.DictWriter(buffer, fieldnames=headers)
+    writer.writeheader()
+    writer.writerows(rows)
+    buffer.seek(0)
+
+    data = pd.read_csv(buffer) if headers else pd.DataFrame(columns=["Created"])
+    data["Created"] = pd.to_datetime(data["Created"], utc=True)
+    data[SOURCE_COLUMN] = source
+    return data
+
+
+@lru_cache(maxsize=16)
+def _read_csv(csv_path, mtime):
+    data = pd.read_csv(csv_path)
+    data["Created"] = pd.to_datetime(data["Created"], utc=True)
+    data[SOURCE_COLUMN] = source_label(csv_path)
+    return data
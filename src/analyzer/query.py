@@ -0,0 +1,274 @@
+import json
+from bisect import bisect_left, bisect_right
+from datetime import datetime
+from typing import Any, Dict, List
+
+from src.analyzer.jql import JQLError, parse
+from src.scraper.issue_cache import issues_dir, month_issues, partition_lock, write_json_atomic
+
+INDEX_VERSION = 1
+INDEX_FILE = "query_index.json"
+VALUE_FIELDS = ["project", "status", "assignee", "priority", "issuetype", "key"]
+
+# Sorts after every issue key, so (timestamp, _MAX_KEY) bounds all issues at timestamp
+_MAX_KEY = "\uffff"
+
+
+def issue_timestamp(issue, field):
+    """Epoch seconds of a Jira timestamp field, None when it is missing"""
+    time_str = issue.get("fields", {}).get(field)
+    if not time_str:
+        return None
+    return datetime.strptime(time_str, "%Y-%m-%dT%H:%M:%S.%f%z").timestamp()
+
+
+def project_issue(issue):
+    """
+    Reduce an issue to the fields the query engine filters and sorts on
+
+    :param issue: Raw issue from the cache
+    :return: Row dict, values are lowercased for case-insensitive matching
+    """
+    fields = issue.get("fields", {})
+    assignee = fields.get("assignee") or {}
+    priority = fields.get("priority") or {}
+    return {
+        "key": issue["key"],
+        "project": (fields.get("project") or {}).get("key", issue["key"].split("-")[0]).lower(),
+        "status": ((fields.get("status") or {}).get("name") or "").lower() or None,
+        "assignee": [
+            value.lower()
+            for value in (
+                assignee.get("accountId"),
+                assignee.get("displayName"),
+                assignee.get("emailAddress"),
+            )
+            if value
+        ],
+        "assignee_name": (assignee.get("displayName") or "").lower() or None,
+        "priority": (priority.get("name") or "").lower() or None,
+        "priority_id": int(priority["id"]) if priority.get("id") else None,
+        "issuetype": ((fields.get("issuetype") or {}).get("name") or "").lower() or None,
+        "created": issue_timestamp(issue, "created"),
+        "updated": issue_timestamp(issue, "updated"),
+        "updated_raw": fields.get("updated") or "",
+    }
+
+
+class QueryIndex:
+    def __init__(self, project_key: str):
+        """
+        Persistent index over the cached issues of a project for offline JQL queries
+
+        Only the filterable fields of each issue are kept, in
+        raw_data/<KEY>_issues/query_index.json, per month file. A refresh only
+        re-reads the month files whose size or mtime changed, and a query only
+        opens the month files that hold its results.
+
+        :param project_key: Jira project key
+        """
+        self.project_key = project_key
+        self.root = issues_dir(project_key)
+        self.path = self.root / INDEX_FILE
+        self.files = {}
+        self.rows = {}
+        self._values = {}
+        self._dates = {}
+
+    def refresh(self) -> int:
+        """
+        Bring the index up to date with the cache
+
+        :return: Number of month files that were (re)indexed
+        """
+        self._load()
+        current = {
+            str(path.relative_to(self.root)): path
+            for path in sorted(self.root.glob("*/*/issues.json"))
+        }
+        changed = 0
+        for name in list(self.files):
+            if name not in current:
+                del self.files[name]
+                changed += 1
+
+        for name, path in current.items():
+            stat = path.stat()
+            signature = [stat.st_mtime, stat.st_size]
+            entry = self.files.get(name)
+            if entry is not None and entry["signature"] == signature:
+                continue
+            with open(path, "r", encoding="utf-8") as f:
+                month_data = json.load(f)
+            self.files[name] = {
+                "signature": signature,
+                "rows": [project_issue(issue) for issue in month_issues(month_data)],
+            }
+            changed += 1
+
+        if changed:
+            self._save()
+        self._build()
+        return changed
+
+    def execute(self, jql: str, limit: int = None):
+        """
+        Run a JQL subset query against the index
+
+        :param jql: Query, see src.analyzer.jql.parse for the supported subset
+        :param limit: Maximum number of issues to return
+        :return: Tuple of (issues, total matching issues)
+        """
+        condition, order_by = parse(jql)
+        keys = self._evaluate(condition) if condition else set(self.rows)
+        ordered = self._sort(keys, order_by or [("created", True)])
+        total = len(ordered)
+        if limit is not None:
+            ordered = ordered[:limit]
+        return self.fetch(ordered), total
+
+    def fetch(self, keys: List[str]) -> List[Dict[str, Any]]:
+        """
+        Load the full issues for keys, opening each month file once
+
+        :param keys: Issue keys known to the index
+        :return: Raw issues in the order of keys
+        """
+        wanted = {}
+        for key in keys:
+            row = self.rows[key]
+            wanted.setdefault(row["file"], {})[key] = row["updated_raw"]
+
+        found = {}
+        for name, file_keys in wanted.items():
+            with open(self.root / name, "r", encoding="utf-8") as f:
+                month_data = json.load(f)
+            for issue in month_issues(month_data):
+                updated = file_keys.get(issue["key"])
+                if updated is not None and issue["fields"].get("updated", "") == updated:
+                    found[issue["key"]] = issue
+        return [found[key] for key in keys if key in found]
+
+    def _load(self):
+        if self.files or not self.path.exists():
+            return
+        with open(self.path, "r", encoding="utf-8") as f:
+            stored = json.load(f)
+        if stored.get("version") == INDEX_VERSION:
+            self.files = stored["files"]
+
+    def _save(self):
+        # Concurrent refreshes index the same cache, the last one wins whole
+        with partition_lock(self.path):
+            write_json_atomic(self.path, {"version": INDEX_VERSION, "files": self.files})
+
+    def _build(self):
+        # The same issue can sit in several month files, keep the latest copy
+        self.rows = {}
+        for name, entry in self.files.items():
+            for row in entry["rows"]:
+                current = self.rows.get(row["key"])
+                if current is None or row["updated_raw"] >= current["updated_raw"]:
+                    self.rows[row["key"]] = dict(row, file=name)
+
+        self._values = {field: {} for field in VALUE_FIELDS}
+        self._dates = {"created": [], "updated": []}
+        for key, row in self.rows.items():
+            for field, index in self._values.items():
+                if field == "key":
+                    values = [key.lower()]
+                elif field == "assignee":
+                    values = row["assignee"] or [None]
+                else:
+                    values = [row[field]]
+                for value in values:
+                    index.setdefault(value, set()).add(key)
+            for field, dates in self._dates.items():
+                if row[field] is not None:
+                    dates.append((row[field], key))
+        for dates in self._dates.values():
+            dates.sort()
+
+    def _evaluate(self, condition):
+        kind = condition[0]
+        if kind == "and":
+            result = self._evaluate(condition[1][0])
+            for term in condition[1][1:]:
+                result &= self._evaluate(term)
+            return result
+        if kind == "or":
+            result = set()
+            for term in condition[1]:
+                result |= self._evaluate(term)
+            return result
+        if kind == "not":
+            return set(self.rows) - self._evaluate(condition[1])
+        if kind == "empty":
+            _, field, negate = condition
+            if field in self._dates:
+                matches = set(self.rows) - {key for _, key in self._dates[field]}
+            else:
+                matches = set(self._values[field].get(None, ()))
+            return set(self.rows) - matches if negate else matches
+        if kind == "in":
+            _, field, values, negate = condition
+            index = self._values.get(field)
+            if index is None:
+                raise JQLError(f"IN is not supported on {field}")
+            matches = set()
+            for value in values:
+                matches |= index.get(value.lower(), set())
+            return set(self.rows) - matches if negate else matches
+
+        _, field, op, moment = condition
+        dates = self._dates[field]
+        timestamp = moment.timestamp()
+        if op == "=":
+            lo, hi = bisect_left(dates, (timestamp,)), bisect_right(dates, (timestamp, _MAX_KEY))
+        elif op == "!=":
+            equal = self._evaluate(("compare", field, "=", moment))
+            return {key for _, key in dates} - equal
+        elif op in (">", ">="):
+            lo = bisect_right(dates, (timestamp, _MAX_KEY)) if op == ">" else bisect_left(dates, (timestamp,))
+            hi = len(dates)
+        else:
+            lo = 0
+            hi = bisect_left(dates, (timestamp,)) if op == "<" else bisect_right(dates, (timestamp, _MAX_KEY))
+        return {key for _, key in dates[lo:hi]}
+
+    def _sort(self, keys, order_by):
+        ordered = sorted(keys, key=_key_order)
+        # Stable sorts from the last ORDER BY field to the first
+        for field, descending in reversed(order_by):
+            if field == "key":
+                ordered.sort(key=_key_order, reverse=descending)
+                continue
+            sort_field = {"priority": "priority_id", "assignee": "assignee_name"}.get(field, field)
+            present = [key for key in ordered if self.rows[key][sort_field] is not None]
+            missing = [key for key in ordered if self.rows[key][sort_field] is None]
+            # Priority ids follow the default priority scheme, Highest is 1, so
+            # DESC, most urgent first, is the ascending id order
+            reverse = not descending if field == "priority" else descending
+            present.sort(key=lambda key: self.rows[key][sort_field], reverse=reverse)
+            # Jira puts empty values last in either direction
+            ordered = present + missing
+        return ordered
+
+
+def _key_order(key):
+    project, _, number = key.rpartition("-")
+    return project, int(number) if number.isdigit() else 0
+
+
+def run_query(project_key: str, jql: str, limit: int = None):
+    """
+    Answer a JQL subset query from the local cache, without network access
+
+    :param project_key: Jira project key whose cache is queried
+    :param jql: Query
+    :param limit: Maximum number of issues to return
+    :return: Tuple of (issues, total matching issues)
+    """
+    index = QueryIndex(project_key)
+    index.refresh()
+    return index.execute(jql, limit)
@@ -0,0 +1,205 @@
+import json
+import re
+import sqlite3
+from contextlib import contextmanager
+from typing import Any, Dict, List
+
+from src.scraper.formatters import flatten_adf
+from src.scraper.issue_cache import issues_dir, month_issues
+
+INDEX_FILE = "search_index.sqlite"
+RESOLUTION_FIELD_NAME = "Ticket Resolution Details"
+
+# bm25() weights of the summary, description, comments and resolution columns
+COLUMN_WEIGHTS = (8.0, 2.0, 1.0, 2.0)
+
+_WORD_RE = re.compile(r"\w+", re.UNICODE)
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS files (
+    name TEXT PRIMARY KEY,
+    mtime REAL NOT NULL,
+    size INTEGER NOT NULL
+);
+CREATE TABLE IF NOT EXISTS documents (
+    id INTEGER PRIMARY KEY,
+    key TEXT UNIQUE NOT NULL,
+    updated TEXT NOT NULL
+);
+CREATE VIRTUAL TABLE IF NOT EXISTS issue_text USING fts5(
+    summary, description, comments, resolution,
+    tokenize = 'porter unicode61 remove_diacritics 2'
+);
+"""
+
+
+def resolution_field_id(custom_fields):
+    """Id of the resolution details custom field, None when it is not configured"""
+    for field_id, field in (custom_fields or {}).items():
+        if field.get("name") == RESOLUTION_FIELD_NAME:
+            return field_id
+    return None
+
+
+def issue_text(issue, resolution_field=None):
+    """
+    Flatten the searchable text of an issue
+
+    :param issue: Raw issue
+    :param resolution_field: Custom field id of the resolution details
+    :return: Tuple of (summary, description, comments, resolution) text
+    """
+    fields = issue.get("fields", {})
+    comments = "\n".join(
+        flatten_adf(comment.get("body"))
+        for comment in (fields.get("comment") or {}).get("comments", [])
+    )
+    return (
+        fields.get("summary") or "",
+        flatten_adf(fields.get("description")),
+        comments,
+        flatten_adf(fields.get(resolution_field)) if resolution_field else "",
+    )
+
+
+def to_match_query(text):
+    """
+    Turn free text into an FTS5 query matching any of its words
+
+    Every word is quoted so punctuation and FTS5 operators in the input are
+    searched literally. BM25 ranks issues matching more and rarer words first.
+    """
+    words = _WORD_RE.findall(text)
+    return " OR ".join(f'"{word}"' for word in words)
+
+
+class SearchIndex:
+    def __init__(self, project_key: str, custom_fields: Dict[str, Any] = None):
+        """
+        Persistent full-text index over the cached issues of a project
+
+        Summary, description, comments and resolution details are flattened
+        from ADF and stored in an SQLite FTS5 table at
+        raw_data/<KEY>_issues/search_index.sqlite. A refresh only re-reads the
+        month files whose size or mtime changed, and only reindexes issues with
+        a newer updated timestamp.
+
+        :param project_key: Jira project key
+        :param custom_fields: Custom field mappings, used to find the resolution details field
+        """
+        self.project_key = project_key
+        self.root = issues_dir(project_key)
+        self.path = self.root / INDEX_FILE
+        self.resolution_field = resolution_field_id(custom_fields)
+
+    def exists(self) -> bool:
+        return self.path.exists()
+
+    def refresh(self) -> int:
+        """
+        Bring the index up to date with the cache
+
+        :return: Number of issues (re)indexed
+        """
+        self.root.mkdir(parents=True, exist_ok=True)
+        current = {
+            str(path.relative_to(self.root)): path
+            for path in sorted(self.root.glob("*/*/issues.json"))
+        }
+        indexed = 0
+        with self._connect() as connection:
+            connection.executescript(_SCHEMA)
+            known = {
+                name: (mtime, size)
+                for name, mtime, size in connection.execute("SELECT name, mtime, size FROM files")
+            }
+            # A month file went away, its issues may be stale, start over
+            if set(known) - set(current):
+                connection.execute("DELETE FROM files")
+                connection.execute("DELETE FROM documents")
+                connection.execute("DELETE FROM issue_text")
+                known = {}
+
+            for name, path in current.items():
+                stat = path.stat()
+                if known.get(name) == (stat.st_mtime, stat.st_size):
+                    continue
+                with open(path, "r", encoding="utf-8") as f:
+                    month_data = json.load(f)
+                for issue in month_issues(month_data):
+                    indexed += self._upsert(connection, issue)
+                connection.execute(
+                    "INSERT OR REPLACE INTO files (name, mtime, size) VALUES (?, ?, ?)",
+                    (name, stat.st_mtime, stat.st_size),
+                )
+        return indexed
+
+    def search(self, text: str, limit: int = 20) -> List[Dict[str, Any]]:
+        """
+        Rank issues by BM25 relevance to free text
+
+        :param text: Words to look for
+        :param limit: Maximum number of results
+        :return: Result dicts with key, summary, score (higher is better) and a snippet
+        """
+        match_query = to_match_query(text)
+        if not match_query or not self.exists():
+            return []
+
+        weights = ", ".join(str(weight) for weight in COLUMN_WEIGHTS)
+        with self._connect() as connection:
+            rows = connection.execute(
+                f"""
+                SELECT documents.key, issue_text.summary,
+                       bm25(issue_text, {weights}) AS rank,
+                       snippet(issue_text, -1, '[', ']', '...', 12)
+                FROM issue_text JOIN documents ON documents.id = issue_text.rowid
+                WHERE issue_text MATCH ?
+                ORDER BY rank
+                LIMIT ?
+                """,
+                (match_query, limit),
+            ).fetchall()
+
+        # bm25() is negative, lower is more relevant
+        return [
+            {"key": key, "summary": summary, "score": round(-rank, 3), "snippet": snippet}
+            for key, summary, rank, snippet in rows
+        ]
+
+    @contextmanager
+    def _connect(self):
+        # The connection context manager only commits, close it as well
+        connection = sqlite3.connect(self.path)
+        try:
+            with connection:
+                yield connection
+        finally:
+            connection.close()
+
+    def _upsert(self, connection, issue):
+        updated = issue.get("fields", {}).get("updated") or ""
+        row = connection.execute(
+            "SELECT id, updated FROM documents WHERE key = ?", (issue["key"],)
+        ).fetchone()
+        if row is not None and row[1] >= updated:
+            return 0
+
+        if row is None:
+            doc_id = connection.execute(
+                "INSERT INTO documents (key, updated) VALUES (?, ?)",
+                (issue["key"], updated),
+            ).lastrowid
+        else:
+            doc_id = row[0]
+            connection.execute(
+                "UPDATE documents SET updated = ? WHERE id = ?", (updated, doc_id)
+            )
+            connection.execute("DELETE FROM issue_text WHERE rowid = ?", (doc_id,))
+
+        connection.execute(
+            "INSERT INTO issue_text (rowid, summary, description, comments, resolution) "
+            "VALUES (?, ?, ?, ?, ?)",
+            (doc_id, *issue_text(issue, self.resolution_field)),
+        )
+        return 1
@@ -0,0 +1,210 @@
+import json
+
+import pandas as pd
+from src.analyzer.converter import get_sprint_history
+from src.scraper.formatters import SPRINT_KEYS
+from src.scraper.issue_cache import partition_lock, read_json, write_json_atomic
+
+SPRINT_HISTORY_COLUMN = "Sprint History"
+
+# Story point fields of company-managed and team-managed projects, issues are
+# counted instead when neither is present
+STORY_POINT_COLUMNS = ["Story Points", "Story point estimate"]
+
+# Number of closed sprints averaged into the velocity
+VELOCITY_WINDOW = 3
+
+SPRINT_DATE_COLUMNS = ["startDate", "endDate", "completeDate"]
+STATS_COLUMNS = [
+    "Sprint",
+    "State",
+    "Start",
+    "End",
+    "Committed Issues",
+    "Committed Points",
+    "Completed Issues",
+    "Completed Points",
+    "Carried Over",
+]
+
+
+def story_points(data):
+    """Story points of each issue, 1 per issue when the data has no story point field"""
+    for column in STORY_POINT_COLUMNS:
+        if column in data.columns:
+            return pd.to_numeric(data[column], errors="coerce").fillna(0)
+    return pd.Series(1.0, index=data.index)
+
+
+def issues_to_sprint_frame(issues, custom_fields):
+    """
+    Build the columns sprint_membership needs from raw cached issues
+
+    :param issues: Raw issues
+    :param custom_fields: Custom field mappings, used to find the Sprint and story point fields
+    :return: Dataframe with Issue Key, Status, Sprint History and story points
+    """
+    point_fields = {
+        field_id: field["name"]
+        for field_id, field in custom_fields.items()
+        if field.get("name") in STORY_POINT_COLUMNS
+    }
+    rows = []
+    for issue in issues:
+        fields = issue["fields"]
+        row = {
+            "Issue Key": issue["key"],
+            "Status": (fields.get("status") or {}).get("name"),
+            SPRINT_HISTORY_COLUMN: get_sprint_history(fields, custom_fields),
+        }
+        for field_id, name in point_fields.items():
+            row[name] = fields.get(field_id)
+        rows.append(row)
+    return pd.DataFrame(rows)
+
+
+def sprint_membership(data):
+    """
+    Sprint x issue membership table, one row for every sprint an issue was in
+
+    The Sprint History lists of all issues are exploded and normalized in one
+    pass. "Last Sprint" marks the sprint each issue ended up in, every earlier
+    sprint carried the issue over.
+
+    :param data: Issues dataframe with Issue Key, Status and Sprint History columns
+    :return: Dataframe with the issue columns, Points and the sprint fields
+    """
+    columns = ["Issue Key", "Status", "Points", *SPRINT_KEYS, "Last Sprint"]
+    empty = pd.DataFrame(columns=columns).astype({"Points": float, "Last Sprint": bool})
+    if SPRINT_HISTORY_COLUMN not in data.columns or data.empty:
+        return empty
+
+    # The same issue can come from several CSVs, keep its latest copy
+    issues = data.drop_duplicates("Issue Key", keep="last")
+    issues = pd.DataFrame(
+        {
+            "Issue Key": issues["Issue Key"],
+            "Status": issues["Status"],
+            "Points": story_points(issues),
+            "Sprints": issues[SPRINT_HISTORY_COLUMN].map(_load_sprints),
+        }
+    )
+    exploded = issues.explode("Sprints").dropna(subset=["Sprints"]).reset_index(drop=True)
+    if exploded.empty:
+        return empty
+
+    sprints = pd.json_normalize(exploded["Sprints"].tolist()).reindex(columns=SPRINT_KEYS)
+    membership = pd.concat([exploded.drop(columns="Sprints"), sprints], axis=1)
+    membership = membership.dropna(subset=["id"])
+    # Ids become floats when a sprint has none, keep them as "12" rather than "12.0"
+    membership["id"] = membership["id"].map(
+        lambda value: str(int(value)) if isinstance(value, float) else str(value)
+    )
+    for column in SPRINT_DATE_COLUMNS:
+        membership[column] = pd.to_datetime(membership[column], utc=True, errors="coerce")
+
+    membership = membership.sort_values(["Issue Key", "startDate", "id"], na_position="last")
+    membership["Last Sprint"] = ~membership.duplicated("Issue Key", keep="last")
+    return membership[columns].reset_index(drop=True)
+
+
+def sprint_stats(membership, completed_statuses, cached=None):
+    """
+    Committed vs completed work, carry-over and velocity per sprint
+
+    An issue counts as committed to every sprint it was in and as completed
+    in the sprint it ended up in when its status is completed. Sprints found
+    in cached are taken from it as is, closed sprints don't change anymore.
+
+    :param membership: Table returned by sprint_membership
+    :param completed_statuses: Statuses counting as done
+    :param cached: Stats of closed sprints by sprint id, as returned by closed_sprint_stats
+    :return: Dataframe indexed by sprint id, sorted by start date
+    """
+    cached = cached or {}
+    pending = membership[~membership["id"].isin(list(cached))]
+    completed = pending["Status"].isin(completed_statuses) & pending["Last Sprint"]
+    pending = pending.assign(
+        Completed=completed,
+        CompletedPoints=pending["Points"].where(completed, 0),
+        CarriedOver=~pending["Last Sprint"],
+    )
+
+    stats = pending.groupby("id").agg(
+        **{
+            "Sprint": ("name", "first"),
+            "State": ("state", "first"),
+            "Start": ("startDate", "first"),
+            "End": ("endDate", "first"),
+            "Committed Issues": ("Issue Key", "nunique"),
+            "Committed Points": ("Points", "sum"),
+            "Completed Issues": ("Completed", "sum"),
+            "Completed Points": ("CompletedPoints", "sum"),
+            "Carried Over": ("CarriedOver", "sum"),
+        }
+    )
+    if cached:
+        stored = pd.DataFrame.from_dict(cached, orient="index")[STATS_COLUMNS]
+        stored["Start"] = pd.to_datetime(stored["Start"], utc=True)
+        stored["End"] = pd.to_datetime(stored["End"], utc=True)
+        stats = pd.concat([stored, stats])
+    stats = stats.reindex(columns=STATS_COLUMNS).sort_values("Start", na_position="last")
+    stats.index.name = "Sprint Id"
+
+    stats["Carry-over Rate"] = (stats["Carried Over"] / stats["Committed Issues"]).fillna(0)
+    closed = stats["State"] == "closed"
+    stats["Velocity"] = (
+        stats.loc[closed, "Completed Points"]
+        .rolling(VELOCITY_WINDOW, min_periods=1)
+        .mean()
+    )
+    return stats
+
+
+def stats_to_records(stats):
+    """Sprint stats as JSON-friendly dicts, with the sprint id and ISO dates"""
+    stats = stats.copy()
+    for column in ["Start", "End"]:
+        stats[column] = stats[column].map(lambda value: value.isoformat() if pd.notna(value) else None)
+    return [
+        {
+            "Sprint Id": str(sprint_id),
+            **{
+                column: None if _is_missing(value) else (value.item() if hasattr(value, "item") else value)
+                for column, value in row.items()
+            },
+        }
+        for sprint_id, row in stats.iterrows()
+    ]
+
+
+def closed_sprint_stats(stats):
+    """Stats of the closed sprints as JSON-friendly dicts keyed by sprint id"""
+    closed = stats[stats["State"] == "closed"][STATS_COLUMNS]
+    return {record.pop("Sprint Id"): record for record in stats_to_records(closed)}
+
+
+def load_sprint_cache(path):
+    """Closed sprint stats saved by save_sprint_cache, empty when there are none"""
+    return read_json(path, {})
+
+
+def save_sprint_cache(path, stats):
+    """Store the stats of every closed sprint so they are never recomputed"""
+    with partition_lock(path):
+        write_json_atomic(path, closed_sprint_stats(stats), indent=2)
+
+
+def _is_missing(value):
+    return not isinstance(value, (list, dict)) and pd.isna(value)
+
+
+def _load_sprints(value):
+    if isinstance(value, list):
+        return value
+    if not isinstance(value, str) or not value:
+        return []
+    try:
+        return json.loads(value)
+    except ValueError:
+        return []
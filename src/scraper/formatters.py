@@ -49,12 +49,46 @@ def format_development_field(value):
         return str(value)
 
 
+SPRINT_KEYS = ["id", "name", "state", "startDate", "endDate", "completeDate"]
+
+
+def parse_sprints(value):
+    """
+    Every sprint of a Sprint field value, in the order Jira lists them
+
+    Handles the sprint objects of the REST v3 API as well as the legacy
+    "com.atlassian.greenhopper.service.sprint.Sprint@...[id=1,state=CLOSED,...]"
+    strings.
+
+    :param value: Raw Sprint field value
+    :return: List of dicts with id, name, state, startDate, endDate and completeDate
+    """
+    sprints = []
+    for sprint in value or []:
+        if isinstance(sprint, str):
+            attributes = sprint[sprint.find("[") + 1 : sprint.rfind("]")]
+            pairs = dict(
+                pair.split("=", 1) for pair in attributes.split(",") if "=" in pair
+            )
+            sprint = {
+                key: (None if pairs.get(key) == "<null>" else pairs.get(key))
+                for key in SPRINT_KEYS
+            }
+            if sprint["id"] and sprint["id"].isdigit():
+                sprint["id"] = int(sprint["id"])
+            if sprint["state"]:
+                sprint["state"] = sprint["state"].lower()
+        sprints.append({key: sprint.get(key) for key in SPRINT_KEYS})
+    return sprints
+
+
 def format_sprint_field(value):
-    """Format the sprint field value"""
-    if not value:
+    """Format the sprint field value, every sprint the issue was in"""
+    sprints = parse_sprints(value)
+    if not sprints:
         return "No sprint information"
 
-    return f"{value[0].get('name')} ({value[0].get('state')})"
+    return ", ".join(f"{sprint['name']} ({sprint['state']})" for sprint in sprints)
 
 
 def format_resolution_field(value):
@@ -71,6 +105,57 @@ def format_resolution_field(value):
     return "\n".join(text_items)
 
 
+# ADF nodes that start a new line when flattened to text
+ADF_BLOCK_TYPES = {
+    "paragraph",
+    "heading",
+    "listItem",
+    "codeBlock",
+    "blockquote",
+    "panel",
+    "tableRow",
+    "rule",
+}
+
+
+def flatten_adf(node):
+    """
+    Flatten an Atlassian Document Format node to plain text
+
+    Unlike format_resolution_field this walks the whole tree, so text in
+    lists, tables, panels, mentions and links is kept.
+
+    :param node: ADF document or node, plain strings are returned as is
+    :return: Text with one line per block
+    """
+    if not node:
+        return ""
+    if isinstance(node, str):
+        return node
+
+    parts = []
+
+    def walk(current):
+        node_type = current.get("type")
+        if node_type == "text":
+            parts.append(current.get("text", ""))
+        elif node_type == "hardBreak":
+            parts.append("\n")
+        elif node_type in ("mention", "emoji", "status", "date"):
+            attrs = current.get("attrs", {})
+            parts.append(attrs.get("text") or attrs.get("shortName") or "")
+        elif node_type in ("inlineCard", "blockCard"):
+            parts.append(current.get("attrs", {}).get("url", ""))
+
+        for child in current.get("content", []):
+            walk(child)
+        if node_type in ADF_BLOCK_TYPES:
+            parts.append("\n")
+
+    walk(node)
+    return "\n".join(line.strip() for line in "".join(parts).splitlines() if line.strip())
+
+
 def format_project_output(
     project_details, board_config, issues, total_available, timeframe
 ):
@@ -0,0 +1,173 @@
+import json
+import os
+import tempfile
+from contextlib import contextmanager
+from pathlib import Path
+
+try:
+    import fcntl
+except ImportError:  # Windows, writes stay atomic but are not locked
+    fcntl = None
+
+# Month mapping for folder names
+MONTH_NAMES = {
+    1: "january",
+    2: "february",
+    3: "march",
+    4: "april",
+    5: "may",
+    6: "june",
+    7: "july",
+    8: "august",
+    9: "september",
+    10: "october",
+    11: "november",
+    12: "december",
+}
+
+
+def issues_dir(project_key: str) -> Path:
+    """Root of the cached issues of a project"""
+    return Path("raw_data") / f"{project_key}_issues"
+
+
+@contextmanager
+def partition_lock(path):
+    """
+    Hold an exclusive advisory lock on one cache file across processes
+
+    Every month file has its own lock, path + '.lock', so writers of different
+    months never wait on each other. Readers don't lock, files are only ever
+    replaced whole by write_json_atomic.
+
+    :param path: Path of the locked file
+    """
+    lock_path = f"{path}.lock"
+    os.makedirs(os.path.dirname(lock_path) or ".", exist_ok=True)
+    with open(lock_path, "a") as lock_file:
+        if fcntl is not None:
+            fcntl.flock(lock_file, fcntl.LOCK_EX)
+        try:
+            yield
+        finally:
+            if fcntl is not None:
+                fcntl.flock(lock_file, fcntl.LOCK_UN)
+
+
+def read_json(path, default=None):
+    """Load a JSON cache file, default when it doesn't exist"""
+    try:
+        with open(path, "r", encoding="utf-8") as f:
+            return json.load(f)
+    except FileNotFoundError:
+        return default
+
+
+def write_json_atomic(path, data, indent=None):
+    """
+    Write JSON to a temporary file next to path and rename it over path
+
+    Readers see either the old or the new file, never a partial one, even
+    when the process dies mid-write.
+
+    :param path: Destination path
+    :param data: JSON serializable data
+    :param indent: Indentation passed to json.dump
+    """
+    with _atomic_file(path) as f:
+        json.dump(data, f, indent=indent)
+
+
+def write_text_atomic(path, text):
+    """
+    Write text to a temporary file next to path and rename it over path
+
+    :param path: Destination path
+    :param text: File content
+    """
+    with _atomic_file(path) as f:
+        f.write(text)
+
+
+@contextmanager
+def _atomic_file(path):
+    """
+    File to write the new content of path to, renamed over path on success
+
+    Every writer gets its own temporary file, so concurrent writers of the
+    same path never write to each other's file.
+    """
+    directory = os.path.dirname(path) or "."
+    os.makedirs(directory, exist_ok=True)
+    fd, temp_path = tempfile.mkstemp(
+        dir=directory, prefix=f".{os.path.basename(path)}.", suffix=".tmp"
+    )
+    try:
+        with os.fdopen(fd, "w", encoding="utf-8") as f:
+            yield f
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(temp_path, path)
+    except BaseException:
+        if os.path.exists(temp_path):
+            os.unlink(temp_path)
+        raise
+
+
+def update_json(path, update, indent=None):
+    """
+    Read-modify-write a JSON cache file under its partition lock
+
+    :param path: Path of the JSON file
+    :param update: Function taking the current data, {} when missing, and returning the new data
+    :param indent: Indentation passed to json.dump
+    :return: The data written
+    """
+    with partition_lock(path):
+        data = update(read_json(path, {}))
+        write_json_atomic(path, data, indent)
+    return data
+
+
+def is_legacy_month(month_data) -> bool:
+    """Whether a month file uses the old layout, issue lists grouped by date"""
+    return any(isinstance(value, list) for value in month_data.values())
+
+
+def month_issues(month_data):
+    """
+    Issues of a month file, in the store layout ({key: issue}) or the old one
+
+    :param month_data: Loaded issues.json
+    :return: Generator of raw issues
+    """
+    for value in month_data.values():
+        if isinstance(value, list):
+            yield from value
+        else:
+            yield value
+
+
+def iter_cached_issues(project_key: str):
+    """
+    Iterate over every cached issue of a project, once per issue key
+
+    Caches not yet migrated to the IssueStore layout group issues by date and
+    can hold the same issue several times, the copy with the latest updated
+    timestamp wins.
+
+    :param project_key: Jira project key
+    :return: Generator of raw issues
+    """
+    latest = {}
+    for json_path in sorted(issues_dir(project_key).glob("*/*/issues.json")):
+        for issue in month_issues(read_json(json_path, {})):
+            current = latest.get(issue["key"])
+            if current is None or _updated(issue) >= _updated(current):
+                latest[issue["key"]] = issue
+
+    yield from latest.values()
+
+
+def _updated(issue):
+    return issue.get("fields", {}).get("updated") or ""
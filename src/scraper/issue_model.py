@@ -0,0 +1,125 @@
+import json
+
+_COMPACT = (",", ":")
+
+
+class Issue:
+    """
+    The parts of a raw Jira issue the printer, converter and EOD report use
+
+    Built once from the raw JSON, after which the raw payload can be dropped.
+    Scalars are read eagerly. Comments, with their ADF bodies, and the status
+    changes of the changelog are kept as compact JSON and only decoded when
+    accessed.
+    """
+
+    __slots__ = (
+        "key",
+        "id",
+        "summary",
+        "status",
+        "issue_type",
+        "created",
+        "updated",
+        "priority",
+        "reporter",
+        "assignee",
+        "fix_versions",
+        "parent_key",
+        "parent_summary",
+        "links",
+        "custom_fields",
+        "_comments",
+        "_status_changes",
+    )
+
+    def __init__(self, raw, custom_fields=None):
+        """
+        :param raw: Raw issue as returned by the search endpoint
+        :param custom_fields: Custom field mappings, only these custom fields are kept,
+            all non-empty ones when None
+        """
+        fields = raw.get("fields") or {}
+        self.key = raw.get("key")
+        self.id = raw.get("id")
+        self.summary = fields.get("summary")
+        self.status = _name(fields.get("status"))
+        self.issue_type = _name(fields.get("issuetype"))
+        self.created = fields.get("created")
+        self.updated = fields.get("updated")
+        self.priority = _name(fields.get("priority"))
+        self.reporter = _display_name(fields.get("reporter"))
+        self.assignee = _display_name(fields.get("assignee"))
+        self.fix_versions = tuple(v.get("name", "") for v in fields.get("fixVersions") or [])
+
+        parent = fields.get("parent") or {}
+        self.parent_key = parent.get("key")
+        self.parent_summary = (parent.get("fields") or {}).get("summary")
+
+        # (type, direction, key) of each linked issue, outward before inward
+        self.links = tuple(
+            ((link.get("type") or {}).get("name"), direction, linked.get("key"))
+            for link in fields.get("issuelinks") or []
+            for direction in ("outward", "inward")
+            for linked in [link.get(f"{direction}Issue")]
+            if linked
+        )
+        self.custom_fields = {
+            field_key: value
+            for field_key, value in fields.items()
+            if field_key.startswith("customfield_")
+            and (custom_fields is None or field_key in custom_fields)
+            and value is not None
+            and value != []
+        }
+
+        comments = [
+            {
+                "author": _display_name(comment.get("author")),
+                "created": comment.get("created"),
+                "body": comment.get("body"),
+            }
+            for comment in (fields.get("comment") or {}).get("comments") or []
+        ]
+        self._comments = json.dumps(comments, separators=_COMPACT) if comments else None
+
+        status_changes = [
+            {
+                "date": history.get("created"),
+                "author": _display_name(history.get("author")),
+                "from": item.get("fromString"),
+                "to": item.get("toString"),
+            }
+            for history in (raw.get("changelog") or {}).get("histories") or []
+            for item in history.get("items") or []
+            if item.get("field") == "status"
+        ]
+        self._status_changes = (
+            json.dumps(status_changes, separators=_COMPACT) if status_changes else None
+        )
+
+    @property
+    def comments(self):
+        """Comments as author, created and body dicts, bodies still in ADF"""
+        return json.loads(self._comments) if self._comments else []
+
+    @property
+    def status_changes(self):
+        """Status transitions of the changelog as date, author, from and to dicts"""
+        return json.loads(self._status_changes) if self._status_changes else []
+
+    def __repr__(self):
+        return f"Issue({self.key!r}, {self.status!r})"
+
+
+def as_issue(issue, custom_fields=None):
+    """An Issue from a raw issue, Issues are returned as is"""
+    return issue if isinstance(issue, Issue) else Issue(issue, custom_fields)
+
+
+def _name(value):
+    return value.get("name") if value else None
+
+
+def _display_name(value):
+    return value.get("displayName") if value else None
@@ -0,0 +1,322 @@
+import os
+import sys
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Dict, Iterable, List
+
+from .issue_cache import (
+    MONTH_NAMES,
+    is_legacy_month,
+    partition_lock,
+    read_json,
+    update_json,
+    write_json_atomic,
+)
+
+STORE_VERSION = 2
+
+# The month file of an issue is picked from this field, which never changes
+HOME_FIELD = "created"
+
+
+class IssueStore:
+    def __init__(self, root: Path):
+        """
+        Key-addressed issue cache of a project with per-field date indexes
+
+        Every issue is stored once, in the month file of its created date, as
+        {key: issue}, and only its most recently updated version is kept.
+        index/<field>.json maps the dates fetched for a field to the keys whose
+        field falls on that date and the month file they live in. A date listed
+        in an index was fetched in full, so lookups by created or updated are
+        exact. Caches written in the old date-grouped layout are migrated the
+        first time they are used.
+
+        :param root: Partition of the project, raw_data/<KEY>_issues
+        """
+        self.root = Path(root)
+        self.index_dir = self.root / "index"
+        self.marker_path = self.index_dir / "store.json"
+
+    def month_path(self, home: str) -> Path:
+        """Path of the month file of a home, e.g. '2024/may'"""
+        return self.root / home / "issues.json"
+
+    def lookup(self, field: str, dates: Iterable[str], metrics=None):
+        """
+        Cached issues of the dates of a field
+
+        :param field: Date field the dates refer to, e.g. 'updated'
+        :param dates: YYYY-MM-DD dates
+        :param metrics: Metrics recording a cache hit or miss per date
+        :return: Tuple of (issues by cached date, set of dates not in the cache)
+        """
+        self.migrate()
+        index = read_json(self._index_path(field), {})
+        cached = {}
+        missing = set()
+        for date_str in dates:
+            if date_str in index:
+                cached[date_str] = index[date_str]
+            else:
+                missing.add(date_str)
+            if metrics is not None:
+                metrics.record_cache_lookup(self.root.name, date_str, date_str in index)
+
+        found = self.load({key: home for keys in cached.values() for key, home in keys.items()})
+        # Skip issues stored again since the index was last updated, with
+        # another date
+        return (
+            {
+                date_str: [
+                    found[key]
+                    for key in keys
+                    if key in found and _field_date(found[key], field) == date_str
+                ]
+                for date_str, keys in cached.items()
+            },
+            missing,
+        )
+
+    def save(
+        self,
+        issues_by_date: Dict[str, List[Dict[str, Any]]],
+        field: str,
+        merge: bool = False,
+    ):
+        """
+        Store fetched issues and record their dates in the index of a field
+
+        A date is replaced, its previous keys dropped, unless merge is set, in
+        which case the issues are added to it. Issues are written to their month
+        file only when newer than the stored copy.
+
+        :param issues_by_date: Issues grouped by the date of field
+        :param field: Date field the fetch was done on
+        :param merge: Add to the dates instead of replacing them
+        """
+        self.migrate()
+        stored = self._write(issue for issues in issues_by_date.values() for issue in issues)
+        self._index(stored, field, set(issues_by_date), set() if merge else set(issues_by_date))
+
+    def put(self, issues: Iterable[Dict[str, Any]], index: bool = True) -> Dict[str, str]:
+        """
+        Store issues without recording any date as fetched
+
+        The issues move to their current dates in the indexes, but only on
+        dates that were already fetched.
+
+        :param issues: Raw issues
+        :param index: Update the indexes, a fetch writing many pages leaves it
+            to record or place once it is done
+        :return: Month file of each issue by key
+        """
+        self.migrate()
+        stored = self._write(issues)
+        if index:
+            self._index(stored, None, set(), set())
+        return {key: _home(issue) for key, issue in stored.items()}
+
+    def place(self, homes: Dict[str, str]):
+        """
+        Move issues stored with put(index=False) to their current dates in the indexes
+
+        :param homes: Month file of each issue by key, as returned by put
+        """
+        self.migrate()
+        self._index(self.load(homes), None, set(), set())
+
+    def record(self, issues_by_date: Dict[str, List[Dict[str, Any]]], field: str):
+        """
+        Record dates as fetched in full once their issues were stored with put
+
+        The dates are replaced like save does, with the stored version of each
+        issue.
+
+        :param issues_by_date: Issues grouped by the date of field
+        :param field: Date field the fetch was done on
+        """
+        self.migrate()
+        stored = self.load(
+            {issue["key"]: _home(issue) for issues in issues_by_date.values() for issue in issues}
+        )
+        self._index(stored, field, set(issues_by_date), set(issues_by_date))
+
+    def load(self, homes: Dict[str, str]) -> Dict[str, Dict[str, Any]]:
+        """
+        Issues by key from their month files, each file read once
+
+        :param homes: Month file of each wanted key, e.g. {'PROJ-1': '2024/may'}
+        :return: The stored issues by key, keys not found are left out
+        """
+        self.migrate()
+        wanted = {}
+        for key, home in homes.items():
+            wanted.setdefault(home, set()).add(key)
+        found = {}
+        for home, keys in wanted.items():
+            month = read_json(self.month_path(home), {})
+            found.update((key, month[key]) for key in keys if key in month)
+        return found
+
+    def fetched_dates(self, field: str) -> set:
+        """Dates of a field that were fetched in full"""
+        self.migrate()
+        return set(read_json(self._index_path(field), {}))
+
+    def migrate(self):
+        """Rewrite a cache in the old date-grouped layout into the store, once"""
+        if self.marker_path.exists():
+            return
+        with partition_lock(self.marker_path):
+            if self.marker_path.exists():
+                return
+
+            latest = {}
+            legacy_dates = {}
+            legacy_paths = []
+            for json_path in sorted(self.root.glob("*/*/issues.json")):
+                month_data = read_json(json_path, {})
+                if not is_legacy_month(month_data):
+                    continue
+                legacy_paths.append(json_path)
+                for date_str, issues in month_data.items():
+                    legacy_dates.setdefault(date_str, []).extend(issues)
+                    for issue in issues:
+                        current = latest.get(issue["key"])
+                        if current is None or _updated(issue) >= _updated(current):
+                            latest[issue["key"]] = issue
+
+            if legacy_paths:
+                print(
+                    f"Migrating {len(latest)} cached issues of {self.root.name} "
+                    "to the deduplicated store",
+                    file=sys.stderr,
+                )
+            # Legacy files are only removed once the issues are in their homes and
+            # the indexes, an interrupted migration runs again on what is left
+            by_home = {}
+            for key, issue in latest.items():
+                by_home.setdefault(_home(issue), {})[key] = issue
+            for home, issues in by_home.items():
+                with partition_lock(self.month_path(home)):
+                    month = read_json(self.month_path(home), {})
+                    month = {} if is_legacy_month(month) else month
+                    write_json_atomic(self.month_path(home), _keep_latest(month, issues))
+
+            # The old layout doesn't say which field a date was fetched on. A
+            # date counts as fetched on created when all its issues were
+            # created that day, else on updated when all were updated that day,
+            # dates matching neither are fetched again when needed
+            fetched = {"created": set(), "updated": set()}
+            for date_str, issues in legacy_dates.items():
+                for index_field in fetched:
+                    if all(_field_date(issue, index_field) == date_str for issue in issues):
+                        fetched[index_field].add(date_str)
+                        break
+            for index_field, dates in fetched.items():
+                if dates:
+                    update_json(
+                        self._index_path(index_field),
+                        lambda index, index_field=index_field, dates=dates: _place(
+                            index, latest, index_field, dates, set()
+                        ),
+                    )
+
+            for json_path in legacy_paths:
+                home = json_path.parent.relative_to(self.root).as_posix()
+                if home not in by_home:
+                    os.unlink(json_path)
+            write_json_atomic(self.marker_path, {"version": STORE_VERSION})
+
+    def _write(self, issues):
+        """Write issues to their month files, return the stored version of each by key"""
+        by_home = {}
+        for issue in issues:
+            by_home.setdefault(_home(issue), {})[issue["key"]] = issue
+
+        stored = {}
+        for home, month_issues in by_home.items():
+            month = update_json(
+                self.month_path(home),
+                lambda month, month_issues=month_issues: _keep_latest(month, month_issues),
+            )
+            stored.update((key, month[key]) for key in month_issues)
+        return stored
+
+    def _index(self, stored, field, fetched, replaced):
+        """Place stored issues in every index, creating the fetched dates of field"""
+        index_fields = self._index_fields() | ({field} if field else set())
+        for index_field in index_fields:
+            update_json(
+                self._index_path(index_field),
+                lambda index, index_field=index_field: _place(
+                    index,
+                    stored,
+                    index_field,
+                    fetched if index_field == field else set(),
+                    replaced if index_field == field else set(),
+                ),
+            )
+
+    def _index_path(self, field):
+        return self.index_dir / f"{field}.json"
+
+    def _index_fields(self):
+        if not self.index_dir.exists():
+            return set()
+        return {
+            path.stem for path in self.index_dir.glob("*.json") if path.name != "store.json"
+        }
+
+
+def _field_date(issue, field):
+    """YYYY-MM-DD date of a timestamp field of an issue, None when it is empty"""
+    time_str = (issue.get("fields") or {}).get(field) or ""
+    return time_str.split("T")[0] or None
+
+
+def _home(issue):
+    """Month file of an issue, e.g. '2024/may'"""
+    date_str = _field_date(issue, HOME_FIELD) or _field_date(issue, "updated")
+    date = datetime.strptime(date_str, "%Y-%m-%d")
+    return f"{date.year}/{MONTH_NAMES[date.month]}"
+
+
+def _updated(issue):
+    return (issue.get("fields") or {}).get("updated") or ""
+
+
+def _keep_latest(month, issues):
+    """Month data with the issues that are newer than the stored copies"""
+    for key, issue in issues.items():
+        current = month.get(key)
+        if current is None or _updated(issue) >= _updated(current):
+            month[key] = issue
+    return month
+
+
+def _place(index, stored, field, fetched, replaced):
+    """
+    Update a field index with the stored versions of some issues
+
+    Keys move to the date their field has now, and are dropped when that date
+    was never fetched. Dates in replaced lose their previous keys, dates in
+    fetched are created.
+    """
+    for date_str in replaced:
+        index[date_str] = {}
+    for date_str in fetched:
+        index.setdefault(date_str, {})
+
+    located = {
+        key: date_str for date_str, keys in index.items() for key in keys if key in stored
+    }
+    for key, issue in stored.items():
+        date_str = _field_date(issue, field)
+        previous = located.get(key)
+        if previous is not None and previous != date_str:
+            del index[previous][key]
+        if date_str in index:
+            index[date_str][key] = _home(issue)
+    return index
@@ -0,0 +1,90 @@
+import threading
+import time
+
+from .issue_cache import read_json, write_json_atomic
+
+# Seconds a cached metadata resource is served without asking Jira
+DEFAULT_TTLS = {
+    "field": 24 * 3600,
+    "project": 24 * 3600,
+    "board": 24 * 3600,
+}
+
+
+class MetadataCache:
+    def __init__(self, path: str = "config/jira_metadata.json", ttls=None):
+        """
+        On-disk cache of Jira metadata responses with per-resource TTLs
+
+        Entries keep the ETag and Last-Modified validators of the response, so
+        once an entry expires it can be revalidated with a conditional request
+        instead of downloaded again.
+
+        :param path: JSON file holding the entries
+        :param ttls: Seconds an entry stays fresh by resource type, merged over DEFAULT_TTLS
+        """
+        self.path = path
+        self.ttls = dict(DEFAULT_TTLS, **(ttls or {}))
+        self._lock = threading.Lock()
+        self._entries = None
+
+    def get(self, key: str):
+        """Cached entry with data, fetched_at, etag and last_modified, None when missing"""
+        with self._lock:
+            return self._load().get(key)
+
+    def is_fresh(self, resource: str, entry) -> bool:
+        """Whether an entry of a resource type is younger than its TTL"""
+        ttl = self.ttls.get(resource, 0)
+        return entry is not None and time.time() - entry["fetched_at"] < ttl
+
+    def conditional_headers(self, entry):
+        """If-None-Match / If-Modified-Since headers revalidating an entry"""
+        headers = {}
+        if entry and entry.get("etag"):
+            headers["If-None-Match"] = entry["etag"]
+        if entry and entry.get("last_modified"):
+            headers["If-Modified-Since"] = entry["last_modified"]
+        return headers
+
+    def put(self, key: str, data, response=None):
+        """
+        Store a resource, with the validators of the response it came from
+
+        :param key: Cache key, e.g. 'board:PROJ'
+        :param data: JSON serializable resource
+        :param response: requests.Response the data was read from
+        """
+        headers = response.headers if response is not None else {}
+        with self._lock:
+            self._load()[key] = {
+                "fetched_at": time.time(),
+                "etag": headers.get("ETag"),
+                "last_modified": headers.get("Last-Modified"),
+                "data": data,
+            }
+            self._save()
+
+    def touch(self, key: str):
+        """Mark an entry fresh again after Jira answered 304 Not Modified"""
+        with self._lock:
+            entry = self._load().get(key)
+            if entry is not None:
+                entry["fetched_at"] = time.time()
+                self._save()
+
+    def invalidate(self, prefix: str = ""):
+        """Expire the entries whose key starts with prefix, all of them by default"""
+        with self._lock:
+            for key, entry in self._load().items():
+                if key.startswith(prefix):
+                    entry["fetched_at"] = 0
+            self._save()
+
+    def _load(self):
+        if self._entries is None:
+            self._entries = read_json(self.path, {})
+        return self._entries
+
+    def _save(self):
+        write_json_atomic(self.path, self._entries)
@@ -0,0 +1,201 @@
+import threading
+import time
+from bisect import bisect_left
+from contextlib import contextmanager
+
+from .issue_cache import write_json_atomic, write_text_atomic
+
+# Upper bounds, in seconds, of the request latency histogram buckets
+LATENCY_BUCKETS = (0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0, 60.0)
+
+METRIC_PREFIX = "jira_analysis"
+
+
+class Metrics:
+    def __init__(self):
+        """
+        Thread-safe counters, timers and request latency histograms of a run
+
+        Counters and timers are keyed by name and a tuple of label pairs so they
+        map directly onto Prometheus series. Cache lookups are also kept per
+        date in the JSON export, they are too many to be labels.
+        """
+        self.started = time.time()
+        self._lock = threading.Lock()
+        self._counters = {}
+        self._timers = {}
+        self._requests = {}
+        self._cache_dates = {}
+
+    def increment(self, name: str, value: float = 1, **labels):
+        """Add value to the counter name with the given labels"""
+        key = (name, tuple(sorted(labels.items())))
+        with self._lock:
+            self._counters[key] = self._counters.get(key, 0) + value
+
+    def add_time(self, name: str, seconds: float, **labels):
+        """Add a duration to the timer name with the given labels"""
+        key = (name, tuple(sorted(labels.items())))
+        with self._lock:
+            count, total = self._timers.get(key, (0, 0.0))
+            self._timers[key] = (count + 1, total + seconds)
+
+    @contextmanager
+    def timer(self, name: str, **labels):
+        """Time the body of a with statement into the timer name"""
+        started = time.monotonic()
+        try:
+            yield
+        finally:
+            self.add_time(name, time.monotonic() - started, **labels)
+
+    def observe_request(self, endpoint: str, seconds: float, payload_bytes: int, status: int):
+        """
+        Record one HTTP request
+
+        :param endpoint: Endpoint name, e.g. 'search'
+        :param seconds: Time the request took
+        :param payload_bytes: Size of the response body
+        :param status: HTTP status code
+        """
+        with self._lock:
+            stats = self._requests.get(endpoint)
+            if stats is None:
+                stats = self._requests[endpoint] = {
+                    "count": 0,
+                    "seconds": 0.0,
+                    "bytes": 0,
+                    "buckets": [0] * (len(LATENCY_BUCKETS) + 1),
+                    "status": {},
+                }
+            stats["count"] += 1
+            stats["seconds"] += seconds
+            stats["bytes"] += payload_bytes
+            stats["buckets"][bisect_left(LATENCY_BUCKETS, seconds)] += 1
+            stats["status"][str(status)] = stats["status"].get(str(status), 0) + 1
+
+    def record_cache_lookup(self, partition: str, date: str, hit: bool):
+        """Record whether the cache had a date of a partition"""
+        self.increment("cache_hits" if hit else "cache_misses", partition=partition)
+        with self._lock:
+            self._cache_dates.setdefault(partition, {})[date] = "hit" if hit else "miss"
+
+    def to_dict(self):
+        """Everything recorded so far as a JSON serializable dict"""
+        with self._lock:
+            requests = {}
+            for endpoint, stats in self._requests.items():
+                cumulative = 0
+                histogram = {}
+                for bound, count in zip(
+                    [*map(str, LATENCY_BUCKETS), "+Inf"], stats["buckets"]
+                ):
+                    cumulative += count
+                    histogram[bound] = cumulative
+                requests[endpoint] = {
+                    "count": stats["count"],
+                    "seconds": round(stats["seconds"], 6),
+                    "bytes": stats["bytes"],
+                    "status": dict(stats["status"]),
+                    "latency_histogram": histogram,
+                }
+            return {
+                "started": self.started,
+                "wall_seconds": round(time.time() - self.started, 6),
+                "requests": requests,
+                "counters": [
+                    {"name": name, "labels": dict(labels), "value": value}
+                    for (name, labels), value in sorted(self._counters.items())
+                ],
+                "timers": [
+                    {
+                        "name": name,
+                        "labels": dict(labels),
+                        "count": count,
+                        "seconds": round(total, 6),
+                    }
+                    for (name, labels), (count, total) in sorted(self._timers.items())
+                ],
+                "cache_dates": {
+                    partition: dict(sorted(dates.items()))
+                    for partition, dates in self._cache_dates.items()
+                },
+            }
+
+    def to_prometheus(self):
+        """Everything recorded so far in the Prometheus text exposition format"""
+        data = self.to_dict()
+        lines = []
+
+        def metric(name, kind, help_text):
+            lines.append(f"# HELP {METRIC_PREFIX}_{name} {help_text}")
+            lines.append(f"# TYPE {METRIC_PREFIX}_{name} {kind}")
+
+        metric("request_duration_seconds", "histogram", "Jira request latency by endpoint")
+        for endpoint, stats in data["requests"].items():
+            for bound, count in stats["latency_histogram"].items():
+                lines.append(
+                    f'{METRIC_PREFIX}_request_duration_seconds_bucket'
+                    f'{{endpoint="{endpoint}",le="{bound}"}} {count}'
+                )
+            lines.append(
+                f'{METRIC_PREFIX}_request_duration_seconds_sum{{endpoint="{endpoint}"}} {stats["seconds"]}'
+            )
+            lines.append(
+                f'{METRIC_PREFIX}_request_duration_seconds_count{{endpoint="{endpoint}"}} {stats["count"]}'
+            )
+
+        metric("response_bytes_total", "counter", "Bytes of Jira responses by endpoint")
+        for endpoint, stats in data["requests"].items():
+            lines.append(
+                f'{METRIC_PREFIX}_response_bytes_total{{endpoint="{endpoint}"}} {stats["bytes"]}'
+            )
+
+        metric("responses_total", "counter", "Jira responses by endpoint and status")
+        for endpoint, stats in data["requests"].items():
+            for status, count in stats["status"].items():
+                lines.append(
+                    f'{METRIC_PREFIX}_responses_total{{endpoint="{endpoint}",status="{status}"}} {count}'
+                )
+
+        for name in sorted({counter["name"] for counter in data["counters"]}):
+            metric(f"{name}_total", "counter", f"Number of {name.replace('_', ' ')}")
+            for counter in data["counters"]:
+                if counter["name"] == name:
+                    lines.append(
+                        f"{METRIC_PREFIX}_{name}_total{_labels(counter['labels'])} {counter['value']}"
+                    )
+
+        for name in sorted({timer["name"] for timer in data["timers"]}):
+            metric(f"{name}_seconds", "summary", f"Time spent on {name.replace('_', ' ')}")
+            for timer in data["timers"]:
+                if timer["name"] == name:
+                    labels = _labels(timer["labels"])
+                    lines.append(f"{METRIC_PREFIX}_{name}_seconds_sum{labels} {timer['seconds']}")
+                    lines.append(f"{METRIC_PREFIX}_{name}_seconds_count{labels} {timer['count']}")
+
+        metric("run_duration_seconds", "gauge", "Wall time of the run")
+        lines.append(f"{METRIC_PREFIX}_run_duration_seconds {data['wall_seconds']}")
+        return "\n".join(lines) + "\n"
+
+    def write_json(self, path: str):
+        write_json_atomic(path, self.to_dict(), indent=2)
+
+    def write_prometheus(self, path: str):
+        """Write a .prom file, replaced atomically as the textfile collector expects"""
+        write_text_atomic(path, self.to_prometheus())
+
+
+def _labels(labels):
+    if not labels:
+        return ""
+    pairs = ",".join(
+        f'{name}="{_escape(value)}"' for name, value in sorted(labels.items())
+    )
+    return f"{{{pairs}}}"
+
+
+def _escape(value):
+    """Escape a label value for the Prometheus text format"""
+    return str(value).replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
@@ -0,0 +1,79 @@
+import logging
+
+logger = logging.getLogger(__name__)
+
+
+class PageSizer:
+    def __init__(
+        self,
+        initial: int = 100,
+        minimum: int = 10,
+        maximum: int = 1000,
+        target_seconds: float = 5.0,
+        max_bytes: int = 8 * 1024 * 1024,
+    ):
+        """
+        Pick the maxResults of the next search page from how the last pages went
+
+        Pages grow by half while they come back under the target latency and
+        payload size, shrink in proportion when they are slower or bigger, and
+        halve after a timeout. The size never exceeds the cap the server
+        reports in its maxResults.
+
+        :param initial: Size of the first page
+        :param minimum: Smallest page ever requested
+        :param maximum: Largest page ever requested
+        :param target_seconds: Latency a page should stay under
+        :param max_bytes: Payload size a page should stay under
+        """
+        self.size = initial
+        self.minimum = minimum
+        self.maximum = maximum
+        self.target_seconds = target_seconds
+        self.max_bytes = max_bytes
+
+    def observe(self, requested: int, returned: int, seconds: float, payload_bytes: int, server_max: int = None):
+        """
+        Adjust the size from a completed page
+
+        :param requested: maxResults sent
+        :param returned: Number of issues in the page
+        :param seconds: Time the page took
+        :param payload_bytes: Size of the response body
+        :param server_max: maxResults echoed by the server, its effective cap
+        """
+        if server_max and server_max < requested:
+            self.maximum = max(self.minimum, server_max)
+            self._resize(min(self.size, server_max), f"server caps pages at {server_max}")
+            return
+
+        # A short last page says nothing about how big pages could be
+        if returned < requested:
+            return
+
+        reason = f"{seconds:.1f}s, {payload_bytes / 1024 / 1024:.1f} MB for {returned} issues"
+        ratio = min(
+            self.target_seconds / max(seconds, 0.001),
+            self.max_bytes / max(payload_bytes, 1),
+        )
+        if ratio < 1:
+            self._resize(int(requested * ratio), reason)
+        elif ratio > 1.5:
+            self._resize(int(requested * 1.5), reason)
+
+    def shrink_after_timeout(self) -> bool:
+        """
+        Halve the size after a page timed out
+
+        :return: False when the size is already at the minimum
+        """
+        if self.size <= self.minimum:
+            return False
+        self._resize(self.size // 2, "page timed out")
+        return True
+
+    def _resize(self, size, reason):
+        size = min(max(size, self.minimum), self.maximum)
+        if size != self.size:
+            logger.info("Page size %d -> %d: %s", self.size, size, reason)
+            self.size = size
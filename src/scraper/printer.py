@@ -1,10 +1,14 @@
-from rich import print as rprint
-from rich.text import Text
+import json
+import sys
 from .formatters import (
     format_sprint_field,
     format_development_field,
     format_resolution_field,
 )
+from .issue_model import as_issue
+
+
+OUTPUT_FORMATS = ["text", "ndjson", "json"]
 
 
 class JiraPrinter:
@@ -26,6 +30,11 @@ class JiraPrinter:
             print(f"  {field_key}: {field_value}")
 
     def print_issues(self, issues, total_available, timeframe, custom_fields):
+        # rich is only needed for the summary, keep it off the import path of eod
+        from rich import print as rprint
+        from rich.text import Text
+
+        issues = [as_issue(issue, custom_fields) for issue in issues]
         for issue in issues:
             self._print_single_issue(issue, custom_fields)
 
@@ -42,83 +51,222 @@ class JiraPrinter:
 
     def print_eod(self, issues):
         for issue in issues:
-            fields = issue["fields"]
-
-            # Get status changes count
-            changelog = issue.get("changelog", {}).get("histories", [])
-            todo_count = sum(
-                1
-                for history in changelog
-                for item in history.get("items", [])
-                if item.get("field") == "status" and item.get("toString") == "To Do"
-            )
-
-            # Get current status
-            current_status = fields.get("status", {}).get("name", "Unknown")
-
-            # Get latest comment
-            comments = fields.get("comment", {}).get("comments", [])
-            latest_comment = "No comments"
-            if comments:
-                latest = comments[-1]
-                author = latest.get("author", {}).get("displayName")
-                comment_body = self._format_comment_body(latest.get("body"))
-                latest_comment = (
-                    f"{author}: {comment_body[:100]}..."  # Truncate long comments
-                )
-
-            # Get custom fields
-            
-
-            # Get fix versions
-            fix_versions = [v.get("name", "") for v in fields.get("fixVersions", [])]
+            report = self.eod_to_dict(issue)
+            fix_versions = report["fix_versions"]
 
             # Print concise report
             print("\n" + "=" * 80)
-            print(f"Issue: {issue.get('key')} - {fields.get('summary')}")
-            print(f"Current Status: {current_status}")
-            print(f"Times in To Do: {todo_count}")
+            print(f"Issue: {report['key']} - {report['summary']}")
+            print(f"Current Status: {report['status']}")
+            print(f"Times in To Do: {report['times_in_todo']}")
             print(
                 f"Fix Versions: {', '.join(fix_versions) if fix_versions else 'None'}"
             )
-            print(f"Latest Comment: {latest_comment}")
+            print(f"Latest Comment: {report['latest_comment']}")
             print("=" * 80)
 
+    def print_team_eod(self, issues):
+        issues_by_assignee = {}
+        for issue in issues:
+            issue = as_issue(issue)
+            issues_by_assignee.setdefault(issue.assignee or "Unassigned", []).append(issue)
+
+        for name, assignee_issues in sorted(issues_by_assignee.items()):
+            print("\n" + "#" * 80)
+            print(f"# {name} - {len(assignee_issues)} issues")
+            print("#" * 80)
+            self.print_eod(assignee_issues)
+
+    def print_search_results(self, results):
+        if not results:
+            print("No matching issues")
+            return
+        for result in results:
+            print("\n" + "=" * 80)
+            print(f"{result['key']} - {result['summary']} (score {result['score']})")
+            print(f"  {result['snippet']}")
+        print("=" * 80)
+
+    def print_issue_links(self, report):
+        print("\n" + "=" * 80)
+        print(f"Issue: {report['key']}")
+        print(f"Parent: {', '.join(report['parent']) or 'None'}")
+        print(f"Blocks: {', '.join(report['blocks']) or 'None'}")
+        print("Blocked by:")
+        for blocker in report["blocked_by"] or [{"key": "None", "distance": 0}]:
+            indent = "  " * max(blocker["distance"], 1)
+            print(f"{indent}- {blocker['key']}")
+        print(f"Tickets under it: {len(report['rollup'])}")
+        print(f"Linked cluster size: {report['cluster_size']}")
+        print("=" * 80)
+
+    def print_sprint_stats(self, records):
+        if not records:
+            print("No sprints found in the cache")
+            return
+        print(
+            f"\n{'Sprint':<30} {'State':<8} {'Start':<10} "
+            f"{'Committed':>10} {'Completed':>10} {'Carry-over':>10} {'Velocity':>9}"
+        )
+        print("-" * 93)
+        for record in records:
+            start = (record["Start"] or "")[:10]
+            velocity = record["Velocity"]
+            print(
+                f"{str(record['Sprint'])[:30]:<30} {record['State'] or '':<8} {start:<10} "
+                f"{record['Committed Points']:>10.1f} {record['Completed Points']:>10.1f} "
+                f"{record['Carry-over Rate']:>10.0%} "
+                f"{'' if velocity is None else f'{velocity:.1f}':>9}"
+            )
+
+    def print_sync_summary(self, results, wall_seconds, stream=None):
+        """
+        Totals, pages, bytes and time of each project of a multi-project fetch
+
+        :param results: Dict returned by JiraRequester.sync_projects
+        :param wall_seconds: Time the whole fetch took
+        :param stream: Text stream to write to, defaults to stdout
+        """
+        stream = stream or sys.stdout
+        print(
+            f"\n{'Project':<12} {'Issues':>8} {'Pages':>6} {'MB':>8} {'Seconds':>8}  Status",
+            file=stream,
+        )
+        print("-" * 60, file=stream)
+        for project_key, result in results.items():
+            print(
+                f"{project_key:<12} {result['total']:>8} {result['pages']:>6} "
+                f"{result['bytes'] / 1024 / 1024:>8.1f} {result['seconds']:>8.1f}  "
+                f"{'failed: ' + result['error'] if result['error'] else 'ok'}",
+                file=stream,
+            )
+        print("-" * 60, file=stream)
+        print(
+            f"{'Total':<12} {sum(r['total'] for r in results.values()):>8} "
+            f"{sum(r['pages'] for r in results.values()):>6} "
+            f"{sum(r['bytes'] for r in results.values()) / 1024 / 1024:>8.1f} "
+            f"{wall_seconds:>8.1f}",
+            file=stream,
+        )
+
+    def write_records(self, records, output_format, stream=None):
+        """
+        Stream records as NDJSON (one compact object per line) or as a JSON array
+
+        Records are serialized one at a time through the buffered stream, so
+        consumers can start reading before the last record is written.
+
+        :param records: Iterable of JSON serializable dicts
+        :param output_format: "ndjson" or "json"
+        :param stream: Text stream to write to, defaults to stdout
+        """
+        stream = stream or sys.stdout
+        separator = "\n" if output_format == "ndjson" else ",\n"
+        if output_format == "json":
+            stream.write("[\n")
+
+        first = True
+        for record in records:
+            if not first:
+                stream.write(separator)
+            stream.write(
+                json.dumps(
+                    record, separators=(",", ":"), ensure_ascii=False, default=str
+                )
+            )
+            first = False
+
+        stream.write("\n]\n" if output_format == "json" else ("" if first else "\n"))
+        stream.flush()
+
+    def write_issues(self, issues, custom_fields, output_format, stream=None):
+        self.write_records(
+            (self.issue_to_dict(issue, custom_fields) for issue in issues),
+            output_format,
+            stream,
+        )
+
+    def write_eod(self, issues, output_format, stream=None):
+        self.write_records(
+            (self.eod_to_dict(issue) for issue in issues), output_format, stream
+        )
+
+    def issue_to_dict(self, issue, custom_fields):
+        """Project an issue to the fields shown by print_issues"""
+        issue = as_issue(issue, custom_fields)
+        return {
+            "key": issue.key,
+            "summary": issue.summary,
+            "status": issue.status or "Unknown",
+            "issue_type": issue.issue_type,
+            "created": issue.created,
+            "updated": issue.updated,
+            "priority": issue.priority,
+            "reporter": issue.reporter,
+            "assignee": issue.assignee,
+            "fix_versions": list(issue.fix_versions),
+            "parent": issue.parent_key,
+            "custom_fields": self._format_custom_fields(issue.custom_fields, custom_fields),
+            "linked_issues": self._linked_issues(issue),
+            "comments": [
+                dict(comment, body=self._format_comment_body(comment["body"]))
+                for comment in issue.comments
+            ],
+            "status_history": issue.status_changes,
+        }
+
+    def eod_to_dict(self, issue):
+        """Project an issue to the fields shown by print_eod"""
+        issue = as_issue(issue)
+
+        # Get status changes count
+        todo_count = sum(1 for change in issue.status_changes if change["to"] == "To Do")
+
+        # Get latest comment
+        comments = issue.comments
+        latest_comment = "No comments"
+        if comments:
+            latest = comments[-1]
+            comment_body = self._format_comment_body(latest["body"])
+            latest_comment = (
+                f"{latest['author']}: {comment_body[:100]}..."  # Truncate long comments
+            )
+
+        return {
+            "key": issue.key,
+            "summary": issue.summary,
+            "assignee": issue.assignee,
+            "status": issue.status or "Unknown",
+            "times_in_todo": todo_count,
+            "fix_versions": list(issue.fix_versions),
+            "latest_comment": latest_comment,
+        }
+
     # Private helper methods
     def _print_single_issue(self, issue, custom_fields):
-        fields = issue["fields"]
         # Basic info
-        print(f"\nIssue Key: {issue.get('key')}")
-        print(f"Summary: {fields.get('summary')}")
-        print(f"Status: {fields.get('status', {}).get('name', 'Unknown')}")
-        print(f"Created: {fields.get('created')}")
-        print(f"Updated: {fields.get('updated')}")
+        print(f"\nIssue Key: {issue.key}")
+        print(f"Summary: {issue.summary}")
+        print(f"Status: {issue.status or 'Unknown'}")
+        print(f"Created: {issue.created}")
+        print(f"Updated: {issue.updated}")
 
         # Priority, Reporter, Assignee
-        priority = fields.get("priority")
-        priority_name = priority.get("name") if priority else "No Priority"
-        print(f"Priority: {priority_name}")
-
-        reporter = fields.get("reporter", {})
-        assignee = fields.get("assignee", {})
-        reporter_name = reporter.get("displayName") if reporter else "Unassigned"
-        assignee_name = assignee.get("displayName") if assignee else "Unassigned"
-        print(f"Reporter: {reporter_name}")
-        print(f"Assignee: {assignee_name}")
+        print(f"Priority: {issue.priority or 'No Priority'}")
+        print(f"Reporter: {issue.reporter or 'Unassigned'}")
+        print(f"Assignee: {issue.assignee or 'Unassigned'}")
 
         # Fix Versions
-        fix_versions = [v.get("name", "") for v in fields.get("fixVersions", [])]
+        fix_versions = issue.fix_versions
         print(f"Fix Versions: {', '.join(fix_versions) if fix_versions else 'None'}")
 
         # Parent Ticket
-        parent = fields.get("parent", {})
-        parent_key = parent.get("key") if parent else None
-        if parent_key:
-            print(f"Parent Ticket: {parent_key}")
+        if issue.parent_key:
+            print(f"Parent Ticket: {issue.parent_key}")
 
-        self._print_custom_fields(fields, custom_fields)
-        self._print_linked_issues(fields)
-        self._print_comments(fields)
+        self._print_custom_fields(issue.custom_fields, custom_fields)
+        self._print_linked_issues(issue)
+        self._print_comments(issue)
 
         # Add changelog printing
         self._print_status_history(issue)
@@ -126,19 +274,23 @@ class JiraPrinter:
         print("---")
 
     def _print_status_history(self, issue):
-        changelog = issue.get("changelog", {}).get("histories", [])
-        if changelog:
+        status_changes = issue.status_changes
+        if status_changes:
             print("\nStatus Changes:")
-            for history in changelog:
-                for item in history.get("items", []):
-                    if item.get("field") == "status":
-                        print(
-                            f"  {history.get('created')} - "
-                            f"{history.get('author', {}).get('displayName')}: "
-                            f"{item.get('fromString')} → {item.get('toString')}"
-                        )
+            for change in status_changes:
+                print(
+                    f"  {change['date']} - {change['author']}: "
+                    f"{change['from']} → {change['to']}"
+                )
 
     def _print_custom_fields(self, fields, custom_fields):
+        for field_name, formatted_value in self._format_custom_fields(
+            fields, custom_fields
+        ).items():
+            print(f"{field_name}: {formatted_value}")
+
+    def _format_custom_fields(self, fields, custom_fields):
+        formatted = {}
         for field_key, field_value in fields.items():
             if (
                 field_key.startswith("customfield_")
@@ -149,10 +301,10 @@ class JiraPrinter:
                     field_name = field_info.get("name", field_key)
                     field_type = field_info.get("type", "unknown")
 
-                    formatted_value = self._format_custom_field(
+                    formatted[field_name] = self._format_custom_field(
                         field_value, field_name, field_type
                     )
-                    print(f"{field_name}: {formatted_value}")
+        return formatted
 
     def _format_custom_field(self, field_value, field_name, field_type):
         if field_name == "Sprint":
@@ -169,28 +321,26 @@ class JiraPrinter:
             return field_value.get("value", str(field_value))
         return field_value
 
-    def _print_linked_issues(self, fields):
-        linked_issues = fields.get("issuelinks", [])
+    def _print_linked_issues(self, issue):
+        linked_issues = self._linked_issues(issue)
         if linked_issues:
             print("Linked Issues:")
             for link in linked_issues:
-                link_type = link.get("type", {}).get("name", "Unknown")
-                outward_issue = link.get("outwardIssue", {}).get("key")
-                inward_issue = link.get("inwardIssue", {}).get("key")
-                if outward_issue:
-                    print(f"  - {link_type}: {outward_issue}")
-                if inward_issue:
-                    print(f"  - {link_type}: {inward_issue}")
-
-    def _print_comments(self, fields):
-        comments = fields.get("comment", {}).get("comments", [])
+                print(f"  - {link['type']}: {link['key']}")
+
+    def _linked_issues(self, issue):
+        return [
+            {"type": link_type or "Unknown", "key": key}
+            for link_type, _, key in issue.links
+        ]
+
+    def _print_comments(self, issue):
+        comments = issue.comments
         if comments:
             print("\nComments:")
             for comment in comments:
-                author = comment.get("author", {}).get("displayName")
-                created = comment.get("created")
-                body = self._format_comment_body(comment.get("body"))
-                print(f"  {created} - {author}:")
+                body = self._format_comment_body(comment["body"])
+                print(f"  {comment['created']} - {comment['author']}:")
                 print(f"  {body}\n")
 
     def _format_comment_body(self, body):
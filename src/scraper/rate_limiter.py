@@ -0,0 +1,169 @@
+import logging
+import os
+import random
+import threading
+import time
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
+
+logger = logging.getLogger(__name__)
+
+# Token cost of each endpoint, a search page with the changelog expanded costs
+# Jira a lot more than a metadata lookup
+DEFAULT_ENDPOINT_COSTS = {
+    "search": 5.0,
+    "changelog": 2.0,
+    "field": 1.0,
+    "project": 1.0,
+    "board": 1.0,
+    "user": 1.0,
+}
+
+
+class RateLimitPolicy:
+    def __init__(
+        self,
+        requests_per_second: float = 10.0,
+        burst: float = 20.0,
+        endpoint_costs=None,
+        min_requests_per_second: float = 0.5,
+        max_retries: int = 5,
+    ):
+        """
+        Client side rate limit applied to every request of a JiraRequester
+
+        :param requests_per_second: Starting and maximum refill rate, in tokens per second
+        :param burst: Bucket size, the number of tokens that can be spent at once
+        :param endpoint_costs: Tokens taken per request by endpoint name, 1 for unknown endpoints
+        :param min_requests_per_second: Floor the rate never drops below when throttled
+        :param max_retries: Retries of a throttled request before giving up
+        """
+        self.requests_per_second = requests_per_second
+        self.burst = burst
+        self.endpoint_costs = dict(DEFAULT_ENDPOINT_COSTS, **(endpoint_costs or {}))
+        self.min_requests_per_second = min_requests_per_second
+        self.max_retries = max_retries
+
+    @classmethod
+    def from_env(cls):
+        """Policy from JIRA_RATE_LIMIT (requests per second) and JIRA_RATE_BURST"""
+        return cls(
+            requests_per_second=float(os.getenv("JIRA_RATE_LIMIT", "10")),
+            burst=float(os.getenv("JIRA_RATE_BURST", "20")),
+        )
+
+    def cost(self, endpoint: str) -> float:
+        return self.endpoint_costs.get(endpoint, 1.0)
+
+
+class RateLimiter:
+    def __init__(self, policy: RateLimitPolicy = None):
+        """
+        Thread-safe token bucket shared by every request of a requester
+
+        The refill rate adapts to Jira's answers: it is halved on a 429 or when
+        Jira reports the client is near its limit, and creeps back up towards
+        the policy rate while requests go through.
+
+        :param policy: Rate limit policy, defaults to RateLimitPolicy.from_env()
+        """
+        self.policy = policy or RateLimitPolicy.from_env()
+        self.rate = self.policy.requests_per_second
+        self.tokens = self.policy.burst
+        self._updated = time.monotonic()
+        self._paused_until = 0.0
+        self._lock = threading.Lock()
+
+    def acquire(self, endpoint: str):
+        """Block until the endpoint's cost can be taken from the bucket"""
+        cost = min(self.policy.cost(endpoint), self.policy.burst)
+        while True:
+            with self._lock:
+                now = time.monotonic()
+                self._refill(now)
+                wait = self._paused_until - now
+                if wait <= 0:
+                    if self.tokens >= cost:
+                        self.tokens -= cost
+                        return
+                    wait = (cost - self.tokens) / self.rate
+            time.sleep(wait)
+
+    def observe(self, response, attempt: int = 0) -> float:
+        """
+        Adjust the rate from a response
+
+        :param response: requests.Response
+        :param attempt: Number of times the request was already retried
+        :return: Seconds to wait before retrying, 0 when the response is final
+        """
+        headers = response.headers
+        with self._lock:
+            if response.status_code == 429 or (
+                response.status_code == 503 and "Retry-After" in headers
+            ):
+                self._set_rate(self.rate / 2, f"throttled with {response.status_code}")
+                delay = _retry_after(headers)
+                if delay is None:
+                    delay = min(60.0, 2**attempt) + random.uniform(0, 1)
+                self._paused_until = max(self._paused_until, time.monotonic() + delay)
+                self.tokens = 0.0
+                return delay
+
+            if headers.get("X-RateLimit-NearLimit", "").lower() == "true":
+                self._set_rate(self.rate * 0.75, "near the rate limit")
+            elif self.rate < self.policy.requests_per_second:
+                # Additive increase, a tenth of the policy rate per successful request
+                self._set_rate(
+                    self.rate + self.policy.requests_per_second / 10, None
+                )
+
+            remaining = headers.get("X-RateLimit-Remaining")
+            reset = _reset_seconds(headers.get("X-RateLimit-Reset"))
+            if remaining is not None and reset:
+                budget = float(remaining) / reset
+                if budget < self.rate:
+                    self._set_rate(budget, f"{remaining} requests left for {reset:.0f}s")
+        return 0.0
+
+    def _refill(self, now):
+        self.tokens = min(self.policy.burst, self.tokens + (now - self._updated) * self.rate)
+        self._updated = now
+
+    def _set_rate(self, rate, reason):
+        rate = min(
+            max(rate, self.policy.min_requests_per_second),
+            self.policy.requests_per_second,
+        )
+        if rate == self.rate:
+            return
+        self._refill(time.monotonic())
+        if reason:
+            logger.info("Rate limit %.2f -> %.2f requests/s: %s", self.rate, rate, reason)
+        self.rate = rate
+
+
+def _retry_after(headers):
+    """Seconds from a Retry-After header, which is either seconds or an HTTP date"""
+    value = headers.get("Retry-After")
+    if not value:
+        return None
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+    try:
+        return max(0.0, parsedate_to_datetime(value).timestamp() - time.time())
+    except (TypeError, ValueError):
+        return None
+
+
+def _reset_seconds(value):
+    """Seconds until an X-RateLimit-Reset header, an ISO timestamp"""
+    if not value:
+        return None
+    try:
+        reset = datetime.fromisoformat(value.replace("Z", "+00:00"))
+        return max(1.0, (reset - datetime.now(timezone.utc)).total_seconds())
+    except ValueError:
+        return None
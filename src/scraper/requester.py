@@ -1,20 +1,41 @@
 import requests
+import hashlib
+from concurrent.futures import ThreadPoolExecutor
 import json
 from typing import Dict, List, Any
 from datetime import datetime, timedelta
 import csv
 from pathlib import Path
 import os
+import sys
+import time
+from .issue_cache import read_json, update_json, write_json_atomic
+from .issue_store import IssueStore
+from .metadata_cache import MetadataCache
+from .metrics import Metrics
+from .page_sizer import PageSizer
+from .rate_limiter import RateLimiter, RateLimitPolicy
 
 
 class JiraRequester:
-    def __init__(self, base_url: str, username: str, api_token: str):
+    def __init__(
+        self,
+        base_url: str,
+        username: str,
+        api_token: str,
+        rate_limit: RateLimitPolicy = None,
+        metadata_cache: MetadataCache = None,
+        metrics: Metrics = None,
+    ):
         """
         Initialize Jira Requester
 
         :param base_url: Base URL of your Jira instance (e.g., 'https://yourcompany.atlassian.net')
         :param username: Your Jira username (usually email)
         :param api_token: Jira API token
+        :param rate_limit: Client side rate limit, defaults to RateLimitPolicy.from_env()
+        :param metadata_cache: Cache of field, project and board metadata, defaults to config/jira_metadata.json
+        :param metrics: Where requests, cache lookups and timings are recorded
         """
         self.base_url = base_url
         self.auth = (username, api_token)
@@ -22,21 +43,106 @@ class JiraRequester:
             "Accept": "application/json",
             "Content-Type": "application/json",
         }
+        # Every request goes through _request so they all share one token bucket
+        self.rate_limiter = RateLimiter(rate_limit)
+        # Search pages adapt their size to how long the previous ones took
+        self.page_sizer = PageSizer()
+        self.page_timeout = float(os.getenv("JIRA_PAGE_TIMEOUT", "60"))
+        # Truncated changelogs are completed with these many requests in flight,
+        # through the bulk endpoint until the instance turns out not to have it
+        self.changelog_workers = int(os.getenv("JIRA_CHANGELOG_WORKERS", "8"))
+        self.bulk_changelog = True
+        self.session = requests.Session()
+        self.session.auth = self.auth
+        self.session.headers.update(self.headers)
+        # Enough pooled connections for the threads of a multi-project sync
+        pool_size = int(os.getenv("JIRA_MAX_CONNECTIONS", "16"))
+        adapter = requests.adapters.HTTPAdapter(
+            pool_connections=pool_size, pool_maxsize=pool_size
+        )
+        self.session.mount("https://", adapter)
+        self.session.mount("http://", adapter)
+        self.metadata_cache = metadata_cache or MetadataCache()
+        self.metrics = metrics or Metrics()
 
-    def init_custom_fields(self) -> Dict[str, Any]:
+    def _request(self, method: str, endpoint: str, url: str, **kwargs):
         """
-        Get all custom fields configured in Jira and store them in config/jira_custom_fields.json
+        Send a request once the rate limiter allows it, retrying throttled ones
+
+        :param method: HTTP method
+        :param endpoint: Endpoint name used to look up the request cost, e.g. 'search'
+        :param url: Full URL
+        :return: requests.Response of the last attempt, its seconds attribute is
+            the time the request took, without waiting for the rate limiter
         """
-        url = f"{self.base_url}/rest/api/3/field"
-        auth = self.auth
-        headers = self.headers
+        for attempt in range(self.rate_limiter.policy.max_retries + 1):
+            self.rate_limiter.acquire(endpoint)
+            started = time.monotonic()
+            response = self.session.request(method, url, **kwargs)
+            response.seconds = time.monotonic() - started
+            self.metrics.observe_request(
+                endpoint, response.seconds, len(response.content), response.status_code
+            )
+            delay = self.rate_limiter.observe(response, attempt)
+            if not delay or attempt == self.rate_limiter.policy.max_retries:
+                return response
+            self.metrics.increment("retries", endpoint=endpoint)
+            print(
+                f"Throttled by Jira on {endpoint}, retrying in {delay:.1f}s",
+                file=sys.stderr,
+            )
+        return response
+
+    def _get_metadata(self, resource: str, key: str, url: str, refresh: bool = False):
+        """
+        Get a metadata resource from the cache, asking Jira only once it expired
 
-        response = requests.get(url, auth=auth, headers=headers)
+        An expired entry is revalidated with its ETag / Last-Modified, a 304
+        answer keeps the cached data for another TTL.
+
+        :param resource: Resource type, its TTL and the rate limiter endpoint name
+        :param key: Cache key
+        :param url: Full URL of the resource
+        :param refresh: If True, revalidate even when the entry is fresh
+        :return: Tuple of (data, changed), changed is False when the cached data was used
+        """
+        cache = self.metadata_cache
+        entry = cache.get(key)
+        if not refresh and cache.is_fresh(resource, entry):
+            self.metrics.increment("metadata_cache_hits", resource=resource)
+            return entry["data"], False
+
+        response = self._request(
+            "GET", resource, url, headers=cache.conditional_headers(entry)
+        )
+        if response.status_code == 304 and entry is not None:
+            self.metrics.increment("metadata_cache_revalidations", resource=resource)
+            cache.touch(key)
+            return entry["data"], False
         response.raise_for_status()
 
+        self.metrics.increment("metadata_cache_misses", resource=resource)
+        with self.metrics.timer("json_parse", endpoint=resource):
+            data = response.json()
+        cache.put(key, data, response)
+        return data, entry is None or entry["data"] != data
+
+    def init_custom_fields(self, refresh: bool = False) -> Dict[str, Any]:
+        """
+        Get all custom fields configured in Jira and store them in config/jira_custom_fields.json
+
+        The field list comes from the metadata cache, so this only reaches
+        Jira once its TTL expired and the file is only rewritten when fields
+        were added or changed.
+
+        :param refresh: If True, revalidate the field list even when it is fresh
+        """
+        url = f"{self.base_url}/rest/api/3/field"
+        fields, changed = self._get_metadata("field", "field", url, refresh)
+
         # Filter for custom fields only and format the output
         custom_fields = {}
-        for field in response.json():
+        for field in fields:
             if field.get("custom", False):
                 custom_fields[field["id"]] = {
                     "name": field.get("name"),
@@ -44,34 +150,38 @@ class JiraRequester:
                     "type": field.get("schema", {}).get("type"),
                 }
 
-        # Create config directory if it doesn't exist
-        os.makedirs("config", exist_ok=True)
+        if changed or not os.path.exists("config/jira_custom_fields.json"):
+            # Create config directory if it doesn't exist
+            os.makedirs("config", exist_ok=True)
 
-        # Write custom fields to JSON file
-        with open("config/jira_custom_fields.json", "w") as f:
-            json.dump(custom_fields, f, indent=2)
+            # Write custom fields to JSON file
+            with open("config/jira_custom_fields.json", "w") as f:
+                json.dump(custom_fields, f, indent=2)
 
         return custom_fields
 
-    def get_project_details(self, project_key: str) -> Dict[str, Any]:
+    def get_project_details(self, project_key: str, refresh: bool = False) -> Dict[str, Any]:
         """
         Fetch comprehensive details for a specific project
 
         :param project_key: Jira project key (e.g., 'PROJ')
+        :param refresh: If True, revalidate the cached details even when they are fresh
         :return: Dictionary with project details
         """
         project_url = f"{self.base_url}/rest/api/3/project/{project_key}"
-        response = requests.get(project_url, auth=self.auth, headers=self.headers)
-        response.raise_for_status()
+        data, changed = self._get_metadata(
+            "project", f"project:{project_key}", project_url, refresh
+        )
 
-        # Save response to CSV with fields as columns
-        data = response.json()
         output_dir = Path("raw_data")
         output_dir.mkdir(exist_ok=True)
+        csv_path = output_dir / f"{project_key}_project_details.csv"
+        if not changed and csv_path.exists():
+            return data
 
         # Flatten the data and write to CSV
         with open(
-            output_dir / f"{project_key}_project_details.csv",
+            csv_path,
             "w",
             newline="",
             encoding="utf-8",
@@ -84,6 +194,31 @@ class JiraRequester:
 
         return data
 
+    def refresh_metadata(self, project_key: str) -> Dict[str, bool]:
+        """
+        Revalidate the cached field, project and board metadata of a project
+
+        :param project_key: Jira project key
+        :return: Whether each resource changed, by resource type
+        """
+        keys = {
+            "field": "field",
+            "project": f"project:{project_key}",
+            "board": f"board:{project_key}",
+        }
+        before = {
+            resource: (self.metadata_cache.get(key) or {}).get("data")
+            for resource, key in keys.items()
+        }
+        self.init_custom_fields(refresh=True)
+        self.get_project_details(project_key, refresh=True)
+        self.get_board_configuration(project_key, refresh=True)
+        return {
+            resource: before[resource]
+            != (self.metadata_cache.get(key) or {}).get("data")
+            for resource, key in keys.items()
+        }
+
     def get_date_range(self, timeframe: str | List[str]) -> tuple[str, str]:
         """
         Get JQL date range based on timeframe or date range string
@@ -184,23 +319,33 @@ class JiraRequester:
         assignees: List[str] = None,
         skip_cache: bool = False,
         excluded_status: List[str] = None,
+        resume: bool = True,
+        page_sizer: PageSizer = None,
+        stats: Dict[str, Any] = None,
     ) -> tuple[List[Dict[str, Any]], int]:
         """
         Fetch all issues for a project with detailed information, using cache when available
 
+        Every page is written to the cache as it arrives and the progress is
+        checkpointed, so an interrupted fetch of the same JQL picks up at the
+        page where it stopped.
+
         :param project_key: Jira project key
         :param timeframe: Dictionary specifying date range for issues
         :param assignees: List of assignees to filter issues
         :param skip_cache: If True, bypass cache and fetch fresh data
+        :param resume: If False, ignore the checkpoint of an interrupted fetch and start over
+        :param page_sizer: Page sizer of the search, defaults to the requester's
+        :param stats: Dict the search adds its pages, bytes and seconds to
         :return: Tuple of (issues list, total number of issues)
         """
         output_dir = Path("raw_data") / f"{project_key}_issues"
+        store = IssueStore(output_dir)
         cached_issues = {}
         dates_to_fetch = set()
 
-        ## Initialize custom fields if not already initialized
-        if not os.path.exists("config/jira_custom_fields.json"):
-            self.init_custom_fields()
+        ## Initialize custom fields, picking up new ones once the cached list expired
+        self.init_custom_fields()
 
         # Determine date range
         for field, value in timeframe.items():
@@ -216,33 +361,11 @@ class JiraRequester:
         # If not skipping cache, attempt to load cached data
         if not skip_cache:
             if output_dir.exists():
-                for date_str in list(
-                    dates_to_fetch
-                ):  # Create a copy to modify during iteration
-                    date = datetime.strptime(date_str, "%Y-%m-%d")
-                    year_dir = output_dir / str(date.year)
-                    month_name = {
-                        1: "january",
-                        2: "february",
-                        3: "march",
-                        4: "april",
-                        5: "may",
-                        6: "june",
-                        7: "july",
-                        8: "august",
-                        9: "september",
-                        10: "october",
-                        11: "november",
-                        12: "december",
-                    }[date.month]
-
-                    json_path = year_dir / month_name / "issues.json"
-                    if json_path.exists():
-                        with open(json_path, "r", encoding="utf-8") as f:
-                            month_data = json.load(f)
-                            if date_str in month_data:
-                                cached_issues[date_str] = month_data[date_str]
-                                dates_to_fetch.remove(date_str)
+                # The field index only lists dates that were fetched in full
+                with self.metrics.timer("cache_read", partition=output_dir.name):
+                    cached_issues, dates_to_fetch = store.lookup(
+                        field, dates_to_fetch, self.metrics
+                    )
 
             # If all dates are in cache, return cached data
             if not dates_to_fetch:
@@ -289,150 +412,567 @@ class JiraRequester:
 
         jql += f" ORDER BY {field} DESC"
 
-        print(f"\nExecuting JQL: {jql}")
+        print(f"\nExecuting JQL: {jql}", file=sys.stderr)
 
-        # Fetch new issues
-        all_issues = []
-        new_issues_by_date = {}
-        issues_url = f"{self.base_url}/rest/api/3/search"
-        batch_size = 100
-        start_at = 0
+        # Resume an interrupted fetch of the same query
+        checkpoint_path = self._checkpoint_path(output_dir, jql)
+        checkpoint = self._load_checkpoint(checkpoint_path) if resume else None
+        if checkpoint:
+            print(
+                f"Resuming from issue {checkpoint['start_at']} "
+                f"({checkpoint['pages']} pages already cached), use --restart to start over",
+                file=sys.stderr,
+            )
+            all_issues = list(store.load(checkpoint["homes"]).values())
+        else:
+            checkpoint = {
+                "jql": jql,
+                "field": field,
+                "start_at": 0,
+                "pages": 0,
+                "homes": {},
+            }
+            all_issues = []
 
         try:
-            while True:
-                payload = {
-                    "jql": jql,
-                    "maxResults": batch_size,
-                    "startAt": start_at,
-                    "fields": ["*all"],
-                    "expand": ["changelog"],
-                }
+            for batch_issues in self.iter_search_pages(
+                jql, checkpoint["start_at"], page_sizer, stats
+            ):
+                all_issues.extend(
+                    issue for issue in batch_issues if issue.get("fields", {}).get(field)
+                )
+
+                # Pages only go to the month files, the indexes are updated once
+                # the whole query is fetched, the checkpoint keeps the keys until then
+                with self.metrics.timer("cache_write", partition=output_dir.name):
+                    homes = store.put(batch_issues, index=False)
+
+                checkpoint["start_at"] += len(batch_issues)
+                checkpoint["pages"] += 1
+                checkpoint["homes"].update(homes)
+                self._save_checkpoint(checkpoint_path, checkpoint)
+
+        except requests.exceptions.RequestException as e:
+            print(f"Error making request: {str(e)}", file=sys.stderr)
+            if hasattr(e, "response") and e.response is not None:
+                print(f"Response content: {e.response.text}", file=sys.stderr)
+            print(
+                f"Progress saved after {checkpoint['pages']} pages, "
+                "run the same command again to resume",
+                file=sys.stderr,
+            )
+            raise
 
-                response = requests.post(
-                    issues_url, json=payload, auth=self.auth, headers=self.headers
+        # Pages shift when issues change during a resumed fetch, drop repeats
+        all_issues = list({issue["key"]: issue for issue in all_issues}.values())
+
+        # Filtered queries only fetched part of each date
+        with self.metrics.timer("cache_write", partition=output_dir.name):
+            if not assignees and not excluded_status:
+                issues_by_date = {}
+                for issue in all_issues:
+                    date = issue["fields"][field].split("T")[0]
+                    issues_by_date.setdefault(date, []).append(issue)
+                store.record(issues_by_date, field)
+            else:
+                store.place(checkpoint["homes"])
+
+        if checkpoint_path.exists():
+            checkpoint_path.unlink()
+
+        return all_issues, len(all_issues)
+
+    def sync_projects(
+        self,
+        project_keys: List[str],
+        timeframe: Dict[str, Any],
+        assignees: List[str] = None,
+        skip_cache: bool = False,
+        resume: bool = True,
+        max_workers: int = None,
+    ) -> Dict[str, Dict[str, Any]]:
+        """
+        Fetch the issues of several projects at the same time
+
+        The projects share this requester's connection pool and rate limiter,
+        each keeps its own page sizer and is written to its own
+        raw_data/<KEY>_issues partition. A failing project doesn't stop the
+        others.
+
+        :param project_keys: Jira project keys
+        :param timeframe: Dictionary specifying date range for issues
+        :param assignees: List of assignees to filter issues
+        :param skip_cache: If True, bypass cache and fetch fresh data
+        :param resume: If False, ignore the checkpoints of interrupted fetches and start over
+        :param max_workers: Projects fetched at once, defaults to all of them
+        :return: Dict by project key with issues, total, pages, bytes, seconds and error
+        """
+        # Written once up front rather than raced by every project
+        self.init_custom_fields()
+
+        def sync(project_key):
+            stats = {"issues": [], "total": 0, "error": None}
+            started = time.monotonic()
+            try:
+                stats["issues"], stats["total"] = self.get_project_issues(
+                    project_key,
+                    timeframe,
+                    assignees,
+                    skip_cache=skip_cache,
+                    resume=resume,
+                    page_sizer=PageSizer(),
+                    stats=stats,
                 )
+            except (requests.exceptions.RequestException, OSError, ValueError) as e:
+                stats["error"] = str(e)
+            stats["seconds"] = time.monotonic() - started
+            stats.setdefault("pages", 0)
+            stats.setdefault("bytes", 0)
+            return stats
+
+        project_keys = list(dict.fromkeys(project_keys))
+        with ThreadPoolExecutor(max_workers=max_workers or len(project_keys) or 1) as pool:
+            return dict(zip(project_keys, pool.map(sync, project_keys)))
+
+    def _checkpoint_path(self, output_dir, jql):
+        digest = hashlib.sha1(jql.encode("utf-8")).hexdigest()[:16]
+        return output_dir / "checkpoints" / f"{digest}.json"
+
+    def _load_checkpoint(self, checkpoint_path):
+        checkpoint = read_json(checkpoint_path)
+        # Checkpoints of older versions are started over
+        if checkpoint is None or "homes" not in checkpoint:
+            return None
+        return checkpoint
+
+    def _save_checkpoint(self, checkpoint_path, checkpoint):
+        write_json_atomic(checkpoint_path, checkpoint)
+
+    def iter_search_pages(
+        self,
+        jql: str,
+        start_at: int = 0,
+        page_sizer: PageSizer = None,
+        stats: Dict[str, Any] = None,
+    ):
+        """
+        Page through the search endpoint for a JQL query
 
-                response.raise_for_status()
+        :param jql: JQL query
+        :param start_at: Index of the first issue to fetch, to resume a fetch
+        :param page_sizer: Page sizer to use, defaults to the requester's
+        :param stats: Dict to add the number of pages, bytes and request seconds to
+        :return: Generator of issue batches, one per page
+        """
+        issues_url = f"{self.base_url}/rest/api/3/search"
+        page_sizer = page_sizer or self.page_sizer
+        if stats is not None:
+            for name in ("pages", "bytes", "request_seconds"):
+                stats.setdefault(name, 0)
+
+        while True:
+            batch_size = page_sizer.size
+            payload = {
+                "jql": jql,
+                "maxResults": batch_size,
+                "startAt": start_at,
+                "fields": ["*all"],
+                "expand": ["changelog"],
+            }
+
+            # Big changelog pages time out, retry the same page smaller
+            try:
+                response = self._request(
+                    "POST",
+                    "search",
+                    issues_url,
+                    json=payload,
+                    timeout=(10, self.page_timeout),
+                )
+            except requests.exceptions.Timeout:
+                self.metrics.increment("timeouts", endpoint="search")
+                if page_sizer.shrink_after_timeout():
+                    continue
+                raise
+            if response.status_code in (502, 504) and page_sizer.shrink_after_timeout():
+                continue
+
+            response.raise_for_status()
+            with self.metrics.timer("json_parse", endpoint="search"):
                 result = response.json()
-                batch_issues = result.get("issues", [])
+            batch_issues = result.get("issues", [])
+            self.metrics.increment("pages", endpoint="search")
+            if stats is not None:
+                stats["pages"] += 1
+                stats["bytes"] += len(response.content)
+                stats["request_seconds"] += response.seconds
+            page_sizer.observe(
+                batch_size,
+                len(batch_issues),
+                response.seconds,
+                len(response.content),
+                result.get("maxResults"),
+            )
 
-                if not batch_issues:
-                    break
+            if not batch_issues:
+                break
+
+            self.complete_changelogs(batch_issues)
+            yield batch_issues
 
-                # Organize new issues by date
-                for issue in batch_issues:
-                    time_str = issue.get("fields", {}).get(field, "")
-                    if time_str:
-                        date = time_str.split("T")[0]
-                        if date not in new_issues_by_date:
-                            new_issues_by_date[date] = []
-                        new_issues_by_date[date].append(issue)
-                        all_issues.append(issue)
-
-                start_at += len(batch_issues)
-                if len(batch_issues) < batch_size:
+            start_at += len(batch_issues)
+            if "total" in result:
+                if start_at >= result["total"]:
                     break
+            elif len(batch_issues) < min(batch_size, result.get("maxResults", batch_size)):
+                break
 
-            # Save new issues to cache
-            if new_issues_by_date:
-                self._save_issues_to_cache(output_dir, new_issues_by_date)
+    def complete_changelogs(self, issues: List[Dict[str, Any]]) -> int:
+        """
+        Replace the changelogs search truncated with the full issue history
 
-        except requests.exceptions.RequestException as e:
-            print(f"Error making request: {str(e)}")
-            if hasattr(e, "response") and e.response is not None:
-                print(f"Response content: {e.response.text}")
-            raise
+        Only issues whose changelog total is larger than the histories returned
+        are fetched, through the bulk changelog endpoint when the instance has
+        it, otherwise page by page per issue, concurrently. Full histories are
+        cached in raw_data/<KEY>_issues/changelogs, an issue updated since is
+        only asked for the histories added after the cached ones.
 
-        return all_issues, len(all_issues)
+        :param issues: Raw issues of a search page, updated in place
+        :return: Number of changelogs completed
+        """
+        truncated = [
+            issue for issue in issues if _is_truncated(issue.get("changelog") or {})
+        ]
+        if not truncated:
+            return 0
+
+        histories = {}
+        pending = []
+        for issue in truncated:
+            entry = read_json(self._changelog_path(issue["key"]))
+            if entry and entry["updated"] == issue["fields"].get("updated"):
+                self.metrics.increment("changelog_cache_hits")
+                histories[issue["key"]] = entry["histories"]
+            else:
+                pending.append((issue, entry))
+
+        uncached = [issue for issue, entry in pending if entry is None]
+        if uncached and self.bulk_changelog:
+            bulk = self._bulk_fetch_changelogs(uncached)
+            # Issues the bulk answer left short are fetched on their own below
+            histories.update(
+                (issue["key"], bulk[issue["key"]])
+                for issue in uncached
+                if len(bulk.get(issue["key"], [])) >= issue["changelog"]["total"]
+            )
 
-    def _save_issues_to_cache(self, output_dir, new_issues_by_date):
-        """
-        Helper method to save issues to cache in a year/month structure
-        """
-        # Group new issues by year and month
-        issues_by_year_month = {}
-        for date_str, issues in new_issues_by_date.items():
-            date = datetime.strptime(date_str, "%Y-%m-%d")
-            year = str(date.year)
-            month = date.month
-
-            if year not in issues_by_year_month:
-                issues_by_year_month[year] = {}
-            if month not in issues_by_year_month[year]:
-                issues_by_year_month[year][month] = {}
-
-            issues_by_year_month[year][month][date_str] = issues
-
-        # Month mapping for folder names
-        month_names = {
-            1: "january",
-            2: "february",
-            3: "march",
-            4: "april",
-            5: "may",
-            6: "june",
-            7: "july",
-            8: "august",
-            9: "september",
-            10: "october",
-            11: "november",
-            12: "december",
-        }
+        remaining = [(issue, entry) for issue, entry in pending if issue["key"] not in histories]
+        if remaining:
+            with ThreadPoolExecutor(max_workers=self.changelog_workers) as pool:
+                fetched = pool.map(
+                    lambda pair: self._fetch_changelog(pair[0]["key"], pair[1]), remaining
+                )
+                for (issue, _), issue_histories in zip(remaining, fetched):
+                    histories[issue["key"]] = issue_histories
+
+        for issue, _ in pending:
+            write_json_atomic(
+                self._changelog_path(issue["key"]),
+                {"updated": issue["fields"].get("updated"), "histories": histories[issue["key"]]},
+            )
+        for issue in truncated:
+            complete = _order_like(histories[issue["key"]], issue["changelog"]["histories"])
+            issue["changelog"] = {
+                "startAt": 0,
+                "maxResults": len(complete),
+                "total": len(complete),
+                "histories": complete,
+            }
+        self.metrics.increment("changelogs_completed", len(truncated))
+        return len(truncated)
+
+    def _changelog_path(self, issue_key):
+        project_key = issue_key.rsplit("-", 1)[0]
+        return Path("raw_data") / f"{project_key}_issues" / "changelogs" / f"{issue_key}.json"
+
+    def _fetch_changelog(self, issue_key: str, entry=None) -> List[Dict[str, Any]]:
+        """
+        Page through the changelog of one issue, oldest history first
+
+        :param issue_key: Jira issue key
+        :param entry: Cached changelog, only the histories after it are fetched
+        :return: Every history of the issue
+        """
+        url = f"{self.base_url}/rest/api/3/issue/{issue_key}/changelog"
+        histories = list(entry["histories"]) if entry else []
+        start_at = len(histories)
+        while True:
+            response = self._request(
+                "GET", "changelog", url, params={"startAt": start_at, "maxResults": 100}
+            )
+            response.raise_for_status()
+            with self.metrics.timer("json_parse", endpoint="changelog"):
+                result = response.json()
+            if result.get("total", 0) < len(histories):
+                # Histories were removed since they were cached, start over
+                histories, start_at = [], 0
+                continue
+
+            values = result.get("values", [])
+            histories.extend(values)
+            start_at += len(values)
+            if not values or result.get("isLast", start_at >= result.get("total", 0)):
+                return _sort_histories(histories)
+
+    def _bulk_fetch_changelogs(self, issues: List[Dict[str, Any]]) -> Dict[str, List]:
+        """
+        Full changelogs of many issues through the bulk changelog endpoint
 
-        # Save issues in year/month structure
-        for year, year_data in issues_by_year_month.items():
-            for month_num, month_data in year_data.items():
-                month_name = month_names[month_num]
-                month_dir = output_dir / year / month_name
-                month_dir.mkdir(parents=True, exist_ok=True)
+        :param issues: Raw issues
+        :return: Histories by issue key, empty when the instance has no bulk endpoint
+        """
+        url = f"{self.base_url}/rest/api/3/changelog/bulkfetch"
+        keys_by_id = {issue["id"]: issue["key"] for issue in issues}
+        histories = {issue["key"]: [] for issue in issues}
+        keys = list(histories)
+        for chunk_start in range(0, len(keys), 1000):
+            payload = {"issueIdsOrKeys": keys[chunk_start : chunk_start + 1000], "maxResults": 1000}
+            while True:
+                response = self._request("POST", "changelog", url, json=payload)
+                if response.status_code in (404, 405):
+                    print(
+                        "Bulk changelog endpoint unavailable, fetching changelogs per issue",
+                        file=sys.stderr,
+                    )
+                    self.bulk_changelog = False
+                    return {}
+                response.raise_for_status()
+                with self.metrics.timer("json_parse", endpoint="changelog"):
+                    result = response.json()
+                for changelog in result.get("issueChangeLogs", []):
+                    key = keys_by_id.get(changelog.get("issueId"), changelog.get("issueId"))
+                    if key in histories:
+                        histories[key].extend(changelog.get("changeHistories", []))
+                if not result.get("nextPageToken"):
+                    break
+                payload["nextPageToken"] = result["nextPageToken"]
+        return {key: _sort_histories(values) for key, values in histories.items()}
 
-                # Merge with existing month data if it exists
-                json_path = month_dir / "issues.json"
-                existing_month_data = {}
-                if json_path.exists():
-                    with open(json_path, "r", encoding="utf-8") as f:
-                        existing_month_data = json.load(f)
+    def resolve_account_ids(self, users: List[str]) -> Dict[str, str]:
+        """
+        Resolve usernames or emails to Jira account ids, cached in config/jira_users.json
 
-                # Update with new data
-                existing_month_data.update(month_data)
+        :param users: Usernames, emails or account ids
+        :return: Dictionary of user to account id, unresolved users map to themselves
+        """
+        users_path = "config/jira_users.json"
+        known_users = read_json(users_path, {})
+
+        missing = [user for user in users if user not in known_users]
+        for user in missing:
+            response = self._request(
+                "GET",
+                "user",
+                f"{self.base_url}/rest/api/3/user/search",
+                params={"query": user},
+            )
+            response.raise_for_status()
+            matches = response.json()
+            if matches:
+                known_users[user] = matches[0]["accountId"]
+            else:
+                print(f"Warning: No Jira user found for {user}", file=sys.stderr)
+
+        if missing:
+            update_json(users_path, lambda users: {**users, **known_users}, indent=2)
 
-                # Save created month data
-                with open(json_path, "w", encoding="utf-8") as f:
-                    json.dump(existing_month_data, f, indent=2)
+        return {user: known_users.get(user, user) for user in users}
 
-    def get_board_configuration(self, project_key: str) -> Dict[str, Any]:
+    def get_team_issues(
+        self, project_key: str, timeframe: str | List[str], assignees: List[str]
+    ) -> tuple[List[Dict[str, Any]], int]:
         """
-        Fetch board configuration for a project to get workflow columns
+        Fetch issues updated in a timeframe for a whole team with a single query
+
+        The first run for a timeframe and team fetches every matching issue. Later
+        runs only ask Jira for the team's issues and the previously matching ones
+        updated since the previous sync, whatever their date, and apply the
+        timeframe locally. The sync state only keeps the matching keys, their
+        bodies are read from the issue store.
 
         :param project_key: Jira project key
-        :return: Board configuration details
+        :param timeframe: Timeframe accepted by get_date_range
+        :param assignees: Usernames, emails or account ids of the team members
+        :return: Tuple of (issues list, total number of issues)
         """
-        # Note: This might require knowing the board ID beforehand
-        boards_url = f"{self.base_url}/rest/agile/1.0/board"
+        account_ids = self.resolve_account_ids(assignees)
+        team = set(account_ids.values())
+        start_date, end_date = self.get_date_range(timeframe)
 
-        response = requests.get(
-            f"{boards_url}?projectKeyOrId={project_key}",
-            auth=self.auth,
-            headers=self.headers,
+        output_dir = Path("raw_data") / f"{project_key}_issues"
+        store = IssueStore(output_dir)
+        sync_path = output_dir / "team_sync.json"
+        sync_state = read_json(sync_path, {})
+
+        scope = f"{start_date}|{end_date}|{','.join(sorted(team))}"
+        cached = sync_state.get(scope, {})
+        # Scopes synced by older versions kept whole issues, they are fetched again
+        synced_at = cached.get("synced_at") if "keys" in cached else None
+        known = cached.get("keys", {}) if synced_at else {}
+        sync_started = datetime.now()
+
+        def in_scope(issue):
+            fields = issue.get("fields") or {}
+            updated = (fields.get("updated") or "").split("T")[0]
+            return (fields.get("assignee") or {}).get("accountId") in team and (
+                not start_date or start_date <= updated < end_date
+            )
+
+        def search(keys):
+            account_list = ", ".join(f'"{account_id}"' for account_id in sorted(team))
+            team_clause = f"assignee IN ({account_list})"
+            if keys:
+                team_clause = f"({team_clause} OR key IN ({', '.join(keys)}))"
+            jql = f"project = {project_key} AND {team_clause}"
+            if synced_at:
+                # Relative JQL dates avoid any mismatch with the Jira profile timezone,
+                # the margin covers clock skew and requests still in flight last time
+                minutes = (
+                    sync_started - datetime.fromisoformat(synced_at)
+                ).total_seconds() // 60 + 5
+                jql += f' AND updated >= "-{int(minutes)}m"'
+            elif start_date:
+                jql += f" AND updated >= '{start_date}' AND updated < '{end_date}'"
+            jql += " ORDER BY updated DESC"
+
+            print(f"\nExecuting JQL: {jql}", file=sys.stderr)
+            return [issue for batch in self.iter_search_pages(jql) for issue in batch]
+
+        gone = set()
+        try:
+            changed = search(known)
+        except requests.exceptions.HTTPError as e:
+            # Jira rejects the whole query when one of the keys no longer exists
+            if not known or e.response is None or e.response.status_code != 400:
+                raise
+            changed = search({})
+            for key in known:
+                issue = self._fetch_issue(key)
+                if issue is None:
+                    gone.add(key)
+                else:
+                    changed.append(issue)
+
+        issues = {}
+        homes = {key: entry["home"] for key, entry in known.items() if key not in gone}
+        for issue in changed:
+            homes.pop(issue["key"], None)
+            if in_scope(issue):
+                issues[issue["key"]] = issue
+        stored_homes = store.put(changed)
+
+        found = store.load(homes)
+        for key in homes:
+            issue = found.get(key)
+            if issue is None:
+                # Not in the store anymore, None when it was deleted from Jira
+                issue = self._fetch_issue(key)
+                if issue is not None:
+                    stored_homes.update(store.put([issue]))
+            if issue is not None and in_scope(issue):
+                issues[key] = issue
+
+        keys = {
+            key: {
+                "updated": issue["fields"].get("updated"),
+                "home": stored_homes.get(key) or homes[key],
+            }
+            for key, issue in issues.items()
+        }
+
+        def save_scope(sync_state):
+            # Re-read under the lock, another run may have synced other scopes
+            sync_state[scope] = {"synced_at": sync_started.isoformat(), "keys": keys}
+            # Relative timeframes like "yesterday" open a new scope every day
+            expired = sync_started - timedelta(days=30)
+            return {
+                key: value
+                for key, value in sync_state.items()
+                if datetime.fromisoformat(value["synced_at"]) >= expired
+            }
+
+        update_json(sync_path, save_scope)
+
+        all_issues = sorted(
+            issues.values(),
+            key=lambda issue: issue.get("fields", {}).get("updated", ""),
+            reverse=True,
         )
+        return all_issues, len(all_issues)
+
+    def _fetch_issue(self, issue_key: str):
+        """
+        Get a single issue with its full changelog
+
+        :param issue_key: Jira issue key
+        :return: Raw issue, None when it doesn't exist anymore
+        """
+        url = f"{self.base_url}/rest/api/3/issue/{issue_key}"
+        response = self._request("GET", "issue", url, params={"expand": "changelog"})
+        if response.status_code == 404:
+            return None
         response.raise_for_status()
+        with self.metrics.timer("json_parse", endpoint="issue"):
+            issue = response.json()
+        self.complete_changelogs([issue])
+        return issue
 
-        boards = response.json().get("values", [])
-        if boards:
-            board_id = boards[0]["id"]
-            config_url = (
-                f"{self.base_url}/rest/agile/1.0/board/{board_id}/configuration"
-            )
-            config_response = requests.get(
-                config_url, auth=self.auth, headers=self.headers
+    def get_board_configuration(self, project_key: str, refresh: bool = False) -> Dict[str, Any]:
+        """
+        Fetch board configuration for a project to get workflow columns
+
+        The board id is cached along with the configuration, so once the
+        configuration expires it is revalidated without listing the boards
+        again.
+
+        :param project_key: Jira project key
+        :param refresh: If True, revalidate the cached configuration even when it is fresh
+        :return: Board configuration details
+        """
+        cache_key = f"board:{project_key}"
+        entry = self.metadata_cache.get(cache_key)
+        board_id = (self.metadata_cache.get(f"board-id:{project_key}") or {}).get("data")
+        cached_board = entry is not None and board_id is not None
+        if not cached_board:
+            boards_url = f"{self.base_url}/rest/agile/1.0/board"
+            response = self._request(
+                "GET", "board", f"{boards_url}?projectKeyOrId={project_key}"
             )
-            result = config_response.json()
+            response.raise_for_status()
+
+            boards = response.json().get("values", [])
+            if not boards:
+                return {}
+            board_id = boards[0]["id"]
+            self.metadata_cache.put(f"board-id:{project_key}", board_id)
 
-            # Save board config to CSV with fields as columns
-            output_dir = Path("raw_data")
-            output_dir.mkdir(exist_ok=True)
+        config_url = f"{self.base_url}/rest/agile/1.0/board/{board_id}/configuration"
+        try:
+            result, changed = self._get_metadata("board", cache_key, config_url, refresh)
+        except requests.HTTPError as e:
+            if not cached_board or e.response is None or e.response.status_code != 404:
+                raise
+            # The cached board is gone, look the project's board up again
+            self.metadata_cache.put(f"board-id:{project_key}", None)
+            return self.get_board_configuration(project_key, refresh)
+
+        # Save board config to CSV with fields as columns
+        output_dir = Path("raw_data")
+        output_dir.mkdir(exist_ok=True)
+        csv_path = output_dir / f"{project_key}_board_config.csv"
+        if changed or not csv_path.exists():
             with open(
-                output_dir / f"{project_key}_board_config.csv",
+                csv_path,
                 "w",
                 newline="",
                 encoding="utf-8",
@@ -441,8 +981,7 @@ class JiraRequester:
                 writer.writerow(["raw_response"])
                 writer.writerow([json.dumps(result)])
 
-            return result
-        return {}
+        return result
 
     def load_custom_field_mappings(self):
         """Load custom field mappings from JSON file"""
@@ -450,5 +989,25 @@ class JiraRequester:
             with open("config/jira_custom_fields.json", "r") as f:
                 return json.load(f)
         except FileNotFoundError:
-            print("Warning: Custom field mappings file not found")
+            print("Warning: Custom field mappings file not found", file=sys.stderr)
             return {}
+
+
+def _is_truncated(changelog):
+    """Whether a changelog expanded by search holds fewer histories than the issue has"""
+    return changelog.get("total", 0) > len(changelog.get("histories", []))
+
+
+def _sort_histories(histories):
+    """Histories oldest first, the order of the issue changelog endpoint"""
+    return sorted(
+        histories,
+        key=lambda history: (history.get("created", ""), int(history.get("id") or 0)),
+    )
+
+
+def _order_like(histories, sample):
+    """Histories in the same order as the truncated ones search returned"""
+    if len(sample) > 1 and sample[0].get("created", "") > sample[-1].get("created", ""):
+        return histories[::-1]
+    return histories
@@ -0,0 +1,68 @@
+import json
+from typing import Any, Dict, List
+from urllib.error import HTTPError
+from urllib.parse import urlencode
+from urllib.request import urlopen
+
+
+class SyncClient:
+    def __init__(self, base_url: str, timeout: float = 10):
+        """
+        Query a running `cli.py serve` daemon
+
+        Uses urllib instead of requests to keep the CLI startup light.
+
+        :param base_url: Daemon URL, e.g. 'http://127.0.0.1:8765'
+        :param timeout: Request timeout in seconds
+        """
+        self.base_url = base_url.rstrip("/")
+        self.timeout = timeout
+
+    def _get(self, path: str, params: Dict[str, Any] = None) -> Dict[str, Any]:
+        query = urlencode(
+            {key: value for key, value in (params or {}).items() if value},
+            doseq=True,
+        )
+        try:
+            with urlopen(f"{self.base_url}{path}?{query}", timeout=self.timeout) as response:
+                return json.load(response)
+        except HTTPError as e:
+            # The daemon explains rejected queries and failed fetches in the body
+            raise ValueError(f"Sync daemon answered {e.code}: {json.load(e)['error']}") from e
+
+    def get_project_issues(
+        self, timeframe: Dict[str, Any], assignees: List[str] = None
+    ) -> tuple[List[Dict[str, Any]], int]:
+        """Same contract as JiraRequester.get_project_issues, served from the daemon"""
+        field, value = next(iter(timeframe.items()))
+        result = self._get(
+            "/issues",
+            {"field": field, "timeframe": _timeframe_param(value), "assignee": assignees},
+        )
+        return result["issues"], result["total"]
+
+    def get_eod_issues(
+        self, timeframe: str | List[str], assignees: List[str]
+    ) -> tuple[List[Dict[str, Any]], int]:
+        result = self._get(
+            "/eod",
+            {"timeframe": _timeframe_param(timeframe), "assignee": assignees},
+        )
+        return result["issues"], result["total"]
+
+    def get_rows(self, field: str, timeframe: str | List[str]) -> List[Dict[str, Any]]:
+        """Issues flattened the same way issues-to-csv does"""
+        return self._get(
+            "/rows", {"field": field, "timeframe": _timeframe_param(timeframe)}
+        )["rows"]
+
+    def get_aggregates(self, field: str, timeframe: str | List[str]) -> Dict[str, Any]:
+        return self._get(
+            "/aggregates", {"field": field, "timeframe": _timeframe_param(timeframe)}
+        )
+
+
+def _timeframe_param(timeframe):
+    if timeframe == "all":
+        return None
+    return timeframe
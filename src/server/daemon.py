@@ -0,0 +1,268 @@
+import json
+import sys
+import threading
+from collections import Counter
+from datetime import datetime, timedelta, timezone
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qs, urlparse
+
+from src.analyzer.converter import issue_to_row
+from src.analyzer.issue_index import DATE_FIELDS, IssueIndex, issue_date
+from src.scraper.issue_cache import issues_dir, iter_cached_issues
+from src.scraper.issue_store import IssueStore
+
+DEFAULT_HOST = "127.0.0.1"
+DEFAULT_PORT = 8765
+DEFAULT_POLL_INTERVAL = 300
+
+# How far back the first poll looks when the cache is empty
+INITIAL_LOOKBACK_MINUTES = 24 * 60
+
+
+class SyncDaemon:
+    def __init__(self, requester, project_key, custom_fields, poll_interval=DEFAULT_POLL_INTERVAL):
+        """
+        Keep a warm in-memory index of the issue cache and poll Jira for updates
+
+        :param requester: JiraRequester used to poll Jira
+        :param project_key: Jira project key
+        :param custom_fields: Custom field mappings, used to build CSV rows
+        :param poll_interval: Seconds between two polls
+        """
+        self.requester = requester
+        self.project_key = project_key
+        self.custom_fields = custom_fields
+        self.poll_interval = poll_interval
+        self.store = IssueStore(issues_dir(project_key))
+        self.index = IssueIndex(iter_cached_issues(project_key))
+        self.last_poll = None
+        # Start of the time the polls fetched every update of, dates after it
+        # are complete in the index
+        self.polled_from = None
+        self._fetch_lock = threading.Lock()
+        self._stop = threading.Event()
+
+    def poll_once(self) -> int:
+        """
+        Fetch issues updated since the last poll into the index and the cache
+
+        :return: Number of issues inserted or replaced
+        """
+        poll_started = datetime.now(timezone.utc)
+        if self.last_poll:
+            since = self.last_poll
+        else:
+            latest = self.index.latest_updated()
+            since = _parse_jira_time(latest) if latest else None
+
+        if since:
+            # Margin for clock skew and for requests in flight during the last poll
+            minutes = int((poll_started - since).total_seconds() // 60) + 5
+        else:
+            minutes = INITIAL_LOOKBACK_MINUTES
+
+        jql = (
+            f'project = {self.project_key} AND updated >= "-{minutes}m" '
+            f"ORDER BY updated ASC"
+        )
+        changed = 0
+        for batch_issues in self.requester.iter_search_pages(jql):
+            changed += self.index.upsert(batch_issues)
+            # A poll only covers part of its first day, no date is marked fetched
+            self.store.put(batch_issues)
+
+        if self.polled_from is None:
+            self.polled_from = poll_started - timedelta(minutes=minutes)
+        self.last_poll = poll_started
+        return changed
+
+    def run_poller(self):
+        """Poll until stop() is called, errors are logged and retried next interval"""
+        while not self._stop.is_set():
+            try:
+                changed = self.poll_once()
+                print(
+                    f"[{datetime.now():%H:%M:%S}] Synced {changed} updated issues, "
+                    f"{len(self.index)} in index",
+                    file=sys.stderr,
+                )
+            except Exception as e:
+                print(f"Error polling Jira: {e}", file=sys.stderr)
+            self._stop.wait(self.poll_interval)
+
+    def stop(self):
+        self._stop.set()
+
+    def serve(self, host=DEFAULT_HOST, port=DEFAULT_PORT):
+        """Start the poller thread and serve the query API until interrupted"""
+        poller = threading.Thread(target=self.run_poller, daemon=True)
+        poller.start()
+
+        server = ThreadingHTTPServer((host, port), _make_handler(self))
+        print(f"Serving {self.project_key} on http://{host}:{port}", file=sys.stderr)
+        try:
+            server.serve_forever()
+        except KeyboardInterrupt:
+            pass
+        finally:
+            self.stop()
+            server.server_close()
+
+    def query_issues(self, field, timeframe=None, assignees=None):
+        """
+        Issues whose date field falls in a timeframe, optionally for some assignees
+
+        Timeframes with dates that neither a fetch nor the polls covered in full
+        are fetched from Jira first, without a timeframe every indexed issue
+        is a match.
+
+        :param field: 'created' or 'updated'
+        :param timeframe: Timeframe accepted by JiraRequester.get_date_range
+        :param assignees: Account ids, display names or emails
+        :return: Issues sorted by the date field, latest first
+        """
+        if field not in DATE_FIELDS:
+            raise ValueError(f"Invalid field {field!r}, use one of {', '.join(DATE_FIELDS)}")
+        start_date, end_date = (
+            self.requester.get_date_range(timeframe) if timeframe else (None, None)
+        )
+        if start_date and end_date and self.uncovered_dates(field, start_date, end_date):
+            with self._fetch_lock:
+                # Another request may have fetched the range meanwhile
+                if self.uncovered_dates(field, start_date, end_date):
+                    print(f"Fetching {field} {start_date} to {end_date} from Jira", file=sys.stderr)
+                    fetched, _ = self.requester.get_project_issues(
+                        self.project_key, {field: timeframe}
+                    )
+                    self.index.upsert(fetched)
+        issues = self.index.between(field, start_date, end_date)
+        if assignees:
+            # Usernames and emails are matched through their cached account ids
+            account_ids = self.requester.resolve_account_ids(assignees).values()
+            wanted = {value.lower() for value in [*assignees, *account_ids]}
+            issues = [issue for issue in issues if _assignee_ids(issue) & wanted]
+        return issues[::-1]
+
+    def uncovered_dates(self, field, start_date, end_date):
+        """
+        Dates of [start_date, end_date) whose issues may be missing from the index
+
+        :param field: 'created' or 'updated'
+        :param start_date: Inclusive YYYY-MM-DD start
+        :param end_date: Exclusive YYYY-MM-DD end
+        :return: Sorted YYYY-MM-DD dates
+        """
+        # Issues created after the polls started were also updated after it
+        polled_after = (
+            self.polled_from.astimezone().strftime("%Y-%m-%d") if self.polled_from else None
+        )
+        fetched = self.store.fetched_dates(field)
+        uncovered = []
+        current = datetime.strptime(start_date, "%Y-%m-%d")
+        while current < datetime.strptime(end_date, "%Y-%m-%d"):
+            date_str = current.strftime("%Y-%m-%d")
+            if date_str not in fetched and not (polled_after and date_str > polled_after):
+                uncovered.append(date_str)
+            current += timedelta(days=1)
+        return uncovered
+
+    def aggregates(self, field, timeframe=None):
+        issues = self.query_issues(field, timeframe)
+        counters = {
+            "status": Counter(),
+            "assignee": Counter(),
+            "priority": Counter(),
+            "issue_type": Counter(),
+            "daily": Counter(),
+        }
+        for issue in issues:
+            fields = issue.get("fields", {})
+            counters["status"][(fields.get("status") or {}).get("name")] += 1
+            counters["assignee"][(fields.get("assignee") or {}).get("displayName", "Unassigned")] += 1
+            counters["priority"][(fields.get("priority") or {}).get("name", "No Priority")] += 1
+            counters["issue_type"][(fields.get("issuetype") or {}).get("name")] += 1
+            counters["daily"][issue_date(issue, field)] += 1
+
+        result = {name: dict(counter.most_common()) for name, counter in counters.items()}
+        result["daily"] = dict(sorted(counters["daily"].items()))
+        result["total"] = len(issues)
+        return result
+
+
+def _make_handler(daemon):
+    class QueryHandler(BaseHTTPRequestHandler):
+        def do_GET(self):
+            url = urlparse(self.path)
+            params = parse_qs(url.query)
+            timeframe = params.get("timeframe")
+            if timeframe and len(timeframe) == 1:
+                timeframe = timeframe[0]
+            assignees = params.get("assignee")
+
+            try:
+                if url.path == "/health":
+                    body = {
+                        "project": daemon.project_key,
+                        "issues": len(daemon.index),
+                        "last_poll": daemon.last_poll.isoformat() if daemon.last_poll else None,
+                    }
+                elif url.path in ("/issues", "/eod"):
+                    default_field = "updated" if url.path == "/eod" else "created"
+                    field = params.get("field", [default_field])[0]
+                    issues = daemon.query_issues(field, timeframe, assignees)
+                    body = {"issues": issues, "total": len(issues)}
+                elif url.path == "/rows":
+                    field = params.get("field", ["created"])[0]
+                    issues = daemon.query_issues(field, timeframe, assignees)
+                    body = {
+                        "rows": [
+                            issue_to_row(issue, daemon.custom_fields) for issue in issues
+                        ]
+                    }
+                elif url.path == "/aggregates":
+                    field = params.get("field", ["created"])[0]
+                    body = daemon.aggregates(field, timeframe)
+                else:
+                    self._send(404, {"error": f"Unknown endpoint {url.path}"})
+                    return
+            except ValueError as e:
+                self._send(400, {"error": str(e)})
+                return
+            except OSError as e:
+                # Fetching a range the cache didn't cover failed
+                self._send(502, {"error": f"Could not fetch the range from Jira: {e}"})
+                return
+
+            self._send(200, body)
+
+        def _send(self, status, body):
+            payload = json.dumps(body, separators=(",", ":")).encode("utf-8")
+            self.send_response(status)
+            self.send_header("Content-Type", "application/json")
+            self.send_header("Content-Length", str(len(payload)))
+            self.end_headers()
+            self.wfile.write(payload)
+
+        def log_message(self, format, *args):
+            # Keep the terminal for sync progress, requests are not logged
+            pass
+
+    return QueryHandler
+
+
+def _assignee_ids(issue):
+    assignee = issue.get("fields", {}).get("assignee") or {}
+    return {
+        str(value).lower()
+        for value in (
+            assignee.get("accountId"),
+            assignee.get("displayName"),
+            assignee.get("emailAddress"),
+        )
+        if value
+    }
+
+
+def _parse_jira_time(time_str):
+    """Parse a Jira timestamp such as 2024-05-01T10:22:33.000+1000"""
+    return datetime.strptime(time_str, "%Y-%m-%dT%H:%M:%S.%f%z")
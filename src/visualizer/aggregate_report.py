@@ -0,0 +1,82 @@
+import pandas as pd
+import streamlit as st
+from src.visualizer.aggregates import series_to_dict
+from src.visualizer.large_data import downsample_series
+from src.visualizer.report import REPORT_SECTIONS
+
+
+def aggregate_report(aggregates, key_prefix):
+    """
+    Render the dashboard from chunked aggregates instead of the full frame
+
+    :param aggregates: Aggregates returned by aggregate_csv_in_chunks
+    :param key_prefix: Namespace of the widget keys, unique per report on the page
+    """
+    st.info(
+        f"Low-memory mode: showing precomputed aggregates for "
+        f"{aggregates['source']} ({aggregates['rows']} tickets)."
+    )
+
+    sections = section_aggregates(aggregates)
+    for section in REPORT_SECTIONS:
+        if section.name in sections:
+            section.render(
+                sections[section.name], section.figures(sections[section.name]), key_prefix
+            )
+
+    st.caption(
+        "Developer performance, sprint analytics, ticket linkage and ticket rankings "
+        "need every ticket, turn off low-memory mode to see them."
+    )
+
+
+def section_aggregates(aggregates):
+    """
+    Aggregates of the report sections that chunk totals are enough for
+
+    :param aggregates: Aggregates returned by aggregate_csv_in_chunks
+    :return: Dict by section name, shaped like the section's compute function returns
+    """
+    rows = aggregates["rows"]
+    priorities = aggregates["priority"]
+    daily_tickets = pd.Series(aggregates["daily"], dtype="int64").sort_index()
+    comments = aggregates["comments"]
+
+    return {
+        "ticket_distribution": {
+            "daily_tickets": series_to_dict(downsample_series(daily_tickets)),
+            "issue_types": aggregates["issue_type"],
+            "statuses": aggregates["status"],
+            "total_tickets": rows,
+            "issue_type_count": _unique_count(aggregates, "issue_type"),
+            "status_count": _unique_count(aggregates, "status"),
+            "assignee_count": _unique_count(aggregates, "assignee"),
+            "story_points": aggregates["story_points"],
+            "most_common_priority": _mode(priorities),
+            "highest_priority_pct": f"{(priorities.get('Highest', 0)/max(rows, 1)*100):.1f}%",
+        },
+        "fix_versions_kpi": {
+            "fix_version_counts": aggregates["fix_version"],
+            "total_tickets": rows,
+        },
+        "comment_stats": {
+            "most_commented": aggregates["most_commented"],
+            "avg_comments": comments["total"] / rows if rows else 0.0,
+            "total_comments": comments["total"],
+            "tickets_without_comments": comments["tickets_without_comments"],
+            "tickets_with_comments": comments["tickets_with_comments"],
+        },
+    }
+
+
+def _unique_count(aggregates, key):
+    """Distinct values of a column, a missing value counts as one like Series.unique"""
+    return len(aggregates[key]) + (1 if aggregates["missing"][key] else 0)
+
+
+def _mode(counts):
+    """Most frequent value, the smallest of the ties like Series.mode, None when empty"""
+    if not counts:
+        return None
+    highest = max(counts.values())
+    return min(value for value, count in counts.items() if count == highest)
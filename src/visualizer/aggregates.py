@@ -0,0 +1,33 @@
+import pandas as pd
+
+# Visualizer aggregates are plain JSON-friendly values so they can be rendered
+# live or stored in a report snapshot and rendered later without pandas work.
+
+
+def series_to_dict(series: pd.Series):
+    """Convert a series to a {label: value} dict with string labels"""
+    return dict(zip((str(key) for key in series.index), series.tolist()))
+
+
+def dict_to_series(values, name=None):
+    """Inverse of series_to_dict"""
+    return pd.Series(values, name=name)
+
+
+def frame_to_dict(frame: pd.DataFrame):
+    """Convert a dataframe to a split dict with string labels"""
+    return {
+        "index": [str(label) for label in frame.index],
+        "index_name": frame.index.name,
+        "columns": [str(label) for label in frame.columns],
+        "columns_name": frame.columns.name,
+        "data": frame.to_numpy().tolist(),
+    }
+
+
+def dict_to_frame(values):
+    """Inverse of frame_to_dict"""
+    frame = pd.DataFrame(values["data"], index=values["index"], columns=values["columns"])
+    frame.index.name = values.get("index_name")
+    frame.columns.name = values.get("columns_name")
+    return frame
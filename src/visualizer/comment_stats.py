@@ -1,44 +1,66 @@
+import plotly.express as px
 import streamlit as st
-from src.visualizer.priority_icons import priority_icons
+from src.visualizer.ranked_table import ranked_table, top_n_records
 
-def comment_stats(data):
-    st.subheader("Most Commented Tickets")
 
-    most_commented = data[
-        ["Issue Key", "Issue Summary", "Comment count", "Status", "Priority"]
-    ]
-    most_commented = most_commented.sort_values("Comment count", ascending=False).head(
-        10
-    )
+def comment_stats(data, key_prefix):
+    aggregates = compute_comment_stats(data)
+    render_comment_stats(aggregates, comment_stats_figures(aggregates), key_prefix)
+
+
+def compute_comment_stats(data):
+    return {
+        "most_commented": top_n_records(
+            data,
+            "Comment count",
+            ["Issue Key", "Issue Summary", "Comment count", "Status", "Priority"],
+        ),
+        "avg_comments": float(data["Comment count"].mean()),
+        "total_comments": data["Comment count"].sum().item(),
+        "tickets_without_comments": len(data[data["Comment count"] == 0]),
+        "tickets_with_comments": len(data[data["Comment count"] > 0]),
+    }
 
-    for idx, row in most_commented.iterrows():
-        with st.container():
-            cols = st.columns([1, 6, 1, 2, 2, 1])
-            with cols[0]:
-                st.write(f"#{row['Issue Key']}")
-            with cols[1]:
-                st.write(row["Issue Summary"])
-            with cols[2]:
-                st.write(f"💬 {row['Comment count']}")
-            with cols[3]:
-                st.write(row["Status"])
-            with cols[4]:
-                priority_icon = priority_icons.get(row["Priority"], "•")
-                st.write(f"{priority_icon} {row['Priority']}")
-            with cols[5]:
-                st.write(row["Comment count"])
-            st.divider()
+
+def comment_stats_figures(aggregates):
+    return {}
+
+
+def render_comment_stats(aggregates, figures, key_prefix):
+    ranked_table(
+        aggregates["most_commented"],
+        "Most Commented Tickets",
+        key_prefix,
+        column_config={"Comment count": st.column_config.NumberColumn("💬 Comments")},
+    )
 
     col1, col2, col3, col4 = st.columns(4)
     with col1:
-        avg_comments = data["Comment count"].mean()
-        st.metric("Average Comments per Ticket", f"{avg_comments:.1f}")
+        st.metric("Average Comments per Ticket", f"{aggregates['avg_comments']:.1f}")
     with col2:
-        total_comments = data["Comment count"].sum()
-        st.metric("Total Comments", total_comments)
+        st.metric("Total Comments", aggregates["total_comments"])
     with col3:
-        total_tickets_without_comments = len(data[data["Comment count"] == 0])
-        st.metric("Total Tickets without Comments", total_tickets_without_comments)
+        st.metric("Total Tickets without Comments", aggregates["tickets_without_comments"])
     with col4:
-        total_tickets_with_comments = len(data[data["Comment count"] > 0])
-        st.metric("Total Tickets with Comments", total_tickets_with_comments)
+        st.metric("Total Tickets with Comments", aggregates["tickets_with_comments"])
+
+
+def comment_stats_comparison(data):
+    st.subheader("Comment comparison")
+    comments = data.groupby("Source")["Comment count"].agg(["mean", "sum"])
+    comments.columns = ["Average Comments per Ticket", "Total Comments"]
+    col1, col2 = st.columns(2)
+    with col1:
+        st.plotly_chart(
+            px.bar(
+                comments,
+                y="Average Comments per Ticket",
+                title="Average Comments per Ticket per Year",
+            ),
+            use_container_width=True,
+        )
+    with col2:
+        st.plotly_chart(
+            px.bar(comments, y="Total Comments", title="Total Comments per Year"),
+            use_container_width=True,
+        )
@@ -1,124 +1,134 @@
 import pandas as pd
 import plotly.express as px
 import streamlit as st
-
-
-def developer_performance(data):
-    st.title("Year End Dev Performance Report")
-    col1, col2, col3 = st.columns([2, 2, 1])
-
-    with col1:
-        assignee_dist = data["Assignee"].value_counts()
-        fig_assignee = px.bar(
-            x=assignee_dist.index,
-            y=assignee_dist.values,
-            labels={"x": "Assignee", "y": "Number of Tickets"},
-            title="Total Tickets per Assignee",
-        )
-        st.plotly_chart(fig_assignee)
-
-    with col2:
-        priority_by_assignee = pd.crosstab(data["Assignee"], data["Priority"])
-        fig_priority = px.bar(
-            priority_by_assignee,
-            title="Tickets by Priority per Assignee",
-            labels={"value": "Number of Tickets", "Assignee": "Assignee"},
-            barmode="stack",
-        )
-        fig_priority.update_layout(xaxis_tickangle=-45)
-        st.plotly_chart(fig_priority)
-
-    with col3:
-        st.subheader("MVP Leaderboard")
-        completed_tickets = data[
-            data["Status"].isin(["In Prod", "Duplicate", "Cancelled"])
-        ]
-        mvp_by_tickets = completed_tickets["Assignee"].value_counts()
-        if not mvp_by_tickets.empty:
-            for rank, (name, count) in enumerate(mvp_by_tickets.head(5).items(), 1):
-                st.metric(f"#{rank} - {name}", f"{count} tickets completed")
-
-    col1, col2 = st.columns(2)
-    with col1:
-        completed_tickets = data[
-            data["Status"].isin(["In Prod", "Duplicate", "Cancelled"])
-        ].copy()
-        completed_tickets["Created"] = pd.to_datetime(
-            completed_tickets["Created"], utc=True
-        )
-
-        def get_completion_date(history):
-            try:
-                changes = eval(history)
-                if changes[0]["to"] in ["In Prod", "Duplicate", "Cancelled"]:
-                    return pd.to_datetime(changes[0]["date"], utc=True)
-            except:
-                return pd.NaT
-
-        completed_tickets["Completion Date"] = pd.to_datetime(
-            completed_tickets["Status Change History"].apply(get_completion_date),
-            utc=True,
-        )
-        completed_tickets = completed_tickets.dropna(subset=["Completion Date"])
-
-        completed_tickets["Resolution Time (Days)"] = (
-            completed_tickets["Completion Date"] - completed_tickets["Created"]
-        ).dt.total_seconds() / 86400 
-
-        fig_resolution = px.scatter(
-            completed_tickets,
-            x="Severity",
-            y="Resolution Time (Days)",
-            color="Assignee",
-            title="Resolution Time by Severity",
-            labels={
-                "Resolution Time (Days)": "Days to Resolve",
-                "Severity": "Severity Level",
-            },
-            hover_data=["Issue Key", "Issue Summary"],
-        )
-
-        # Update layout to show grid
-        fig_resolution.update_layout(
-            xaxis_title="Severity Level",
-            yaxis_title="Days to Resolve",
-            xaxis=dict(showgrid=True),
-            yaxis=dict(showgrid=True),
-        )
-
-        st.plotly_chart(fig_resolution)
-    with col2:
-        completed_tickets = data[
-            data["Status"].isin(["In Prod", "Duplicate", "Cancelled"])
-        ].copy()
-        completed_tickets["Created"] = pd.to_datetime(
-            completed_tickets["Created"], utc=True
-        )
-
-        def get_completion_date(history):
-            try:
-                changes = eval(history)
-                if changes[0]["to"] in ["In Prod", "Duplicate", "Cancelled"]:
-                    return pd.to_datetime(changes[0]["date"], utc=True)
-            except:
-                return pd.NaT
-
-        completed_tickets["Completion Date"] = pd.to_datetime(
-            completed_tickets["Status Change History"].apply(get_completion_date),
-            utc=True,
-        )
-
-        daily_tickets = (
-            completed_tickets.groupby(completed_tickets["Created"].dt.date)
-            .size()
-            .reset_index()
+from src.visualizer.aggregates import (
+    dict_to_frame,
+    dict_to_series,
+    frame_to_dict,
+    series_to_dict,
+)
+from src.visualizer.large_data import scatter_options
+
+COMPLETED_STATUSES = ["In Prod", "Duplicate", "Cancelled"]
+
+
+def developer_performance(data, key_prefix):
+    aggregates = compute_developer_performance(data)
+    render_developer_performance(
+        aggregates, developer_performance_figures(aggregates), key_prefix
+    )
+
+
+def get_completion_date(history):
+    try:
+        changes = eval(history)
+        if changes[0]["to"] in COMPLETED_STATUSES:
+            return pd.to_datetime(changes[0]["date"], utc=True)
+    except:
+        return pd.NaT
+
+
+def compute_developer_performance(data):
+    completed_tickets = data[data["Status"].isin(COMPLETED_STATUSES)].copy()
+    completed_tickets["Created"] = pd.to_datetime(
+        completed_tickets["Created"], utc=True
+    )
+    completed_tickets["Completion Date"] = pd.to_datetime(
+        completed_tickets["Status Change History"].apply(get_completion_date),
+        utc=True,
+    )
+
+    resolved_tickets = completed_tickets.dropna(subset=["Completion Date"])
+    resolved_tickets["Resolution Time (Days)"] = (
+        resolved_tickets["Completion Date"] - resolved_tickets["Created"]
+    ).dt.total_seconds() / 86400
+
+    daily_tickets = (
+        completed_tickets.groupby(completed_tickets["Created"].dt.date).size()
+    )
+
+    story_points = None
+    if "Story Points" in data.columns and data["Story Points"].notna().any():
+        story_points = series_to_dict(
+            data.groupby("Assignee")["Story Points"]
+            .sum()
+            .sort_values(ascending=False)
         )
-        daily_tickets.columns = ["Date", "Number of Tickets"]
-
-        daily_tickets["Date"] = pd.to_datetime(daily_tickets["Date"])
-
-        time_granularity = st.selectbox("Select Time Granularity", ["Weekly", "Daily"])
 
+    return {
+        "assignee_counts": series_to_dict(data["Assignee"].value_counts()),
+        "priority_by_assignee": frame_to_dict(
+            pd.crosstab(data["Assignee"], data["Priority"])
+        ),
+        "mvp": series_to_dict(completed_tickets["Assignee"].value_counts().head(5)),
+        "resolution_times": frame_to_dict(
+            resolved_tickets[
+                [
+                    "Severity",
+                    "Resolution Time (Days)",
+                    "Assignee",
+                    "Issue Key",
+                    "Issue Summary",
+                ]
+            ].reset_index(drop=True)
+        ),
+        "daily_completed_tickets": series_to_dict(daily_tickets),
+        "story_points": story_points,
+        "issue_types_by_assignee": frame_to_dict(
+            pd.crosstab(data["Assignee"], data["Issue Type"])
+        ),
+    }
+
+
+def developer_performance_figures(aggregates):
+    figures = {}
+
+    assignee_dist = dict_to_series(aggregates["assignee_counts"])
+    figures["assignees"] = px.bar(
+        x=assignee_dist.index,
+        y=assignee_dist.values,
+        labels={"x": "Assignee", "y": "Number of Tickets"},
+        title="Total Tickets per Assignee",
+    )
+
+    figures["priorities"] = px.bar(
+        dict_to_frame(aggregates["priority_by_assignee"]),
+        title="Tickets by Priority per Assignee",
+        labels={"value": "Number of Tickets", "Assignee": "Assignee"},
+        barmode="stack",
+    )
+    figures["priorities"].update_layout(xaxis_tickangle=-45)
+
+    resolution_times = dict_to_frame(aggregates["resolution_times"])
+    figures["resolution"] = px.scatter(
+        resolution_times,
+        x="Severity",
+        y="Resolution Time (Days)",
+        color="Assignee",
+        title="Resolution Time by Severity",
+        labels={
+            "Resolution Time (Days)": "Days to Resolve",
+            "Severity": "Severity Level",
+        },
+        **scatter_options(
+            len(resolution_times), hover_data=["Issue Key", "Issue Summary"]
+        ),
+    )
+
+    # Update layout to show grid
+    figures["resolution"].update_layout(
+        xaxis_title="Severity Level",
+        yaxis_title="Days to Resolve",
+        xaxis=dict(showgrid=True),
+        yaxis=dict(showgrid=True),
+    )
+
+    daily_tickets = dict_to_series(aggregates["daily_completed_tickets"])
+    daily_tickets = daily_tickets.rename("Number of Tickets").rename_axis("Date")
+    daily_tickets = daily_tickets.reset_index()
+    daily_tickets["Date"] = pd.to_datetime(daily_tickets["Date"])
+
+    for time_granularity in ["Weekly", "Daily"]:
         if time_granularity == "Weekly":
             x_value = daily_tickets["Date"].dt.strftime("%U")
             x_label = "Week of Year"
@@ -126,7 +136,7 @@ def developer_performance(data):
             x_value = daily_tickets["Date"].dt.strftime("%d")
             x_label = "Day of Month"
 
-        fig_resolution = px.density_heatmap(
+        fig_heatmap = px.density_heatmap(
             daily_tickets,
             x=x_value,
             y=daily_tickets["Date"].dt.strftime("%A"),
@@ -136,38 +146,92 @@ def developer_performance(data):
             color_continuous_scale="darkmint",
         )
 
-        fig_resolution.update_layout(
+        fig_heatmap.update_layout(
             xaxis_title="Day of Month",
             yaxis_title="Day of Week",
             coloraxis_colorbar_title="Number of Tickets",
         )
+        figures[f"heatmap_{time_granularity.lower()}"] = fig_heatmap
+
+    if aggregates["story_points"] is not None:
+        story_points = dict_to_series(aggregates["story_points"])
+        figures["story_points"] = px.bar(
+            x=story_points.index,
+            y=story_points.values,
+            labels={"x": "Assignee", "y": "Total Story Points"},
+            title="Story Points per Assignee",
+        )
+        figures["story_points"].update_layout(xaxis_tickangle=-45)
+
+    figures["issue_types"] = px.bar(
+        dict_to_frame(aggregates["issue_types_by_assignee"]),
+        title="Issue Types Distribution per Assignee",
+        labels={"value": "Number of Tickets", "Assignee": "Assignee"},
+        barmode="stack",
+    )
+    figures["issue_types"].update_layout(xaxis_tickangle=-45)
+
+    return figures
+
+
+def render_developer_performance(aggregates, figures, key_prefix):
+    st.title("Year End Dev Performance Report")
+    col1, col2, col3 = st.columns([2, 2, 1])
+
+    with col1:
+        st.plotly_chart(figures["assignees"], key=f"{key_prefix}:assignees")
+
+    with col2:
+        st.plotly_chart(figures["priorities"], key=f"{key_prefix}:priorities")
+
+    with col3:
+        st.subheader("MVP Leaderboard")
+        for rank, (name, count) in enumerate(aggregates["mvp"].items(), 1):
+            st.metric(f"#{rank} - {name}", f"{count} tickets completed")
+
+    col1, col2 = st.columns(2)
+    with col1:
+        st.plotly_chart(figures["resolution"], key=f"{key_prefix}:resolution")
+    with col2:
+        time_granularity = st.selectbox(
+            "Select Time Granularity",
+            ["Weekly", "Daily"],
+            key=f"{key_prefix}:time_granularity",
+        )
+        st.plotly_chart(
+            figures[f"heatmap_{time_granularity.lower()}"], key=f"{key_prefix}:heatmap"
+        )
+
+    col1, col2 = st.columns(2)
+    with col1:
+        if "story_points" in figures:
+            st.plotly_chart(figures["story_points"], key=f"{key_prefix}:story_points")
+
+    with col2:
+        st.plotly_chart(figures["issue_types"], key=f"{key_prefix}:issue_types")
 
-        st.plotly_chart(fig_resolution)
 
+def developer_performance_comparison(data):
+    st.subheader("Dev performance comparison")
     col1, col2 = st.columns(2)
     with col1:
-        if "Story Points" in data.columns and data["Story Points"].notna().any():
-            story_points = (
-                data.groupby("Assignee")["Story Points"]
-                .sum()
-                .sort_values(ascending=False)
-            )
-            fig_points = px.bar(
-                x=story_points.index,
-                y=story_points.values,
-                labels={"x": "Assignee", "y": "Total Story Points"},
-                title="Story Points per Assignee",
-            )
-            fig_points.update_layout(xaxis_tickangle=-45)
-            st.plotly_chart(fig_points)
+        completed_tickets = data[data["Status"].isin(COMPLETED_STATUSES)]
+        throughput = pd.crosstab(completed_tickets["Assignee"], completed_tickets["Source"])
+        fig_throughput = px.bar(
+            throughput,
+            title="Completed Tickets per Assignee per Year",
+            labels={"value": "Tickets Completed", "Assignee": "Assignee"},
+            barmode="group",
+        )
+        fig_throughput.update_layout(xaxis_tickangle=-45)
+        st.plotly_chart(fig_throughput)
 
     with col2:
-        issue_types_by_assignee = pd.crosstab(data["Assignee"], data["Issue Type"])
-        fig_types = px.bar(
-            issue_types_by_assignee,
-            title="Issue Types Distribution per Assignee",
-            labels={"value": "Number of Tickets", "Assignee": "Assignee"},
-            barmode="stack",
+        priority_by_source = pd.crosstab(data["Source"], data["Priority"])
+        fig_priority = px.bar(
+            priority_by_source,
+            title="Tickets by Priority per Year",
+            labels={"value": "Number of Tickets", "Source": "Source"},
+            barmode="group",
         )
-        fig_types.update_layout(xaxis_tickangle=-45)
-        st.plotly_chart(fig_types)
+        st.plotly_chart(fig_priority)
@@ -1,14 +1,30 @@
+import pandas as pd
 import streamlit as st
 import plotly.express as px
+from src.visualizer.aggregates import dict_to_series, series_to_dict
 
 
-def fix_versions_kpi(data):
-    st.subheader("Fix Version KPIs")
+def fix_versions_kpi(data, key_prefix):
+    aggregates = compute_fix_versions_kpi(data)
+    render_fix_versions_kpi(
+        aggregates, fix_versions_kpi_figures(aggregates), key_prefix
+    )
+
 
+def compute_fix_versions_kpi(data):
     fix_version_data = data[data["Fix Version"].notna()]
 
     fix_version_counts = fix_version_data["Fix Version"].value_counts()
 
+    return {
+        "fix_version_counts": series_to_dict(fix_version_counts),
+        "total_tickets": len(data),
+    }
+
+
+def fix_versions_kpi_figures(aggregates):
+    fix_version_counts = dict_to_series(aggregates["fix_version_counts"])
+
     fig_fix_version = px.bar(
         x=fix_version_counts.index,
         y=fix_version_counts.values,
@@ -25,7 +41,21 @@ def fix_versions_kpi(data):
         },
     )
 
-    st.plotly_chart(fig_fix_version, use_container_width=True)
+    return {"fix_versions": fig_fix_version}
+
+
+def render_fix_versions_kpi(aggregates, figures, key_prefix):
+    st.subheader("Fix Version KPIs")
+
+    st.plotly_chart(
+        figures["fix_versions"],
+        use_container_width=True,
+        key=f"{key_prefix}:fix_versions",
+    )
+
+    fix_version_counts = dict_to_series(aggregates["fix_version_counts"])
+    # Percentages of an empty selection are 0 rather than a division by zero
+    total_tickets = aggregates["total_tickets"] or 1
 
     col1, col2, col3, col4 = st.columns(4)
     with col1:
@@ -33,17 +63,48 @@ def fix_versions_kpi(data):
     with col2:
         st.metric(
             "Total Tickets with Fix Versions",
-            f"{(fix_version_counts.sum() / len(data) * 100):.1f}%",
+            f"{(fix_version_counts.sum() / total_tickets * 100):.1f}%",
         )
     with col3:
         st.metric(
             "Total Tickets without Fix Versions",
-            f"{((len(data) - fix_version_counts.sum()) / len(data) * 100):.1f}%",
+            f"{((total_tickets - fix_version_counts.sum()) / total_tickets * 100):.1f}%",
         )
     with col4:
         # fix version with the most tickets
-        st.metric(
-            "Fix Version with the most tickets",
-            f"{fix_version_counts.idxmax()} ({fix_version_counts.max()} tickets)",
-            help=f"This is the fix version with the most tickets: {fix_version_counts.max()}",
+        if fix_version_counts.empty:
+            st.metric("Fix Version with the most tickets", "-")
+        else:
+            st.metric(
+                "Fix Version with the most tickets",
+                f"{fix_version_counts.idxmax()} ({fix_version_counts.max()} tickets)",
+                help=f"This is the fix version with the most tickets: {fix_version_counts.max()}",
+            )
+
+
+def fix_versions_kpi_comparison(data):
+    st.subheader("Fix Version comparison")
+    by_source = data.groupby("Source")["Fix Version"]
+    fix_versions = pd.DataFrame(
+        {
+            "Fix Versions": by_source.nunique(),
+            "% Tickets with Fix Versions": by_source.apply(
+                lambda versions: versions.notna().mean() * 100
+            ),
+        }
+    )
+    col1, col2 = st.columns(2)
+    with col1:
+        fig_versions = px.bar(
+            fix_versions,
+            y="Fix Versions",
+            title="Fix Versions per Year",
+        )
+        st.plotly_chart(fig_versions, use_container_width=True)
+    with col2:
+        fig_coverage = px.bar(
+            fix_versions,
+            y="% Tickets with Fix Versions",
+            title="Tickets with Fix Versions per Year",
         )
+        st.plotly_chart(fig_coverage, use_container_width=True)
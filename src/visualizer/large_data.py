@@ -0,0 +1,91 @@
+import os
+
+import numpy as np
+import pandas as pd
+
+# Above this many points charts switch to WebGL, downsampled lines and trimmed hover data
+LARGE_DATA_POINTS = int(os.getenv("LARGE_DATA_POINTS", "5000"))
+
+
+def is_large(points, threshold=None):
+    """Whether a chart with this many points should use the large-data path"""
+    return points > (threshold or LARGE_DATA_POINTS)
+
+
+def lttb_indices(x, y, threshold):
+    """
+    Largest-Triangle-Three-Buckets downsampling
+
+    Keeps the first and last points and, for every bucket in between, the point
+    forming the largest triangle with the previously kept point and the average
+    of the next bucket, which preserves peaks and troughs of the series.
+
+    :param x: Numeric x values, sorted ascending
+    :param y: Numeric y values
+    :param threshold: Number of points to keep
+    :return: Indices of the points to keep
+    """
+    n = len(x)
+    if threshold >= n or threshold < 3:
+        return np.arange(n)
+
+    x = np.asarray(x, dtype=float)
+    y = np.asarray(y, dtype=float)
+    bucket_size = (n - 2) / (threshold - 2)
+
+    indices = np.empty(threshold, dtype=np.int64)
+    indices[0] = 0
+    indices[-1] = n - 1
+    previous = 0
+
+    for i in range(threshold - 2):
+        start = int(i * bucket_size) + 1
+        end = int((i + 1) * bucket_size) + 1
+        next_end = min(int((i + 2) * bucket_size) + 1, n)
+
+        avg_x = x[end:next_end].mean()
+        avg_y = y[end:next_end].mean()
+
+        areas = np.abs(
+            (x[previous] - avg_x) * (y[start:end] - y[previous])
+            - (x[previous] - x[start:end]) * (avg_y - y[previous])
+        )
+        previous = start + int(np.argmax(areas))
+        indices[i + 1] = previous
+
+    return indices
+
+
+def downsample_series(series: pd.Series, threshold=None):
+    """
+    Downsample a series indexed by date or number when it is too long to plot
+
+    :param series: Series sorted by index
+    :param threshold: Number of points to keep, defaults to LARGE_DATA_POINTS
+    :return: The series itself when small enough, otherwise an LTTB subset
+    """
+    threshold = threshold or LARGE_DATA_POINTS
+    if not is_large(len(series), threshold):
+        return series
+
+    index = pd.Index(series.index)
+    if pd.api.types.is_numeric_dtype(index):
+        x = index.to_numpy(dtype=float)
+    else:
+        x = pd.to_datetime(index).asi8.astype(float)
+
+    return series.iloc[lttb_indices(x, series.to_numpy(), threshold)]
+
+
+def scatter_options(points, hover_data, threshold=None):
+    """
+    Keyword arguments for px.scatter adapted to the number of points
+
+    :param points: Number of markers in the scatter
+    :param hover_data: Hover columns used for small datasets
+    :param threshold: Point count above which the WebGL path is used
+    :return: Dictionary of px.scatter keyword arguments
+    """
+    if is_large(points, threshold):
+        return {"render_mode": "webgl", "hover_data": None}
+    return {"hover_data": hover_data}
@@ -0,0 +1,105 @@
+import json
+import threading
+import time
+import tracemalloc
+from contextlib import contextmanager
+from importlib import metadata
+
+import pandas as pd
+import streamlit as st
+
+PROFILE_FORMAT_VERSION = 1
+
+# tracemalloc is global to the process, the stages of concurrent dashboard
+# sessions are measured one at a time
+_TRACE_LOCK = threading.RLock()
+
+
+class RenderProfiler:
+    def __init__(self, enabled=True):
+        """
+        Collect wall time and peak memory of each report stage
+
+        :param enabled: When False, stages run untimed and nothing is recorded
+        """
+        self.enabled = enabled
+        self.records = []
+
+    @contextmanager
+    def stage(self, section, stage):
+        """
+        Time a stage of a section, e.g. ("developer_performance", "compute")
+
+        Peak memory is the highest traced allocation size reached during the
+        stage, measured with tracemalloc. Tracing is started for the stage and
+        stopped after it, unless something else had started it.
+        """
+        if not self.enabled:
+            yield
+            return
+
+        with _TRACE_LOCK:
+            started = not tracemalloc.is_tracing()
+            if started:
+                tracemalloc.start()
+            tracemalloc.reset_peak()
+            start_memory, _ = tracemalloc.get_traced_memory()
+            start = time.perf_counter()
+            try:
+                yield
+            finally:
+                elapsed = time.perf_counter() - start
+                _, peak_memory = tracemalloc.get_traced_memory()
+                if started:
+                    tracemalloc.stop()
+                self.records.append(
+                    {
+                        "section": section,
+                        "stage": stage,
+                        "seconds": round(elapsed, 6),
+                        "peak_memory_bytes": max(peak_memory - start_memory, 0),
+                    }
+                )
+
+    def to_dict(self):
+        try:
+            version = metadata.version("jira-scraper")
+        except metadata.PackageNotFoundError:
+            version = None
+
+        return {
+            "format_version": PROFILE_FORMAT_VERSION,
+            "package_version": version,
+            "created_at": time.strftime("%Y-%m-%dT%H:%M:%S"),
+            "total_seconds": round(sum(r["seconds"] for r in self.records), 6),
+            "stages": self.records,
+        }
+
+    def to_json(self):
+        return json.dumps(self.to_dict(), indent=2)
+
+
+def profiler_panel(profiler):
+    """Show the collected stage timings in the sidebar with a JSON export"""
+    if not profiler.enabled:
+        return
+
+    with st.sidebar.expander("Render profile", expanded=True):
+        if not profiler.records:
+            st.write("No stages recorded")
+            return
+
+        stages = pd.DataFrame(profiler.records)
+        stages["peak_memory_mb"] = stages["peak_memory_bytes"] / (1024 * 1024)
+        st.dataframe(
+            stages[["section", "stage", "seconds", "peak_memory_mb"]],
+            hide_index=True,
+            use_container_width=True,
+        )
+        st.metric("Total", f"{stages['seconds'].sum():.3f}s")
+        st.download_button(
+            "Export profile as JSON",
+            profiler.to_json(),
+            file_name="render_profile.json",
+            mime="application/json",
+        )
@@ -0,0 +1,65 @@
+import math
+
+import pandas as pd
+import streamlit as st
+from src.visualizer.priority_icons import priority_icons
+
+DEFAULT_TOP_N = 500
+PAGE_SIZE = 50
+
+
+def top_n_records(data, column, columns, n=DEFAULT_TOP_N):
+    """
+    Select the n rows with the largest values of a column
+
+    :param data: Issues dataframe
+    :param column: Numeric column to rank by
+    :param columns: Columns kept in the result
+    :param n: Number of rows to keep
+    :return: List of row dicts, highest first
+    """
+    return data.nlargest(n, column)[columns].to_dict(orient="records")
+
+
+def ranked_table(records, title, key_prefix, page_size=PAGE_SIZE, column_config=None):
+    """
+    Render ranked rows as a single virtualized grid, one page at a time
+
+    :param records: Row dicts as returned by top_n_records
+    :param title: Subheader shown above the grid
+    :param key_prefix: Namespace of the report being rendered, the pager key is
+        derived from it and the title so reports can share a page
+    :param page_size: Number of rows sent to the browser per page
+    :param column_config: Optional st.dataframe column configuration
+    """
+    st.subheader(title)
+    if not records:
+        st.write("No tickets to rank")
+        return
+
+    pages = math.ceil(len(records) / page_size)
+    page = 1
+    if pages > 1:
+        page = st.number_input(
+            f"Page (1-{pages})",
+            min_value=1,
+            max_value=pages,
+            value=1,
+            key=f"{key_prefix}:{title}",
+        )
+
+    start = (page - 1) * page_size
+    frame = pd.DataFrame(records[start : start + page_size])
+    frame.insert(0, "Rank", range(start + 1, start + 1 + len(frame)))
+    if "Priority" in frame.columns:
+        frame["Priority"] = [
+            f"{priority_icons.get(priority, '•')} {priority}"
+            for priority in frame["Priority"]
+        ]
+
+    st.dataframe(
+        frame,
+        hide_index=True,
+        use_container_width=True,
+        column_config=column_config,
+    )
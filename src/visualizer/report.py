@@ -0,0 +1,115 @@
+from src.visualizer.comment_stats import (
+    comment_stats_comparison,
+    comment_stats_figures,
+    compute_comment_stats,
+    render_comment_stats,
+)
+from src.visualizer.developer_performance import (
+    compute_developer_performance,
+    developer_performance_comparison,
+    developer_performance_figures,
+    render_developer_performance,
+)
+from src.visualizer.fix_versions_kpi import (
+    compute_fix_versions_kpi,
+    fix_versions_kpi_comparison,
+    fix_versions_kpi_figures,
+    render_fix_versions_kpi,
+)
+from src.visualizer.sprint_analytics import (
+    compute_sprint_analytics,
+    render_sprint_analytics,
+    sprint_analytics_figures,
+)
+from src.visualizer.ticket_distribution import (
+    compute_ticket_distribution,
+    render_ticket_distribution,
+    ticket_distribution_comparison,
+    ticket_distribution_figures,
+)
+from src.visualizer.ticket_rankings import (
+    compute_ticket_rankings,
+    render_ticket_rankings,
+    ticket_rankings_figures,
+)
+from src.visualizer.ticket_linkage import (
+    compute_ticket_linkage,
+    render_ticket_linkage,
+    ticket_linkage_comparison,
+    ticket_linkage_figures,
+)
+
+
+class ReportSection:
+    def __init__(self, name, compute, figures, render, comparison=None):
+        """
+        A report section split into its compute, figure and render stages
+
+        :param name: Section name, used as key in caches and snapshots
+        :param compute: Callable turning the issues dataframe into JSON-friendly aggregates
+        :param figures: Callable turning aggregates into a dict of plotly figures
+        :param render: Callable laying out aggregates and figures with streamlit, widget
+            keys are namespaced by its key_prefix argument
+        :param comparison: Optional callable rendering the multi-source overlay from the dataframe
+        """
+        self.name = name
+        self.compute = compute
+        self.figures = figures
+        self.render = render
+        self.comparison = comparison
+
+    def build(self, data):
+        """Compute the aggregates and figures of this section"""
+        aggregates = self.compute(data)
+        return aggregates, self.figures(aggregates)
+
+
+REPORT_SECTIONS = [
+    ReportSection(
+        "ticket_distribution",
+        compute_ticket_distribution,
+        ticket_distribution_figures,
+        render_ticket_distribution,
+        ticket_distribution_comparison,
+    ),
+    ReportSection(
+        "developer_performance",
+        compute_developer_performance,
+        developer_performance_figures,
+        render_developer_performance,
+        developer_performance_comparison,
+    ),
+    ReportSection(
+        "sprint_analytics",
+        compute_sprint_analytics,
+        sprint_analytics_figures,
+        render_sprint_analytics,
+    ),
+    ReportSection(
+        "ticket_linkage",
+        compute_ticket_linkage,
+        ticket_linkage_figures,
+        render_ticket_linkage,
+        ticket_linkage_comparison,
+    ),
+    ReportSection(
+        "fix_versions_kpi",
+        compute_fix_versions_kpi,
+        fix_versions_kpi_figures,
+        render_fix_versions_kpi,
+        fix_versions_kpi_comparison,
+    ),
+    ReportSection(
+        "comment_stats",
+        compute_comment_stats,
+        comment_stats_figures,
+        render_comment_stats,
+        comment_stats_comparison,
+    ),
+    ReportSection(
+        "ticket_rankings",
+        compute_ticket_rankings,
+        ticket_rankings_figures,
+        render_ticket_rankings,
+    ),
+]
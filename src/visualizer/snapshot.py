@@ -0,0 +1,109 @@
+import json
+import os
+import time
+
+import plotly.graph_objects as go
+from src.analyzer.loader import load_csv
+from src.visualizer.report import REPORT_SECTIONS
+
+# Bump when the aggregates or figures of a section change shape or meaning
+SNAPSHOT_VERSION = 5
+SNAPSHOT_SUFFIX = ".snapshot"
+
+
+def snapshot_dir(csv_path):
+    """Directory holding the versioned snapshot bundle of a CSV"""
+    root, _ = os.path.splitext(csv_path)
+    return os.path.join(root + SNAPSHOT_SUFFIX, f"v{SNAPSHOT_VERSION}")
+
+
+def build_snapshot(csv_path, html=False):
+    """
+    Run every report section on a CSV and write the results to a snapshot bundle
+
+    :param csv_path: Path to an issues CSV produced by issues-to-csv
+    :param html: Also write each figure as a standalone HTML page
+    :return: Path of the bundle directory
+    """
+    bundle_dir = snapshot_dir(csv_path)
+    os.makedirs(bundle_dir, exist_ok=True)
+    if html:
+        os.makedirs(os.path.join(bundle_dir, "html"), exist_ok=True)
+
+    data = load_csv(csv_path)
+
+    aggregates = {}
+    figures = {}
+    for section in REPORT_SECTIONS:
+        section_aggregates, section_figures = section.build(data)
+        aggregates[section.name] = section_aggregates
+        figures[section.name] = {
+            name: json.loads(figure.to_json())
+            for name, figure in section_figures.items()
+        }
+        if html:
+            for name, figure in section_figures.items():
+                figure.write_html(
+                    os.path.join(bundle_dir, "html", f"{section.name}_{name}.html"),
+                    include_plotlyjs="cdn",
+                )
+
+    with open(os.path.join(bundle_dir, "aggregates.json"), "w", encoding="utf-8") as f:
+        json.dump(aggregates, f)
+    with open(os.path.join(bundle_dir, "figures.json"), "w", encoding="utf-8") as f:
+        json.dump(figures, f)
+
+    # The manifest is written last so a half-written bundle is never picked up
+    manifest = {
+        "version": SNAPSHOT_VERSION,
+        "source": os.path.basename(csv_path),
+        "source_mtime": os.path.getmtime(csv_path),
+        "source_size": os.path.getsize(csv_path),
+        "created_at": time.strftime("%Y-%m-%dT%H:%M:%S"),
+        "sections": [section.name for section in REPORT_SECTIONS],
+    }
+    with open(os.path.join(bundle_dir, "manifest.json"), "w", encoding="utf-8") as f:
+        json.dump(manifest, f, indent=2)
+
+    return bundle_dir
+
+
+def has_snapshot(csv_path):
+    """Whether an up to date snapshot exists for a CSV"""
+    manifest_path = os.path.join(snapshot_dir(csv_path), "manifest.json")
+    if not os.path.exists(manifest_path):
+        return False
+
+    with open(manifest_path, "r", encoding="utf-8") as f:
+        manifest = json.load(f)
+
+    return (
+        manifest.get("version") == SNAPSHOT_VERSION
+        and manifest.get("source_mtime") == os.path.getmtime(csv_path)
+        and manifest.get("source_size") == os.path.getsize(csv_path)
+    )
+
+
+def load_snapshot(csv_path):
+    """
+    Load the aggregates and figures of a snapshot bundle
+
+    :param csv_path: Path to the CSV the snapshot was built from
+    :return: Dictionary of section name to (aggregates, figures)
+    """
+    bundle_dir = snapshot_dir(csv_path)
+    with open(os.path.join(bundle_dir, "aggregates.json"), "r", encoding="utf-8") as f:
+        aggregates = json.load(f)
+    with open(os.path.join(bundle_dir, "figures.json"), "r", encoding="utf-8") as f:
+        figures = json.load(f)
+
+    return {
+        name: (
+            aggregates[name],
+            {
+                figure_name: go.Figure(figure)
+                for figure_name, figure in figures[name].items()
+            },
+        )
+        for name in aggregates
+    }
@@ -0,0 +1,94 @@
+import pandas as pd
+import plotly.express as px
+import plotly.graph_objects as go
+import streamlit as st
+from src.analyzer.sprints import sprint_membership, sprint_stats
+from src.visualizer.aggregates import dict_to_frame, frame_to_dict
+from src.visualizer.developer_performance import COMPLETED_STATUSES
+
+
+def sprint_analytics(data, key_prefix):
+    aggregates = compute_sprint_analytics(data)
+    render_sprint_analytics(
+        aggregates, sprint_analytics_figures(aggregates), key_prefix
+    )
+
+
+def compute_sprint_analytics(data):
+    stats = sprint_stats(sprint_membership(data), COMPLETED_STATUSES)
+    stats = stats.assign(
+        Start=pd.to_datetime(stats["Start"], utc=True).dt.strftime("%Y-%m-%d"),
+        End=pd.to_datetime(stats["End"], utc=True).dt.strftime("%Y-%m-%d"),
+    )
+    return {"sprints": frame_to_dict(stats)}
+
+
+def sprint_analytics_figures(aggregates):
+    stats = dict_to_frame(aggregates["sprints"])
+    if stats.empty:
+        return {}
+
+    fig_commitment = px.bar(
+        stats,
+        x="Sprint",
+        y=["Committed Points", "Completed Points"],
+        title="Committed vs Completed per Sprint",
+        labels={"value": "Points", "variable": ""},
+        barmode="group",
+    )
+    closed = stats[stats["State"] == "closed"]
+    fig_commitment.add_trace(
+        go.Scatter(
+            x=closed["Sprint"],
+            y=closed["Velocity"],
+            mode="lines+markers",
+            name="Velocity",
+        )
+    )
+
+    fig_carry_over = px.line(
+        stats,
+        x="Sprint",
+        y="Carry-over Rate",
+        title="Carry-over Rate per Sprint",
+        markers=True,
+    )
+    fig_carry_over.update_layout(yaxis_tickformat=".0%")
+
+    return {"commitment": fig_commitment, "carry_over": fig_carry_over}
+
+
+def render_sprint_analytics(aggregates, figures, key_prefix):
+    st.title("Sprint Analytics")
+    stats = dict_to_frame(aggregates["sprints"])
+    if stats.empty:
+        st.info(
+            "No sprint history in this data. Convert the issues again with "
+            "`cli.py issues-to-csv` to include the Sprint History column."
+        )
+        return
+
+    closed = stats[stats["State"] == "closed"]
+    col1, col2, col3 = st.columns(3)
+    with col1:
+        st.metric("Sprints", len(stats))
+    with col2:
+        st.metric(
+            "Current Velocity",
+            f"{closed['Velocity'].iloc[-1]:.1f}" if len(closed) else "-",
+            help="Completed points averaged over the last closed sprints",
+        )
+    with col3:
+        st.metric(
+            "Average Carry-over Rate",
+            f"{closed['Carry-over Rate'].mean():.0%}" if len(closed) else "-",
+            help="Share of a sprint's tickets that moved on to a later sprint",
+        )
+
+    st.plotly_chart(
+        figures["commitment"], use_container_width=True, key=f"{key_prefix}:commitment"
+    )
+    st.plotly_chart(
+        figures["carry_over"], use_container_width=True, key=f"{key_prefix}:carry_over"
+    )
+    st.dataframe(stats, use_container_width=True, key=f"{key_prefix}:sprints")
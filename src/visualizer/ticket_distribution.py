@@ -1,62 +1,109 @@
 import pandas as pd
 import plotly.express as px
 import streamlit as st
+from src.visualizer.aggregates import dict_to_series, series_to_dict
 from src.visualizer.priority_icons import priority_icons
+from src.visualizer.large_data import downsample_series
 
 
-def ticket_distribution(data: pd.DataFrame):
+def ticket_distribution(data: pd.DataFrame, key_prefix):
+    aggregates = compute_ticket_distribution(data)
+    render_ticket_distribution(
+        aggregates, ticket_distribution_figures(aggregates), key_prefix
+    )
+
+
+def compute_ticket_distribution(data: pd.DataFrame):
+    daily_tickets = (
+        data.groupby(data["Created"].dt.date)["Issue Key"].count().sort_index()
+    )
+    highest_priority = len(data[data["Priority"] == "Highest"])
+    priority_modes = data["Priority"].mode()
+
+    return {
+        "daily_tickets": series_to_dict(downsample_series(daily_tickets)),
+        "issue_types": series_to_dict(data["Issue Type"].value_counts()),
+        "statuses": series_to_dict(data["Status"].value_counts()),
+        "total_tickets": len(data),
+        "issue_type_count": len(data["Issue Type"].unique()),
+        "status_count": len(data["Status"].unique()),
+        "assignee_count": len(data["Assignee"].unique()),
+        "story_points": float(data["Story Points"].sum()),
+        # No mode when no ticket has a priority
+        "most_common_priority": priority_modes[0] if not priority_modes.empty else None,
+        "highest_priority_pct": f"{(highest_priority/max(len(data), 1)*100):.1f}%",
+    }
+
+
+def ticket_distribution_figures(aggregates):
+    daily_tickets = dict_to_series(aggregates["daily_tickets"])
+    fig_daily = px.line(
+        x=pd.to_datetime(daily_tickets.index),
+        y=daily_tickets.values,
+        labels={"x": "Date", "y": "Number of Tickets"},
+    )
+
+    issue_type_dist = dict_to_series(aggregates["issue_types"])
+    fig_issue = px.pie(
+        values=issue_type_dist.values,
+        names=issue_type_dist.index,
+        title="Distribution of Issue Types",
+    )
+
+    status_dist = dict_to_series(aggregates["statuses"])
+    fig_status = px.pie(
+        values=status_dist.values,
+        names=status_dist.index,
+        title="Distribution of Issue Status",
+    )
+
+    return {"daily": fig_daily, "issue_types": fig_issue, "statuses": fig_status}
+
+
+def render_ticket_distribution(aggregates, figures, key_prefix):
     st.title("Ticket distribution of the year")
     col1, col2, col3 = st.columns(3)
     with col1:
         st.subheader("Daily Ticket Creation")
-        daily_tickets = (
-            data.groupby(data["Created"].dt.date)["Issue Key"].count().sort_index()
+        st.plotly_chart(
+            figures["daily"], use_container_width=True, key=f"{key_prefix}:daily"
         )
-        fig_daily = px.line(
-            x=daily_tickets.index,
-            y=daily_tickets.values,
-            labels={"x": "Date", "y": "Number of Tickets"},
-        )
-        st.plotly_chart(fig_daily, use_container_width=True)
 
     with col2:
         st.subheader("Issue Type Distribution")
-        issue_type_dist = data["Issue Type"].value_counts()
-        fig_issue = px.pie(
-            values=issue_type_dist.values,
-            names=issue_type_dist.index,
-            title="Distribution of Issue Types",
+        st.plotly_chart(
+            figures["issue_types"],
+            use_container_width=True,
+            key=f"{key_prefix}:issue_types",
         )
-        st.plotly_chart(fig_issue, use_container_width=True)
 
     with col3:
         st.subheader("Status Distribution")
-        status_dist = data["Status"].value_counts()
-        fig_status = px.pie(
-            values=status_dist.values,
-            names=status_dist.index,
-            title="Distribution of Issue Status",
+        st.plotly_chart(
+            figures["statuses"], use_container_width=True, key=f"{key_prefix}:statuses"
         )
-        st.plotly_chart(fig_status, use_container_width=True)
 
     st.subheader("Summary Metrics")
     col1, col2, col3, col4, col5, col6, col7, col8 = st.columns(8)
     with col1:
-        st.metric("Total Tickets", len(data))
+        st.metric("Total Tickets", aggregates["total_tickets"])
     with col2:
-        st.metric("Issue Types", len(data["Issue Type"].unique()))
+        st.metric("Issue Types", aggregates["issue_type_count"])
     with col3:
-        st.metric("Status Types", len(data["Status"].unique()))
+        st.metric("Status Types", aggregates["status_count"])
     with col4:
-        st.metric("Assignees", len(data["Assignee"].unique()))
+        st.metric("Assignees", aggregates["assignee_count"])
     with col5:
-        st.metric("Story Points", data["Story Points"].sum())
+        st.metric("Story Points", aggregates["story_points"])
     with col6:
-        priority_with_icon = f"{priority_icons.get(data['Priority'].mode()[0], '•')} {data['Priority'].mode()[0]}"
+        most_common_priority = aggregates["most_common_priority"]
+        if most_common_priority is None:
+            priority_with_icon = "-"
+        else:
+            priority_with_icon = f"{priority_icons.get(most_common_priority, '•')} {most_common_priority}"
         st.metric("Most Common Priority", priority_with_icon)
     with col7:
-        highest_priority = len(data[data["Priority"] == "Highest"])
-        highest_priority_pct = f"{(highest_priority/len(data)*100):.1f}%"
+        highest_priority_pct = aggregates["highest_priority_pct"]
 
         def burn_out_calc(highest_priority_pct):
             if float(highest_priority_pct.strip("%")) > 50:
@@ -69,3 +116,34 @@ def ticket_distribution(data: pd.DataFrame):
             highest_priority_pct,
             help=burn_out_calc(highest_priority_pct),
         )
+
+
+def ticket_distribution_comparison(data: pd.DataFrame):
+    st.subheader("Ticket distribution comparison")
+    col1, col2 = st.columns(2)
+    with col1:
+        # Align the years on day of year so they overlay each other
+        daily_tickets = (
+            data.groupby(["Source", data["Created"].dt.dayofyear])["Issue Key"]
+            .count()
+            .reset_index()
+        )
+        daily_tickets.columns = ["Source", "Day of Year", "Number of Tickets"]
+        fig_daily = px.line(
+            daily_tickets,
+            x="Day of Year",
+            y="Number of Tickets",
+            color="Source",
+            title="Daily Ticket Creation per Year",
+        )
+        st.plotly_chart(fig_daily, use_container_width=True)
+
+    with col2:
+        issue_types = pd.crosstab(data["Source"], data["Issue Type"], normalize="index")
+        fig_issue = px.bar(
+            issue_types * 100,
+            title="Issue Type Share per Year",
+            labels={"value": "% of Tickets", "Source": "Source"},
+            barmode="stack",
+        )
+        st.plotly_chart(fig_issue, use_container_width=True)
@@ -1,16 +1,71 @@
 import pandas as pd
 import plotly.express as px
 import streamlit as st
+from src.analyzer.link_graph import LinkGraph, frame_edges
+from src.visualizer.aggregates import (
+    dict_to_frame,
+    dict_to_series,
+    frame_to_dict,
+    series_to_dict,
+)
+from src.visualizer.developer_performance import COMPLETED_STATUSES
 
+# Number of tickets listed in the dependency and rollup charts
+TOP_LINKED = 15
+
+
+def ticket_linkage(data, key_prefix):
+    aggregates = compute_ticket_linkage(data)
+    render_ticket_linkage(aggregates, ticket_linkage_figures(aggregates), key_prefix)
 
-def ticket_linkage(data):
-    st.title("Ticket Linkage")
 
+def compute_ticket_linkage(data):
     parent_tickets = data[data["Parent Ticket"].notna()]
     parent_assignee_dist = pd.crosstab(
         parent_tickets["Parent Ticket"], parent_tickets["Assignee"]
     )
 
+    return {
+        "parent_assignee_dist": frame_to_dict(parent_assignee_dist),
+        "total_parent_tickets": len(parent_tickets["Epic Link"].unique()),
+        "total_sub_tickets": len(parent_tickets),
+        "most_sub_tickets": (
+            parent_assignee_dist.idxmax().values[0] if not parent_assignee_dist.empty else "-"
+        ),
+        **compute_link_graph(data),
+    }
+
+
+def compute_link_graph(data):
+    """Dependency, blocker chain, epic rollup and cluster aggregates from the link graph"""
+    graph = LinkGraph(frame_edges(data), data["Issue Key"])
+    statuses = data.drop_duplicates("Issue Key", keep="last").set_index("Issue Key")["Status"]
+
+    # Roll up from the top of each hierarchy, e.g. epics rather than their stories
+    rollups = []
+    for key in graph.hierarchy_roots():
+        descendants = graph.epic_rollup(key)
+        done = statuses.reindex(descendants).isin(COMPLETED_STATUSES).sum()
+        rollups.append((key, len(descendants), int(done)))
+    rollups = pd.DataFrame(rollups, columns=["Parent", "Tickets", "Done"]).set_index("Parent")
+    rollups = rollups.nlargest(TOP_LINKED, "Tickets")
+    rollups["Open"] = rollups["Tickets"] - rollups["Done"]
+
+    component_sizes = graph.component_sizes()
+    return {
+        "most_depended_on": series_to_dict(graph.most_depended_on(TOP_LINKED)),
+        "longest_blocker_chains": series_to_dict(
+            graph.blocked_by_count().nlargest(TOP_LINKED)
+        ),
+        "epic_rollups": frame_to_dict(rollups[["Done", "Open"]]),
+        "linked_clusters": len(component_sizes),
+        "largest_cluster": int(component_sizes[0]) if len(component_sizes) else 0,
+    }
+
+
+def ticket_linkage_figures(aggregates):
+    parent_assignee_dist = dict_to_frame(aggregates["parent_assignee_dist"])
+
     fig_parent = px.bar(
         parent_assignee_dist,
         title="Parent Tickets Distribution by Assignee",
@@ -40,24 +95,121 @@ def ticket_linkage(data):
         },
     )
 
-    st.plotly_chart(fig_parent, use_container_width=True)
+    figures = {"parents": fig_parent}
+    most_depended_on = dict_to_series(aggregates["most_depended_on"])
+    blocker_chains = dict_to_series(aggregates["longest_blocker_chains"])
+    epic_rollups = dict_to_frame(aggregates["epic_rollups"])
+
+    # Older CSVs have no issue links, only chart what the graph has
+    if len(most_depended_on):
+        figures["depended_on"] = px.bar(
+            x=most_depended_on.values,
+            y=most_depended_on.index,
+            orientation="h",
+            title="Most Depended-on Tickets",
+            labels={"x": "Blocked or Child Tickets", "y": "Ticket"},
+        )
+        figures["depended_on"].update_layout(yaxis={"autorange": "reversed"})
+
+    if len(blocker_chains):
+        figures["blockers"] = px.bar(
+            x=blocker_chains.values,
+            y=blocker_chains.index,
+            orientation="h",
+            title="Longest Blocker Chains",
+            labels={"x": "Tickets Blocking It (Transitively)", "y": "Ticket"},
+        )
+        figures["blockers"].update_layout(yaxis={"autorange": "reversed"})
+
+    if len(epic_rollups):
+        figures["rollups"] = px.bar(
+            epic_rollups,
+            orientation="h",
+            title="Epic Rollups",
+            labels={"value": "Tickets", "Parent": "Epic / Parent", "variable": "Status"},
+            barmode="stack",
+        )
+        figures["rollups"].update_layout(yaxis={"autorange": "reversed"})
+
+    return figures
+
+
+def render_ticket_linkage(aggregates, figures, key_prefix):
+    st.title("Ticket Linkage")
+
+    st.plotly_chart(
+        figures["parents"], use_container_width=True, key=f"{key_prefix}:parents"
+    )
 
     col1, col2, col3 = st.columns(3)
     with col1:
         st.metric(
             "Total Parent Tickets",
-            len(parent_tickets["Epic Link"].unique()),
+            aggregates["total_parent_tickets"],
             help="This does not count the tickets that are not categorized as a parent ticket",
         )
     with col2:
         st.metric(
             "Total Sub-tickets",
-            len(parent_tickets),
+            aggregates["total_sub_tickets"],
             help="This counts all the tickets that are categorized as a sub-ticket, meaning they have tickets that are linked to them",
         )
     with col3:
         st.metric(
             "Ticket with the most sub-tickets",
-            parent_assignee_dist.idxmax().values[0],
+            aggregates["most_sub_tickets"],
             help="This is the ticket with the most sub-tickets",
         )
+
+    st.subheader("Dependencies")
+    col1, col2 = st.columns(2)
+    with col1:
+        st.metric(
+            "Linked Clusters",
+            aggregates["linked_clusters"],
+            help="Groups of tickets connected by parent, epic or issue links",
+        )
+    with col2:
+        st.metric(
+            "Largest Cluster",
+            aggregates["largest_cluster"],
+            help="Number of tickets in the largest group of connected tickets",
+        )
+
+    if "rollups" in figures:
+        st.plotly_chart(
+            figures["rollups"], use_container_width=True, key=f"{key_prefix}:rollups"
+        )
+    col1, col2 = st.columns(2)
+    with col1:
+        if "depended_on" in figures:
+            st.plotly_chart(
+                figures["depended_on"],
+                use_container_width=True,
+                key=f"{key_prefix}:depended_on",
+            )
+    with col2:
+        if "blockers" in figures:
+            st.plotly_chart(
+                figures["blockers"],
+                use_container_width=True,
+                key=f"{key_prefix}:blockers",
+            )
+
+
+def ticket_linkage_comparison(data):
+    st.subheader("Ticket linkage comparison")
+    parent_tickets = data[data["Parent Ticket"].notna()]
+    linkage = pd.DataFrame(
+        {
+            "Parent Tickets": parent_tickets.groupby("Source")["Parent Ticket"].nunique(),
+            "Sub-tickets": parent_tickets.groupby("Source").size(),
+        }
+    ).fillna(0)
+    fig_linkage = px.bar(
+        linkage,
+        title="Parent and Sub-tickets per Year",
+        labels={"value": "Number of Tickets", "Source": "Source"},
+        barmode="group",
+    )
+    st.plotly_chart(fig_linkage, use_container_width=True)
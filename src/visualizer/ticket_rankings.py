@@ -0,0 +1,74 @@
+import json
+
+import pandas as pd
+import streamlit as st
+from src.visualizer.developer_performance import COMPLETED_STATUSES
+from src.visualizer.ranked_table import ranked_table, top_n_records
+
+# Statuses of the done category, leaving one of them for any other status is a reopen
+DONE_STATUSES = ["Done", "Closed", "Resolved", *COMPLETED_STATUSES]
+
+
+def ticket_rankings(data, key_prefix):
+    aggregates = compute_ticket_rankings(data)
+    render_ticket_rankings(aggregates, ticket_rankings_figures(aggregates), key_prefix)
+
+
+def count_reopens(history):
+    """Number of times a ticket was moved out of a done status"""
+    try:
+        changes = json.loads(history)
+    except (TypeError, ValueError):
+        return 0
+    return sum(
+        1
+        for change in changes
+        if change.get("from") in DONE_STATUSES and change.get("to") not in DONE_STATUSES
+    )
+
+
+def compute_ticket_rankings(data):
+    open_tickets = data[~data["Status"].isin(COMPLETED_STATUSES)]
+    open_tickets = open_tickets.assign(
+        **{
+            "Days Open": (
+                pd.Timestamp.now(tz="UTC") - open_tickets["Created"]
+            ).dt.total_seconds()
+            / 86400
+        }
+    )
+
+    reopened_tickets = data.assign(
+        **{"Times Reopened": data["Status Change History"].map(count_reopens)}
+    )
+    reopened_tickets = reopened_tickets[reopened_tickets["Times Reopened"] > 0]
+
+    columns = ["Issue Key", "Issue Summary", "Status", "Priority", "Assignee"]
+    return {
+        "longest_open": top_n_records(open_tickets, "Days Open", columns + ["Days Open"]),
+        "most_reopened": top_n_records(
+            reopened_tickets, "Times Reopened", columns + ["Times Reopened"]
+        ),
+    }
+
+
+def ticket_rankings_figures(aggregates):
+    return {}
+
+
+def render_ticket_rankings(aggregates, figures, key_prefix):
+    st.title("Ticket Rankings")
+    col1, col2 = st.columns(2)
+    with col1:
+        ranked_table(
+            aggregates["longest_open"],
+            "Longest Open Tickets",
+            key_prefix,
+            column_config={"Days Open": st.column_config.NumberColumn(format="%.0f")},
+        )
+    with col2:
+        ranked_table(
+            aggregates["most_reopened"],
+            "Most Reopened Tickets",
+            key_prefix,
+        )
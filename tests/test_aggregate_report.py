@@ -0,0 +1,47 @@
+import pytest
+
+pd = pytest.importorskip("pandas")
+pytest.importorskip("streamlit")
+
+from src.analyzer.chunked_aggregator import aggregate_csv_in_chunks  # noqa: E402
+from streamlit.testing.v1 import AppTest  # noqa: E402
+
+
+def aggregate_reports(reports):
+    from src.visualizer.aggregate_report import aggregate_report
+
+    for file_name, aggregates in reports:
+        aggregate_report(aggregates, file_name)
+
+
+@pytest.fixture
+def aggregates(tmp_path):
+    # More commented tickets than fit on a page, so the pager is rendered
+    csv_path = tmp_path / "2024.csv"
+    pd.DataFrame(
+        {
+            "Issue Key": [f"PROJ-{number}" for number in range(120)],
+            "Issue Summary": "Summary",
+            "Created": "2024-03-01T10:00:00.000+0000",
+            "Assignee": "Jane Smith",
+            "Priority": "High",
+            "Issue Type": "Bug",
+            "Status": "Done",
+            "Fix Version": "1.0",
+            "Comment count": range(120),
+        }
+    ).to_csv(csv_path, index=False)
+    return aggregate_csv_in_chunks(csv_path)
+
+
+def test_reports_of_several_files_on_one_page(aggregates):
+    # Files with the same content render the same charts, keys must still differ
+    reports = [("2023.csv", aggregates), ("2024.csv", aggregates)]
+
+    app = AppTest.from_function(aggregate_reports, args=(reports,)).run()
+
+    assert not app.exception
+    assert [number_input.key for number_input in app.number_input] == [
+        "2023.csv:Most Commented Tickets",
+        "2024.csv:Most Commented Tickets",
+    ]
@@ -0,0 +1,52 @@
+from src.scraper.formatters import format_sprint_field, parse_sprints
+
+LEGACY_SPRINT = (
+    "com.atlassian.greenhopper.service.sprint.Sprint@1a2b[id=12,rapidViewId=3,"
+    "state=CLOSED,name=Sprint 12,startDate=2024-01-01T00:00:00.000Z,"
+    "endDate=2024-01-14T00:00:00.000Z,completeDate=<null>,sequence=12]"
+)
+SPRINT = {
+    "id": 13,
+    "name": "Sprint 13",
+    "state": "active",
+    "boardId": 3,
+    "startDate": "2024-01-15T00:00:00.000Z",
+    "endDate": "2024-01-28T00:00:00.000Z",
+}
+
+
+def test_parse_legacy_sprint_strings():
+    assert parse_sprints([LEGACY_SPRINT]) == [
+        {
+            "id": 12,
+            "name": "Sprint 12",
+            "state": "closed",
+            "startDate": "2024-01-01T00:00:00.000Z",
+            "endDate": "2024-01-14T00:00:00.000Z",
+            "completeDate": None,
+        }
+    ]
+
+
+def test_parse_sprint_objects():
+    assert parse_sprints([SPRINT]) == [
+        {
+            "id": 13,
+            "name": "Sprint 13",
+            "state": "active",
+            "startDate": "2024-01-15T00:00:00.000Z",
+            "endDate": "2024-01-28T00:00:00.000Z",
+            "completeDate": None,
+        }
+    ]
+
+
+def test_every_sprint_is_kept_in_order():
+    assert [sprint["id"] for sprint in parse_sprints([LEGACY_SPRINT, SPRINT])] == [12, 13]
+    assert parse_sprints(None) == []
+    assert parse_sprints([]) == []
+
+
+def test_format_sprint_field():
+    assert format_sprint_field([LEGACY_SPRINT, SPRINT]) == "Sprint 12 (closed), Sprint 13 (active)"
+    assert format_sprint_field(None) == "No sprint information"
@@ -0,0 +1,154 @@
+import json
+
+import pytest
+from src.scraper.issue_store import IssueStore
+
+
+def make_issue(key, created, updated):
+    return {"key": key, "fields": {"created": f"{created}T10:00:00", "updated": f"{updated}T10:00:00"}}
+
+
+@pytest.fixture
+def store(tmp_path):
+    return IssueStore(tmp_path / "PROJ_issues")
+
+
+def read_index(store, field):
+    return json.loads(store._index_path(field).read_text())
+
+
+def lookup_keys(store, field, dates):
+    cached, missing = store.lookup(field, dates)
+    return {date: [issue["key"] for issue in issues] for date, issues in cached.items()}, missing
+
+
+def test_issues_are_stored_once_in_their_created_month(store):
+    store.save(
+        {"2024-06-02": [make_issue("P-1", "2024-05-01", "2024-06-02")]}, "updated"
+    )
+
+    assert json.loads(store.month_path("2024/may").read_text()).keys() == {"P-1"}
+    assert not store.month_path("2024/june").exists()
+    assert read_index(store, "updated") == {"2024-06-02": {"P-1": "2024/may"}}
+
+
+def test_lookup_reports_dates_never_fetched(store):
+    store.save({"2024-05-01": [make_issue("P-1", "2024-05-01", "2024-05-01")]}, "created")
+
+    assert lookup_keys(store, "created", ["2024-05-01", "2024-05-02"]) == (
+        {"2024-05-01": ["P-1"]},
+        {"2024-05-02"},
+    )
+    # Fetched on created, the updated index knows nothing yet
+    assert lookup_keys(store, "updated", ["2024-05-01"]) == ({}, {"2024-05-01"})
+
+
+def test_save_replaces_dates_unless_merging(store):
+    store.save(
+        {"2024-05-01": [make_issue("P-1", "2024-05-01", "2024-05-01")]}, "created"
+    )
+    store.save(
+        {"2024-05-01": [make_issue("P-2", "2024-05-01", "2024-05-01")]}, "created", merge=True
+    )
+    assert lookup_keys(store, "created", ["2024-05-01"])[0] == {"2024-05-01": ["P-1", "P-2"]}
+
+    # A full fetch of the date replaces it, P-1 no longer matched the query
+    store.save(
+        {"2024-05-01": [make_issue("P-3", "2024-05-01", "2024-05-01")]}, "created"
+    )
+    assert lookup_keys(store, "created", ["2024-05-01"])[0] == {"2024-05-01": ["P-3"]}
+
+
+def test_newer_versions_move_between_dates_of_every_index(store):
+    store.save(
+        {
+            "2024-05-01": [make_issue("P-1", "2024-05-01", "2024-05-01")],
+            "2024-05-03": [make_issue("P-2", "2024-05-01", "2024-05-03")],
+        },
+        "updated",
+    )
+    store.save({"2024-05-01": [make_issue("P-1", "2024-05-01", "2024-05-01")]}, "created")
+
+    store.save({"2024-05-03": [make_issue("P-1", "2024-05-01", "2024-05-03")]}, "updated", merge=True)
+
+    assert read_index(store, "updated") == {
+        "2024-05-01": {},
+        "2024-05-03": {"P-2": "2024/may", "P-1": "2024/may"},
+    }
+    # The created index points at the same, newest, copy
+    (issue,) = store.lookup("created", ["2024-05-01"])[0]["2024-05-01"]
+    assert issue["fields"]["updated"].startswith("2024-05-03")
+
+
+def test_older_versions_never_replace_newer_ones(store):
+    store.save({"2024-05-03": [make_issue("P-1", "2024-05-01", "2024-05-03")]}, "updated")
+    store.save({"2024-05-01": [make_issue("P-1", "2024-05-01", "2024-05-01")]}, "created")
+
+    (issue,) = store.lookup("created", ["2024-05-01"])[0]["2024-05-01"]
+    assert issue["fields"]["updated"].startswith("2024-05-03")
+
+
+def test_put_and_record(store):
+    store.save({"2024-05-01": [make_issue("P-1", "2024-05-01", "2024-05-01")]}, "updated")
+
+    homes = store.put([make_issue("P-1", "2024-05-01", "2024-05-02")], index=False)
+    assert homes == {"P-1": "2024/may"}
+    # The index wasn't updated yet, the moved issue is not served for its old date
+    assert lookup_keys(store, "updated", ["2024-05-01"]) == ({"2024-05-01": []}, set())
+
+    store.place(homes)
+    assert read_index(store, "updated") == {"2024-05-01": {}}
+
+    issue = make_issue("P-2", "2024-05-01", "2024-05-02")
+    store.put([issue])
+    assert lookup_keys(store, "updated", ["2024-05-02"])[1] == {"2024-05-02"}
+    store.record({"2024-05-02": [issue]}, "updated")
+    assert lookup_keys(store, "updated", ["2024-05-02"])[0] == {"2024-05-02": ["P-2"]}
+
+
+def test_migrate_legacy_layout(store):
+    legacy = {
+        "2024/may": {
+            "2024-05-01": [make_issue("P-1", "2024-05-01", "2024-05-01")],
+            # Fetched on neither field alone, this date is fetched again when needed
+            "2024-05-09": [
+                make_issue("P-2", "2024-05-02", "2024-05-09"),
+                make_issue("P-3", "2024-05-09", "2024-05-10"),
+            ],
+        },
+        "2024/june": {"2024-06-02": [make_issue("P-1", "2024-05-01", "2024-06-02")]},
+    }
+    for home, month in legacy.items():
+        store.month_path(home).parent.mkdir(parents=True)
+        store.month_path(home).write_text(json.dumps(month))
+
+    assert lookup_keys(store, "created", ["2024-05-01"])[0] == {"2024-05-01": ["P-1"]}
+
+    assert not store.month_path("2024/june").exists()
+    assert json.loads(store.month_path("2024/may").read_text()).keys() == {"P-1", "P-2", "P-3"}
+    assert read_index(store, "updated") == {"2024-06-02": {"P-1": "2024/may"}}
+    assert read_index(store, "created") == {"2024-05-01": {"P-1": "2024/may"}}
+    (issue,) = store.lookup("updated", ["2024-06-02"])[0]["2024-06-02"]
+    assert issue["fields"]["updated"].startswith("2024-06-02")
+
+
+def test_interrupted_migration_runs_again(store, monkeypatch):
+    store.month_path("2024/june").parent.mkdir(parents=True)
+    store.month_path("2024/june").write_text(
+        json.dumps({"2024-06-02": [make_issue("P-1", "2024-05-01", "2024-06-02")]})
+    )
+
+    def fail(path):
+        raise OSError("interrupted")
+
+    monkeypatch.setattr("src.scraper.issue_store.os.unlink", fail)
+    with pytest.raises(OSError):
+        store.migrate()
+    monkeypatch.undo()
+
+    # The issue already reached its home, the legacy file is still there
+    assert json.loads(store.month_path("2024/may").read_text()).keys() == {"P-1"}
+    assert store.month_path("2024/june").exists()
+
+    assert lookup_keys(store, "updated", ["2024-06-02"])[0] == {"2024-06-02": ["P-1"]}
+    assert not store.month_path("2024/june").exists()
@@ -0,0 +1,88 @@
+from datetime import datetime
+
+import pytest
+from src.analyzer.jql import JQLError, parse, parse_date, resolve_date_function
+
+
+def test_parse_combines_conditions_with_precedence():
+    condition, order_by = parse(
+        'project = PROJ AND (status = "In Progress" OR type IN (Bug, Story)) '
+        "ORDER BY updated DESC, key"
+    )
+
+    assert condition == (
+        "and",
+        [
+            ("in", "project", ["PROJ"], False),
+            (
+                "or",
+                [
+                    ("in", "status", ["In Progress"], False),
+                    ("in", "issuetype", ["Bug", "Story"], False),
+                ],
+            ),
+        ],
+    )
+    assert order_by == [("updated", True), ("key", False)]
+
+
+def test_parse_negations_and_empty():
+    condition, order_by = parse("assignee IS EMPTY OR NOT status NOT IN (Done) OR priority != EMPTY")
+
+    assert condition == (
+        "or",
+        [
+            ("empty", "assignee", False),
+            ("not", ("in", "status", ["Done"], True)),
+            ("empty", "priority", True),
+        ],
+    )
+    assert order_by == []
+
+
+def test_parse_order_by_only():
+    assert parse("ORDER BY priority DESC") == (None, [("priority", True)])
+
+
+def test_parse_dates():
+    condition, _ = parse("created >= 2024-05-01 AND updated < startOfMonth()")
+
+    (_, [created, updated]) = condition
+    assert created[:3] == ("compare", "created", ">=")
+    assert created[3] == datetime(2024, 5, 1).astimezone()
+    assert updated[:3] == ("compare", "updated", "<")
+    assert updated[3].day == 1 and updated[3].hour == 0
+
+
+@pytest.mark.parametrize(
+    "jql",
+    [
+        "summary = foo",
+        "status > Done",
+        "status = startOfDay()",
+        "created = yesterday",
+        "status = Done AND",
+        "status IN (Done",
+        "ORDER BY summary",
+        "status = Done ORDER BY key extra",
+    ],
+)
+def test_parse_rejects_unsupported_queries(jql):
+    with pytest.raises(JQLError):
+        parse(jql)
+
+
+def test_parse_date_formats():
+    assert parse_date("2024/05/01 13:30") == datetime(2024, 5, 1, 13, 30).astimezone()
+    assert abs((datetime.now().astimezone() - parse_date("-2d")).days - 2) <= 1
+
+
+def test_date_functions():
+    start = resolve_date_function("startOfYear", "-1y")
+    end = resolve_date_function("endOfYear", "-1y")
+
+    assert (start.year, start.month, start.day, start.hour) == (end.year, 1, 1, 0)
+    assert (end.month, end.day, end.hour, end.minute) == (12, 31, 23, 59)
+    assert start.year == datetime.now().year - 1
+    # Jira weeks start on Sunday
+    assert resolve_date_function("startOfWeek").weekday() == 6
@@ -0,0 +1,83 @@
+import pytest
+
+np = pytest.importorskip("numpy")
+pd = pytest.importorskip("pandas")
+
+from src.visualizer.large_data import (  # noqa: E402
+    downsample_series,
+    is_large,
+    lttb_indices,
+    scatter_options,
+)
+
+
+def test_short_series_are_kept_whole():
+    assert list(lttb_indices([0, 1, 2], [5, 6, 7], 10)) == [0, 1, 2]
+    assert list(lttb_indices([0, 1, 2, 3], [5, 6, 7, 8], 2)) == [0, 1, 2, 3]
+
+
+def test_one_point_per_bucket_between_the_ends():
+    n, threshold = 1000, 50
+    rng = np.random.default_rng(0)
+    indices = lttb_indices(np.arange(n), rng.normal(size=n), threshold)
+
+    assert len(indices) == threshold
+    assert indices[0] == 0 and indices[-1] == n - 1
+    bucket_size = (n - 2) / (threshold - 2)
+    for bucket, index in enumerate(indices[1:-1]):
+        assert int(bucket * bucket_size) + 1 <= index < int((bucket + 1) * bucket_size) + 1
+
+
+def test_peaks_and_troughs_are_kept():
+    y = np.zeros(101)
+    y[20] = -40
+    y[50] = 100
+
+    indices = lttb_indices(np.arange(101), y, 10)
+
+    assert 20 in indices
+    assert 50 in indices
+
+
+def test_uneven_x_values():
+    x = np.cumsum(np.arange(1, 201))
+    y = np.sin(np.arange(200))
+
+    indices = lttb_indices(x, y, 20)
+
+    assert len(indices) == 20
+    assert (np.diff(indices) > 0).all()
+
+
+def test_downsample_small_series_is_a_no_op():
+    series = pd.Series([1, 2, 3])
+
+    assert downsample_series(series, threshold=10) is series
+
+
+def test_downsample_date_indexed_series():
+    dates = pd.date_range("2024-01-01", periods=365, freq="D")
+    series = pd.Series(np.arange(365) % 7, index=dates.strftime("%Y-%m-%d"))
+
+    sampled = downsample_series(series, threshold=30)
+
+    assert len(sampled) == 30
+    assert sampled.index[0] == "2024-01-01"
+    assert sampled.index[-1] == "2024-12-30"
+    assert (sampled == series.loc[sampled.index]).all()
+
+
+def test_downsample_numeric_indexed_series():
+    series = pd.Series(np.arange(100.0), index=np.arange(100) * 2)
+
+    sampled = downsample_series(series, threshold=10)
+
+    assert len(sampled) == 10
+    assert sampled.index[0] == 0 and sampled.index[-1] == 198
+
+
+def test_large_data_switches():
+    assert not is_large(10, threshold=10)
+    assert is_large(11, threshold=10)
+    assert scatter_options(11, ["Key"], threshold=10) == {"render_mode": "webgl", "hover_data": None}
+    assert scatter_options(10, ["Key"], threshold=10) == {"hover_data": ["Key"]}
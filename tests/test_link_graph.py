@@ -0,0 +1,190 @@
+import io
+import json
+
+import pytest
+
+np = pytest.importorskip("numpy")
+pd = pytest.importorskip("pandas")
+
+from src.analyzer.link_graph import (  # noqa: E402
+    BLOCKS,
+    EPIC,
+    HIERARCHY_KINDS,
+    PARENT,
+    LinkGraph,
+    frame_edges,
+    issue_edges,
+    issue_link_report,
+    link_edges,
+)
+from src.scraper.issue_model import Issue  # noqa: E402
+
+# A blocks B, B and D block C. Stories S1 and S2 are under epic E1, S1 through
+# its parent and S2 through the Epic Link field, sub-task T1 is under S1.
+EDGES = [
+    ("A", "B", BLOCKS),
+    ("B", "C", BLOCKS),
+    ("D", "C", BLOCKS),
+    ("S1", "E1", PARENT),
+    ("S2", "E1", EPIC),
+    ("T1", "S1", PARENT),
+]
+
+
+@pytest.fixture
+def graph():
+    return LinkGraph(EDGES + [("A", "B", BLOCKS)], keys=["X"])
+
+
+def test_keys_and_duplicate_edges(graph):
+    assert list(graph.keys) == ["A", "B", "C", "D", "E1", "S1", "S2", "T1", "X"]
+    assert len(graph) == 9
+    assert len(graph.sources) == len(EDGES)
+
+
+def test_neighbors(graph):
+    assert graph.neighbors("T1", HIERARCHY_KINDS) == ["S1"]
+    assert graph.neighbors("C", [BLOCKS], reverse=True) == ["B", "D"]
+    assert graph.neighbors("C") == []
+    assert graph.neighbors("X") == []
+    assert graph.neighbors("UNKNOWN") == []
+
+
+def test_blocker_chain_is_breadth_first(graph):
+    assert graph.blocker_chain("C") == [("B", 1), ("D", 1), ("A", 2)]
+    assert graph.blocker_chain("A") == []
+    assert graph.blocker_chain("UNKNOWN") == []
+
+
+def test_blocker_chain_survives_cycles():
+    graph = LinkGraph([("A", "B", BLOCKS), ("B", "C", BLOCKS), ("C", "A", BLOCKS)])
+
+    assert graph.blocker_chain("A") == [("C", 1), ("B", 2)]
+
+
+def test_blocked_by_count(graph):
+    assert graph.blocked_by_count().to_dict() == {"B": 1, "C": 3}
+
+
+def test_epic_rollup_and_roots(graph):
+    assert graph.epic_rollup("E1") == ["S1", "S2", "T1"]
+    assert graph.epic_rollup("S1") == ["T1"]
+    assert graph.hierarchy_roots() == ["E1"]
+
+
+def test_components(graph):
+    labels = dict(zip(graph.keys, graph.components()))
+
+    assert labels["A"] == labels["B"] == labels["C"] == labels["D"]
+    assert labels["E1"] == labels["S1"] == labels["S2"] == labels["T1"]
+    assert len({labels["A"], labels["E1"], labels["X"]}) == 3
+    assert list(graph.component_sizes()) == [4, 4]
+
+
+def test_components_of_a_long_chain():
+    keys = [f"K-{index:03d}" for index in range(100)]
+    graph = LinkGraph(zip(keys[1:], keys[:-1], [BLOCKS] * 99))
+
+    assert set(graph.components()) == {0}
+
+
+def test_most_depended_on(graph):
+    assert graph.most_depended_on(limit=2).to_dict() == {"E1": 2, "A": 1}
+    assert set(graph.most_depended_on().index) == {"E1", "A", "B", "D", "S1"}
+
+
+def test_empty_graph():
+    graph = LinkGraph([], keys=["A"])
+
+    assert list(graph.components()) == [0]
+    assert list(graph.component_sizes()) == []
+    assert graph.blocked_by_count().empty
+    assert graph.most_depended_on().empty
+    assert graph.hierarchy_roots() == []
+
+
+def test_issue_link_report(graph):
+    assert issue_link_report(graph, "C") == {
+        "key": "C",
+        "parent": [],
+        "blocked_by": [
+            {"key": "B", "distance": 1},
+            {"key": "D", "distance": 1},
+            {"key": "A", "distance": 2},
+        ],
+        "blocks": [],
+        "rollup": [],
+        "cluster_size": 4,
+    }
+    assert issue_link_report(graph, "UNKNOWN")["cluster_size"] == 0
+
+
+def test_link_edges():
+    links = [
+        ("Blocks", "outward", "L-1"),
+        ("Duplicate", "inward", "L-2"),
+        ("Relates", "inward", None),
+    ]
+
+    assert link_edges("K", "P", "E", links) == [
+        ("K", "P", PARENT),
+        ("K", "E", EPIC),
+        ("K", "L-1", BLOCKS),
+        ("L-2", "K", "duplicates"),
+    ]
+    # An epic that is also the parent is a single edge
+    assert link_edges("K", "P", "P") == [("K", "P", PARENT)]
+
+
+def test_issue_edges():
+    raw = {
+        "key": "S1",
+        "fields": {
+            "parent": {"key": "E1", "fields": {"summary": "Epic"}},
+            "customfield_10014": "E2",
+            "issuelinks": [
+                {"type": {"name": "Blocks"}, "outwardIssue": {"key": "S2"}},
+                {"type": {"name": "Cloners"}, "inwardIssue": {"key": "S3"}},
+            ],
+        },
+    }
+    expected = [
+        ("S1", "E1", PARENT),
+        ("S1", "E2", EPIC),
+        ("S1", "S2", BLOCKS),
+        ("S3", "S1", "clones"),
+    ]
+
+    assert issue_edges(raw, "customfield_10014") == expected
+    assert issue_edges(Issue(raw), "customfield_10014") == expected
+    assert issue_edges(raw) == [edge for edge in expected if edge[2] != EPIC]
+
+
+def test_frame_edges():
+    data = pd.DataFrame(
+        {
+            "Issue Key": ["S1", "T1"],
+            "Parent Ticket": [None, "S1 - Login story"],
+            "Epic Link": ["E1", None],
+            "Linked Issues": [
+                json.dumps([{"type": "Blocks", "direction": "outward", "key": "S2"}]),
+                None,
+            ],
+        }
+    )
+
+    assert frame_edges(data) == [("S1", "E1", EPIC), ("S1", "S2", BLOCKS), ("T1", "S1", PARENT)]
+    # CSVs converted before Linked Issues existed
+    assert frame_edges(data.drop(columns=["Linked Issues"])) == [
+        ("S1", "E1", EPIC),
+        ("T1", "S1", PARENT),
+    ]
+
+
+def test_frame_edges_of_a_csv_with_blank_cells():
+    data = pd.read_csv(
+        io.StringIO("Issue Key,Parent Ticket,Epic Link\nE1,,\nS1,,E1\nT1,S1 - Login story,\n")
+    )
+
+    assert frame_edges(data) == [("S1", "E1", EPIC), ("T1", "S1", PARENT)]
+    assert list(LinkGraph(frame_edges(data), data["Issue Key"]).keys) == ["E1", "S1", "T1"]
@@ -0,0 +1,54 @@
+import json
+import threading
+
+from src.scraper.metrics import Metrics
+
+
+def make_metrics():
+    metrics = Metrics()
+    metrics.observe_request("search", 0.3, 2048, 200)
+    metrics.record_cache_lookup("PROJ_issues", "2024-05-01", True)
+    return metrics
+
+
+def without_times(data):
+    return {key: value for key, value in data.items() if key not in ("started", "wall_seconds")}
+
+
+def test_write_json_and_prometheus(tmp_path):
+    metrics = make_metrics()
+
+    metrics.write_json(str(tmp_path / "out" / "metrics.json"))
+    metrics.write_prometheus(str(tmp_path / "out" / "jira.prom"))
+
+    written = json.loads((tmp_path / "out" / "metrics.json").read_text())
+    assert without_times(written) == without_times(metrics.to_dict())
+    assert "jira_analysis_run_duration_seconds" in (tmp_path / "out" / "jira.prom").read_text()
+    assert sorted(path.name for path in (tmp_path / "out").iterdir()) == [
+        "jira.prom",
+        "metrics.json",
+    ]
+
+
+def test_concurrent_runs_writing_the_same_path(tmp_path):
+    path = str(tmp_path / "metrics.json")
+    errors = []
+
+    def write(metrics):
+        try:
+            for _ in range(50):
+                metrics.write_json(path)
+        except Exception as error:  # pragma: no cover, reported below
+            errors.append(error)
+
+    runs = [make_metrics() for _ in range(4)]
+    threads = [threading.Thread(target=write, args=(metrics,)) for metrics in runs]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert errors == []
+    written = json.loads((tmp_path / "metrics.json").read_text())
+    assert without_times(written) == without_times(runs[0].to_dict())
+    assert [path.name for path in tmp_path.iterdir()] == ["metrics.json"]
@@ -0,0 +1,74 @@
+from src.scraper.page_sizer import PageSizer
+
+MB = 1024 * 1024
+
+
+def test_fast_small_pages_grow_by_half():
+    sizer = PageSizer()
+
+    sizer.observe(100, 100, seconds=1.0, payload_bytes=MB)
+
+    assert sizer.size == 150
+
+
+def test_pages_near_the_target_keep_their_size():
+    sizer = PageSizer()
+
+    sizer.observe(100, 100, seconds=4.0, payload_bytes=MB)
+
+    assert sizer.size == 100
+
+
+def test_slow_pages_shrink_in_proportion():
+    sizer = PageSizer()
+
+    sizer.observe(100, 100, seconds=10.0, payload_bytes=MB)
+
+    assert sizer.size == 50
+
+
+def test_big_pages_shrink_in_proportion():
+    sizer = PageSizer()
+
+    sizer.observe(100, 100, seconds=1.0, payload_bytes=32 * MB)
+
+    assert sizer.size == 25
+
+
+def test_short_last_page_is_ignored():
+    sizer = PageSizer()
+
+    sizer.observe(100, 7, seconds=30.0, payload_bytes=MB)
+
+    assert sizer.size == 100
+
+
+def test_size_stays_within_bounds():
+    sizer = PageSizer(initial=800, maximum=1000)
+    sizer.observe(800, 800, seconds=0.1, payload_bytes=MB)
+    assert sizer.size == 1000
+
+    sizer = PageSizer(initial=20, minimum=10)
+    sizer.observe(20, 20, seconds=100.0, payload_bytes=MB)
+    assert sizer.size == 10
+
+
+def test_server_cap_lowers_the_maximum():
+    sizer = PageSizer(initial=200)
+
+    sizer.observe(200, 50, seconds=0.1, payload_bytes=MB, server_max=50)
+    assert sizer.size == 50
+
+    sizer.observe(50, 50, seconds=0.1, payload_bytes=MB)
+    assert sizer.size == 50
+
+
+def test_timeouts_halve_until_the_minimum():
+    sizer = PageSizer(initial=40, minimum=10)
+
+    assert sizer.shrink_after_timeout()
+    assert sizer.size == 20
+    assert sizer.shrink_after_timeout()
+    assert sizer.size == 10
+    assert not sizer.shrink_after_timeout()
+    assert sizer.size == 10
@@ -0,0 +1,89 @@
+import json
+
+import pytest
+from src.analyzer.query import QueryIndex, run_query
+
+
+def make_issue(key, created, updated=None, status="To Do", assignee=None, priority=None):
+    fields = {
+        "created": f"{created}T10:00:00.000+0000",
+        "updated": f"{updated or created}T10:00:00.000+0000",
+        "status": {"name": status},
+        "issuetype": {"name": "Bug"},
+        "assignee": {"accountId": f"id-{assignee}", "displayName": assignee} if assignee else None,
+        "priority": {"id": str(priority[0]), "name": priority[1]} if priority else None,
+    }
+    return {"key": key, "fields": fields}
+
+
+@pytest.fixture
+def cache(tmp_path, monkeypatch):
+    """Write month files of project PROJ in a temporary working directory"""
+    monkeypatch.chdir(tmp_path)
+
+    def write(home, issues):
+        path = tmp_path / "raw_data" / "PROJ_issues" / home / "issues.json"
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text(json.dumps({issue["key"]: issue for issue in issues}))
+
+    return write
+
+
+def keys(jql, limit=None):
+    issues, _ = run_query("PROJ", jql, limit)
+    return [issue["key"] for issue in issues]
+
+
+def test_filters_and_default_order(cache):
+    cache(
+        "2024/may",
+        [
+            make_issue("PROJ-1", "2024-05-01", status="Done", assignee="Jane Smith"),
+            make_issue("PROJ-2", "2024-05-03", assignee="John Doe"),
+            make_issue("PROJ-3", "2024-05-02", assignee="Jane Smith"),
+        ],
+    )
+
+    # Values match case-insensitively, the newest created issue comes first
+    assert keys('assignee = "jane smith"') == ["PROJ-3", "PROJ-1"]
+    assert keys('assignee = "id-John Doe"') == ["PROJ-2"]
+    assert keys("status NOT IN (done)") == ["PROJ-2", "PROJ-3"]
+    assert keys("assignee IS EMPTY") == []
+    assert keys("created >= 2024-05-02 AND created < 2024-05-03") == ["PROJ-3"]
+    assert keys("ORDER BY key DESC", limit=2) == ["PROJ-3", "PROJ-2"]
+
+
+def test_key_order_is_numeric(cache):
+    cache("2024/may", [make_issue(f"PROJ-{n}", "2024-05-01") for n in (10, 9, 100)])
+
+    assert keys("ORDER BY key") == ["PROJ-9", "PROJ-10", "PROJ-100"]
+
+
+def test_priority_desc_lists_the_most_urgent_first(cache):
+    cache(
+        "2024/may",
+        [
+            make_issue("PROJ-1", "2024-05-01", priority=(3, "Medium")),
+            make_issue("PROJ-2", "2024-05-01", priority=(1, "Highest")),
+            make_issue("PROJ-3", "2024-05-01"),
+            make_issue("PROJ-4", "2024-05-01", priority=(5, "Lowest")),
+        ],
+    )
+
+    # Issues without a priority come last in either direction
+    assert keys("ORDER BY priority DESC") == ["PROJ-2", "PROJ-1", "PROJ-4", "PROJ-3"]
+    assert keys("ORDER BY priority ASC") == ["PROJ-4", "PROJ-1", "PROJ-2", "PROJ-3"]
+
+
+def test_refresh_only_reindexes_changed_month_files(cache):
+    cache("2024/may", [make_issue("PROJ-1", "2024-05-01")])
+    cache("2024/june", [make_issue("PROJ-2", "2024-06-01")])
+
+    assert QueryIndex("PROJ").refresh() == 2
+    assert QueryIndex("PROJ").refresh() == 0
+
+    cache("2024/june", [make_issue("PROJ-2", "2024-06-01", status="Done")])
+    index = QueryIndex("PROJ")
+    assert index.refresh() == 1
+    issues, total = index.execute("status = Done")
+    assert total == 1 and issues[0]["fields"]["status"]["name"] == "Done"
@@ -0,0 +1,60 @@
+import pytest
+
+pytest.importorskip("pandas")
+pytest.importorskip("streamlit")
+
+from streamlit.testing.v1 import AppTest  # noqa: E402
+
+
+def two_reports(prefixes):
+    from src.visualizer.comment_stats import render_comment_stats
+    from src.visualizer.ticket_rankings import render_ticket_rankings
+
+    def records(column):
+        return [
+            {"Issue Key": f"PROJ-{rank}", "Priority": "High", column: 200 - rank}
+            for rank in range(120)
+        ]
+
+    for prefix in prefixes:
+        render_comment_stats(
+            {
+                "most_commented": records("Comment count"),
+                "avg_comments": 1.5,
+                "total_comments": 180,
+                "tickets_without_comments": 0,
+                "tickets_with_comments": 120,
+            },
+            {},
+            prefix,
+        )
+        render_ticket_rankings(
+            {"longest_open": records("Days Open"), "most_reopened": records("Times Reopened")},
+            {},
+            prefix,
+        )
+
+
+def test_two_reports_on_one_page():
+    app = AppTest.from_function(two_reports, args=(["2023.csv", "2024.csv"],)).run()
+
+    assert not app.exception
+    assert sorted(number_input.key for number_input in app.number_input) == [
+        "2023.csv:Longest Open Tickets",
+        "2023.csv:Most Commented Tickets",
+        "2023.csv:Most Reopened Tickets",
+        "2024.csv:Longest Open Tickets",
+        "2024.csv:Most Commented Tickets",
+        "2024.csv:Most Reopened Tickets",
+    ]
+
+
+def test_reports_page_independently():
+    app = AppTest.from_function(two_reports, args=(["2023.csv", "2024.csv"],)).run()
+
+    app.number_input(key="2023.csv:Most Commented Tickets").set_value(2).run()
+
+    assert not app.exception
+    first, _, _, second, _, _ = app.dataframe
+    assert first.value["Rank"].iloc[0] == 51
+    assert second.value["Rank"].iloc[0] == 1
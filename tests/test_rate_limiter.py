@@ -0,0 +1,149 @@
+from types import SimpleNamespace
+
+import pytest
+from src.scraper import rate_limiter
+from src.scraper.rate_limiter import RateLimiter, RateLimitPolicy
+
+
+class FakeClock:
+    """Stands in for the time module, sleeping only advances the clock"""
+
+    def __init__(self):
+        self.now = 1000.0
+        self.slept = []
+
+    def monotonic(self):
+        return self.now
+
+    def time(self):
+        return self.now
+
+    def sleep(self, seconds):
+        self.slept.append(seconds)
+        self.now += seconds
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    clock = FakeClock()
+    monkeypatch.setattr(rate_limiter, "time", clock)
+    monkeypatch.setattr(rate_limiter.random, "uniform", lambda low, high: 0.0)
+    return clock
+
+
+def make_limiter(requests_per_second=10.0, burst=20.0):
+    return RateLimiter(RateLimitPolicy(requests_per_second=requests_per_second, burst=burst))
+
+
+def make_response(status_code=200, **headers):
+    return SimpleNamespace(status_code=status_code, headers=headers)
+
+
+def test_burst_is_spent_without_waiting(clock):
+    limiter = make_limiter()
+
+    for _ in range(4):
+        limiter.acquire("search")
+
+    assert clock.slept == []
+    assert limiter.tokens == 0
+
+
+def test_acquire_waits_for_the_missing_tokens(clock):
+    limiter = make_limiter()
+    for _ in range(4):
+        limiter.acquire("search")
+
+    limiter.acquire("search")
+
+    assert clock.slept == [pytest.approx(0.5)]
+
+
+def test_unknown_endpoints_cost_one_token(clock):
+    limiter = make_limiter(burst=2.0)
+
+    limiter.acquire("something")
+    limiter.acquire("field")
+
+    assert clock.slept == []
+    assert limiter.policy.cost("something") == 1.0
+
+
+def test_cost_is_capped_at_the_burst(clock):
+    limiter = make_limiter(burst=2.0)
+
+    limiter.acquire("search")
+
+    assert clock.slept == []
+
+
+def test_throttling_halves_the_rate_and_pauses(clock):
+    limiter = make_limiter()
+
+    delay = limiter.observe(make_response(429, **{"Retry-After": "3"}))
+
+    assert delay == 3.0
+    assert limiter.rate == 5.0
+    limiter.acquire("field")
+    assert clock.slept[0] == pytest.approx(3.0)
+
+
+def test_throttling_without_retry_after_backs_off_exponentially(clock):
+    limiter = make_limiter()
+
+    assert limiter.observe(make_response(429), attempt=3) == 8.0
+    assert limiter.observe(make_response(429), attempt=10) == 60.0
+
+
+def test_503_is_only_throttling_with_retry_after(clock):
+    limiter = make_limiter()
+
+    assert limiter.observe(make_response(503)) == 0.0
+    assert limiter.rate == 10.0
+    assert limiter.observe(make_response(503, **{"Retry-After": "1"})) == 1.0
+
+
+def test_rate_recovers_towards_the_policy_rate(clock):
+    limiter = make_limiter()
+    limiter.observe(make_response(429, **{"Retry-After": "0"}))
+
+    limiter.observe(make_response())
+    assert limiter.rate == 6.0
+    for _ in range(10):
+        limiter.observe(make_response())
+    assert limiter.rate == 10.0
+
+
+def test_rate_never_drops_below_the_floor(clock):
+    limiter = make_limiter(requests_per_second=1.0)
+
+    for _ in range(5):
+        limiter.observe(make_response(429, **{"Retry-After": "0"}))
+
+    assert limiter.rate == 0.5
+
+
+def test_near_limit_slows_down(clock):
+    limiter = make_limiter()
+
+    limiter.observe(make_response(**{"X-RateLimit-NearLimit": "true"}))
+
+    assert limiter.rate == 7.5
+
+
+def test_rate_is_at_most_what_remains_until_reset(clock, monkeypatch):
+    limiter = make_limiter()
+    monkeypatch.setattr(rate_limiter, "_reset_seconds", lambda value: 10.0)
+
+    limiter.observe(
+        make_response(**{"X-RateLimit-Remaining": "40", "X-RateLimit-Reset": "soon"})
+    )
+
+    assert limiter.rate == 4.0
+
+
+def test_retry_after_formats():
+    assert rate_limiter._retry_after({"Retry-After": "2.5"}) == 2.5
+    assert rate_limiter._retry_after({"Retry-After": "Mon, 01 Jan 2001 00:00:00 GMT"}) == 0.0
+    assert rate_limiter._retry_after({"Retry-After": "later"}) is None
+    assert rate_limiter._retry_after({}) is None
@@ -0,0 +1,85 @@
+import pytest
+
+pd = pytest.importorskip("pandas")
+
+from src.analyzer.sprints import (  # noqa: E402
+    load_sprint_cache,
+    save_sprint_cache,
+    sprint_membership,
+    sprint_stats,
+)
+
+
+def make_sprint(sprint_id, state, start):
+    return {"id": sprint_id, "name": f"Sprint {sprint_id}", "state": state, "startDate": start}
+
+
+SPRINT_1 = make_sprint(1, "closed", "2024-01-01T00:00:00.000Z")
+SPRINT_2 = make_sprint(2, "closed", "2024-01-15T00:00:00.000Z")
+SPRINT_3 = make_sprint(3, "active", "2024-01-29T00:00:00.000Z")
+
+
+@pytest.fixture
+def membership():
+    # P-1 was carried over from sprint 1 and completed in sprint 2, P-3 is
+    # still in progress in sprint 3
+    data = pd.DataFrame(
+        {
+            "Issue Key": ["P-1", "P-2", "P-3"],
+            "Status": ["Done", "Done", "In Progress"],
+            "Story Points": [3, 5, 2],
+            "Sprint History": [[SPRINT_1, SPRINT_2], [SPRINT_1], [SPRINT_2, SPRINT_3]],
+        }
+    )
+    return sprint_membership(data)
+
+
+def test_one_row_per_sprint_of_an_issue(membership):
+    rows = membership[["Issue Key", "id", "Last Sprint"]].values.tolist()
+
+    assert rows == [
+        ["P-1", "1", False],
+        ["P-1", "2", True],
+        ["P-2", "1", True],
+        ["P-3", "2", False],
+        ["P-3", "3", True],
+    ]
+
+
+def test_issues_without_sprints():
+    data = pd.DataFrame(
+        {"Issue Key": ["P-1"], "Status": ["Done"], "Sprint History": ["[]"]}
+    )
+
+    assert sprint_membership(data).empty
+    assert sprint_membership(data.drop(columns="Sprint History")).empty
+
+
+def test_committed_completed_and_carried_over(membership):
+    stats = sprint_stats(membership, ["Done"])
+
+    assert list(stats.index) == ["1", "2", "3"]
+    assert stats["Committed Issues"].tolist() == [2, 2, 1]
+    assert stats["Committed Points"].tolist() == [8, 5, 2]
+    assert stats["Completed Issues"].tolist() == [1, 1, 0]
+    assert stats["Completed Points"].tolist() == [5, 3, 0]
+    assert stats["Carried Over"].tolist() == [1, 1, 0]
+    assert stats["Carry-over Rate"].tolist() == [0.5, 0.5, 0.0]
+    assert stats.loc[["1", "2"], "Velocity"].tolist() == [5.0, 4.0]
+    assert pd.isna(stats.loc["3", "Velocity"])
+
+
+def test_closed_sprints_are_reused_from_the_cache(membership, tmp_path):
+    path = tmp_path / "sprint_stats.json"
+    save_sprint_cache(path, sprint_stats(membership, ["Done"]))
+
+    cached = load_sprint_cache(path)
+    assert set(cached) == {"1", "2"}
+
+    # Cached sprints are taken as is, even though P-2 is no longer done
+    membership.loc[membership["Issue Key"] == "P-2", "Status"] = "Reopened"
+    stats = sprint_stats(membership, ["Done"], cached=cached)
+
+    assert list(stats.index) == ["1", "2", "3"]
+    assert stats["Completed Points"].tolist() == [5, 3, 0]
+    assert stats.loc[["1", "2"], "Velocity"].tolist() == [5.0, 4.0]